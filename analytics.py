@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+그래프 분석 - NumPy CSR 인접 행렬과 단어–키워드 동시 출현 행렬
+
+graph.csv 를 한 줄씩 도는 대신 연결 컬럼을 그대로 NumPy 배열로 옮겨서
+차수, 중심성(PageRank), 가장 강한 연결, 연결 요소를 벡터 연산으로 구한다.
+NumPy 는 이 모듈만 쓰는 선택 의존성이다 (requirements.txt, pip install numpy).
+없으면 GraphMatrix 를 만들 때 알려 준다.
+반복 단어 노드('a#2')는 merge / store 처럼 단어('a')로 합쳐서 센다.
+
+    m = GraphMatrix.from_graph(graph)           # MindGraph
+    m = GraphMatrix.from_merged("merged.jsonl")  # merge.py 결과 (count = 가중치)
+    m.degree(); m.centrality(); m.strongest_links(10); m.components()
+    m.cooccurrence().top_keywords("시스템")
+
+    python analytics.py mindmap_*.json
+    python analytics.py merged.jsonl --top 20
+"""
+import argparse
+import json
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # 선택 의존성
+    np = None
+
+import compressed
+from loader import open_reader
+from pairing import base_word
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("analytics 는 NumPy 가 필요합니다: pip install numpy")
+
+
+def _csr(rows, cols, weights, n_rows: int, n_cols: int):
+    """(row, col) 중복을 가중치 합으로 합친 CSR - (indptr, indices, data)"""
+    keys = rows.astype(np.int64) * n_cols + cols
+    keys, inverse = np.unique(keys, return_inverse=True)
+    data = np.bincount(inverse, weights=weights, minlength=len(keys))
+    rows, indices = np.divmod(keys, n_cols)
+    indptr = np.zeros(n_rows + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n_rows), out=indptr[1:])
+    return indptr, indices, data
+
+
+class GraphMatrix:
+    """단어 노드의 가중 인접 행렬 (CSR) - 같은 (부모, 자식) 연결은 가중치로 합친다"""
+
+    def __init__(self, words, rows, cols, weights, keyword_rows=None, keyword_ids=None,
+                 keywords=None):
+        _require_numpy()
+        self.words = list(words)
+        self.index = {word: i for i, word in enumerate(self.words)}
+        n = len(self.words)
+        self.indptr, self.indices, self.data = _csr(
+            np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64),
+            np.asarray(weights, dtype=np.float64), n, n,
+        )
+        # 동시 출현 행렬 재료 - (단어 행, 키워드 열) 쌍
+        self._keyword_rows = keyword_rows
+        self._keyword_ids = keyword_ids
+        self.keywords = keywords
+
+    # ------------------------------------------------------------------
+    # 생성
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_graph(cls, graph, thoughts_only: bool = False):
+        """MindGraph 에서 생성 - 컬럼을 복사 없이 NumPy 로 본다
+
+        thoughts_only: 건너뛴(생각 없는) 연결은 빼기
+        """
+        _require_numpy()
+        strings, _, _, src, dst, thoughts, kw_ids, kw_offsets = graph.columns()
+        src = np.frombuffer(src, dtype='l') if len(src) else np.zeros(0, dtype=np.int64)
+        dst = np.frombuffer(dst, dtype='l') if len(dst) else np.zeros(0, dtype=np.int64)
+        kw_ids = np.frombuffer(kw_ids, dtype='l') if len(kw_ids) else np.zeros(0, dtype=np.int64)
+        kw_counts = np.diff(np.frombuffer(kw_offsets, dtype='l'))
+
+        if thoughts_only:
+            keep = np.fromiter((bool(t) for t in thoughts), dtype=bool, count=len(thoughts))
+        else:
+            keep = np.ones(len(src), dtype=bool)
+
+        # 문자열 ID (단어 + 키워드 공용) → 단어 번호 ('a#2' 와 'a' 는 같은 번호)
+        word_numbers = {}
+        canonical = np.fromiter(
+            (word_numbers.setdefault(base_word(s), len(word_numbers)) for s in strings),
+            dtype=np.int64, count=len(strings))
+        all_words = list(word_numbers)
+        src, dst = canonical[src], canonical[dst]
+
+        # 단어 번호 → 노드 번호
+        parents = graph.parents()
+        node_ids, inverse = np.unique(
+            np.concatenate([src[keep], dst[keep],
+                            canonical[np.fromiter((graph.node_id(p) for p in parents),
+                                                  dtype=np.int64, count=len(parents))]]),
+            return_inverse=True,
+        )
+        n_edges = int(keep.sum())
+        rows, cols = inverse[:n_edges], inverse[n_edges:2 * n_edges]
+        words = [all_words[i] for i in node_ids]
+
+        # 연결의 키워드를 부모/자식 단어 양쪽에 센다
+        edge_of_kw = np.repeat(np.arange(len(src)), kw_counts)
+        kw_keep = keep[edge_of_kw]
+        edge_of_kw, kw = edge_of_kw[kw_keep], kw_ids[kw_keep]
+        keyword_ids, kw_cols = np.unique(kw, return_inverse=True)
+        word_pos = np.searchsorted(node_ids, np.concatenate([src[edge_of_kw], dst[edge_of_kw]]))
+        keywords = [strings[i] for i in keyword_ids]
+
+        return cls(words, rows, cols, np.ones(n_edges),
+                   keyword_rows=word_pos, keyword_ids=np.concatenate([kw_cols, kw_cols]),
+                   keywords=keywords)
+
+    @classmethod
+    def from_edges(cls, edges):
+        """(parent, child, weight[, keywords]) 스트림에서 생성 - 합친 맵처럼 큰 입력용"""
+        _require_numpy()
+        index = {}
+        keyword_index = {}
+        rows, cols, weights = [], [], []
+        keyword_rows, keyword_cols = [], []
+        for item in edges:
+            parent, child, weight = item[:3]
+            r = index.setdefault(parent, len(index))
+            c = index.setdefault(child, len(index))
+            rows.append(r)
+            cols.append(c)
+            weights.append(weight)
+            for kw in (item[3] if len(item) > 3 else ()):
+                k = keyword_index.setdefault(kw, len(keyword_index))
+                keyword_rows.extend((r, c))
+                keyword_cols.extend((k, k))
+        return cls(list(index), rows, cols, weights,
+                   keyword_rows=np.asarray(keyword_rows, dtype=np.int64),
+                   keyword_ids=np.asarray(keyword_cols, dtype=np.int64),
+                   keywords=list(keyword_index))
+
+    @classmethod
+    def from_merged(cls, path: str):
+        """merge.py 의 JSON Lines (count 를 가중치로, 생각의 키워드를 동시 출현으로)"""
+        def edges():
+            with compressed.open_read(path) as f:
+                for line in f:
+                    record = json.loads(line)
+                    keywords = [kw for t in record['thoughts'] for kw in t['keywords']]
+                    yield record['from'], record['to'], record['count'], keywords
+        return cls.from_edges(edges())
+
+    # ------------------------------------------------------------------
+    # 분석
+    # ------------------------------------------------------------------
+    def __len__(self):
+        """노드 수"""
+        return len(self.words)
+
+    @property
+    def rows(self):
+        """CSR 의 각 항목이 속한 행 번호"""
+        return np.repeat(np.arange(len(self.words)), np.diff(self.indptr))
+
+    def degree(self, weighted: bool = True):
+        """(나가는 차수, 들어오는 차수) 배열"""
+        n = len(self.words)
+        weights = self.data if weighted else None
+        out_degree = np.bincount(self.rows, weights=weights, minlength=n)
+        in_degree = np.bincount(self.indices, weights=weights, minlength=n)
+        return out_degree, in_degree
+
+    def centrality(self, damping: float = 0.85, iterations: int = 100, tol: float = 1e-9):
+        """가중 PageRank - 나가는 연결이 없는 노드의 점수는 고르게 나눈다"""
+        n = len(self.words)
+        if n == 0:
+            return np.zeros(0)
+        rows = self.rows
+        out_weight = np.bincount(rows, weights=self.data, minlength=n)
+        dangling = out_weight == 0
+        share = self.data / out_weight[rows]
+
+        rank = np.full(n, 1.0 / n)
+        for _ in range(iterations):
+            spread = np.bincount(self.indices, weights=share * rank[rows], minlength=n)
+            new_rank = (1 - damping) / n + damping * (spread + rank[dangling].sum() / n)
+            if np.abs(new_rank - rank).sum() < tol:
+                return new_rank
+            rank = new_rank
+        return rank
+
+    def strongest_links(self, k: int = 10):
+        """가중치가 큰 연결 k 개 - [(parent, child, weight), ...]"""
+        k = min(k, len(self.data))
+        if k == 0:
+            return []
+        top = np.argpartition(-self.data, k - 1)[:k]
+        top = top[np.argsort(-self.data[top], kind='stable')]
+        rows = self.rows
+        return [(self.words[rows[i]], self.words[self.indices[i]], float(self.data[i]))
+                for i in top]
+
+    def components(self):
+        """약한 연결 요소 - 노드별 요소 번호 (0 부터, 큰 요소가 앞)
+
+        최소 라벨 전파 + 포인터 점프를 벡터 연산으로 반복한다.
+        """
+        n = len(self.words)
+        labels = np.arange(n)
+        rows, cols = self.rows, self.indices
+        while True:
+            smaller = np.minimum(labels[rows], labels[cols])
+            new_labels = labels.copy()
+            np.minimum.at(new_labels, rows, smaller)
+            np.minimum.at(new_labels, cols, smaller)
+            new_labels = new_labels[new_labels]  # 포인터 점프
+            if np.array_equal(new_labels, labels):
+                break
+            labels = new_labels
+
+        roots, labels = np.unique(labels, return_inverse=True)
+        sizes = np.bincount(labels)
+        order = np.argsort(-sizes, kind='stable')
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        return rank[labels]
+
+    def top(self, scores, k: int = 10):
+        """점수가 큰 단어 k 개 - [(word, score), ...]"""
+        k = min(k, len(scores))
+        if k == 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(self.words[i], float(scores[i])) for i in top]
+
+    def cooccurrence(self):
+        """단어 × 키워드 동시 출현 행렬 (CSR)"""
+        return CooccurrenceMatrix(self.words, self.keywords or [],
+                                  self._keyword_rows, self._keyword_ids)
+
+
+class CooccurrenceMatrix:
+    """단어가 양 끝에 있는 연결의 생각에 키워드가 나온 횟수 (CSR)"""
+
+    def __init__(self, words, keywords, rows, cols):
+        self.words = words
+        self.keywords = keywords
+        self.index = {word: i for i, word in enumerate(words)}
+        rows = np.asarray(rows if rows is not None else [], dtype=np.int64)
+        cols = np.asarray(cols if cols is not None else [], dtype=np.int64)
+        self.indptr, self.indices, self.data = _csr(
+            rows, cols, np.ones(len(rows)), len(words), max(len(keywords), 1)
+        )
+
+    def top_keywords(self, word: str, k: int = 10):
+        """word 와 가장 자주 같이 나온 키워드 k 개 - [(keyword, count), ...]"""
+        i = self.index.get(word)
+        if i is None:
+            return []
+        start, end = self.indptr[i], self.indptr[i + 1]
+        counts = self.data[start:end]
+        order = np.argsort(-counts, kind='stable')[:k]
+        return [(self.keywords[self.indices[start + j]], int(counts[j])) for j in order]
+
+    def keyword_totals(self):
+        """키워드별 전체 출현 횟수"""
+        return np.bincount(self.indices, weights=self.data, minlength=len(self.keywords))
+
+
+def load_matrix(paths):
+    """파일들로 GraphMatrix - merge.py 의 .jsonl 이면 가중치 포함, 아니면 맵들을 이어 붙임"""
+    if len(paths) == 1 and paths[0].endswith('.jsonl'):
+        return GraphMatrix.from_merged(paths[0])
+
+    def edges():
+        for path in paths:
+            reader = open_reader(path)
+            try:
+                for top_item in reader.parents():
+                    parent = base_word(top_item[0])
+                    for connection in top_item[1:]:
+                        yield (parent, base_word(connection['child']), 1,
+                               connection.get('keywords', ()))
+            finally:
+                reader.close()
+    return GraphMatrix.from_edges(edges())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="마인드맵 그래프 분석 (NumPy)")
+    parser.add_argument('files', nargs='+', help="mindmap_*.json / .gmb 또는 merge.py 의 .jsonl")
+    parser.add_argument('--top', type=int, default=10, help="출력할 개수 (기본 10)")
+    args = parser.parse_args(argv)
+
+    try:
+        matrix = load_matrix(args.files)
+    except ImportError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    out_degree, in_degree = matrix.degree()
+    components = matrix.components()
+    print(f"노드 {len(matrix)}개, 연결 {len(matrix.data)}개, "
+          f"연결 요소 {components.max() + 1 if len(components) else 0}개")
+
+    print("\n[차수]")
+    for word, score in matrix.top(out_degree + in_degree, args.top):
+        print(f"  {word}\t{score:g}")
+    print("\n[중심성 (PageRank)]")
+    for word, score in matrix.top(matrix.centrality(), args.top):
+        print(f"  {word}\t{score:.4f}")
+    print("\n[가장 강한 연결]")
+    for parent, child, weight in matrix.strongest_links(args.top):
+        print(f"  {parent} → {child}\t{weight:g}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
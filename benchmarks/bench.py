@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+gridmind 벤치마크 - 매핑 / 화면 갱신 / 내보내기 경로의 시간 측정
+
+합성 질문(10 ~ 200 단어)과 생각(0 ~ 500 단어)을 만들어서
+    1. MindMapApp 을 Textual 의 App.run_test 로 화면 없이 띄우고 입력을 흘려 넣는다
+       (start_mapping, process_current, 빈 생각이면 skip_current, undo_last / redo_last, update_tree,
+        update_history_table, action_save_graph)
+    2. 만들어진 그래프로 save_* 내보내기를 하나씩 잰다
+    3. gridmind.py 를 stdin 으로 돌려 CLI 회전 루프를 잰다 (입력 수가 --max-inputs 이하일 때만)
+각 단계는 --repeat 번 재서 중앙값을 JSON 으로 남기고, 기준 파일과 비교한다.
+
+    python benchmarks/bench.py                               # 기본 케이스 → benchmarks/results/latest.json
+    python benchmarks/bench.py --case 50:200 --case 200:500 --repeat 5
+    python benchmarks/bench.py --save-baseline               # 결과를 benchmarks/baseline.json 으로
+    python benchmarks/bench.py --baseline benchmarks/baseline.json --threshold 0.25
+
+기준보다 threshold 이상 느려진 단계가 있으면 종료 코드 1. 같은 --seed 면 같은 입력이 만들어진다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import exporters  # noqa: E402
+from gridmind_textual_v2 import MindMapApp  # noqa: E402
+from mindfile import save_binary  # noqa: E402
+from pairing import PairPlan  # noqa: E402
+from render import save_svg  # noqa: E402
+from tokenizer import split_words  # noqa: E402
+from textual.widgets import Input, TextArea  # noqa: E402
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT = os.path.join(HERE, 'results', 'latest.json')
+DEFAULT_BASELINE = os.path.join(HERE, 'baseline.json')
+DEFAULT_CASES = ['10:0', '10:50', '50:200', '200:500']  # 질문 단어 수:생각 단어 수
+NOISE_FLOOR = 0.001  # 이보다 작은 차이(초)는 회귀로 보지 않는다
+UNDO_STEPS = 20  # 매핑 뒤 되돌렸다 다시 적용하는 명령 수 (히스토리 행 제거 비용 포함)
+
+SYLLABLES = [chr(code) for code in range(ord('가'), ord('힣') + 1, 97)]
+PARTICLES = ['', '', '', '은', '는', '이', '가', '을', '를', '에서', '으로', '이란']
+
+
+# ----------------------------------------------------------------------
+# 합성 입력
+# ----------------------------------------------------------------------
+class Corpus:
+    """seed 로 고정된 단어장에서 질문과 생각을 만든다"""
+
+    def __init__(self, seed: int, vocabulary: int = 5000):
+        self.random = random.Random(seed)
+        self.words = [
+            ''.join(self.random.choice(SYLLABLES) for _ in range(self.random.randint(1, 3)))
+            for _ in range(vocabulary)
+        ]
+
+    def question(self, n_words: int) -> str:
+        return ' '.join(self.random.choice(self.words) for _ in range(n_words))
+
+    def thought(self, n_words: int) -> str:
+        """조사가 붙은 단어 n_words 개 (0 이면 빈 생각 → drive_app 이 skip_current 로 보낸다)"""
+        choice = self.random.choice
+        return ' '.join(choice(self.words) + choice(PARTICLES) for _ in range(n_words))
+
+
+# ----------------------------------------------------------------------
+# 측정
+# ----------------------------------------------------------------------
+class Timings:
+    """단계 이름 → 측정값 목록"""
+
+    def __init__(self):
+        self.samples = {}
+
+    def add(self, name: str, seconds: float):
+        self.samples.setdefault(name, []).append(seconds)
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        yield
+        self.add(name, time.perf_counter() - start)
+
+    def extend(self, name: str, values):
+        """호출 하나하나의 시간 - 평균과 p95 로 요약"""
+        values = sorted(values)
+        if not values:
+            return
+        self.add(f"{name}.mean", statistics.fmean(values))
+        self.add(f"{name}.p95", values[min(len(values) - 1, int(len(values) * 0.95))])
+
+    def summary(self):
+        return {name: statistics.median(values) for name, values in sorted(self.samples.items())}
+
+
+async def drive_app(timings: Timings, question: str, thoughts, pairs: str, work_dir: str):
+    """MindMapApp 을 화면 없이 띄워 입력을 흘려 넣고 단계별 시간을 잰다"""
+    app = MindMapApp(journal_path=os.path.join(work_dir, 'bench.journal'), pairs=pairs)
+    async with app.run_test(size=(160, 50)) as pilot:
+        app.query_one("#question-input", Input).value = question
+        with timings.stage('start_mapping'):
+            app.start_mapping()
+        await pilot.pause()
+
+        text_area = app.query_one("#notes-textarea", TextArea)
+        latencies = {'process_current': [], 'skip_current': []}
+        with timings.stage('mapping'):
+            for thought in thoughts:
+                if app.current_phase != "collecting":
+                    break
+                # 빈 생각은 Skip 버튼처럼 건너뛰기(빈 간선 기록)로 보낸다
+                name = 'process_current' if thought else 'skip_current'
+                command = app.process_current if thought else app.skip_current
+                text_area.text = thought
+                start = time.perf_counter()
+                command()
+                latencies[name].append(time.perf_counter() - start)
+                # 메시지 처리만 돌리고 화면 갱신은 Textual 이 모아서 하게 둔다
+                # (pilot.pause() 는 입력마다 한 프레임을 기다려서 측정이 프레임 주기에 묻힌다)
+                await asyncio.sleep(0)
+            await pilot.pause()
+        for name, values in latencies.items():
+            timings.extend(name, values)
+
+        # 끝에서부터 되돌리고 다시 적용 - 그래프는 매핑 직후 상태로 돌아온다
+        for name, command in (('undo_last', app.undo_last), ('redo_last', app.redo_last)):
+            latencies = []
+            for _ in range(UNDO_STEPS):
+                start = time.perf_counter()
+                command()
+                latencies.append(time.perf_counter() - start)
+                await asyncio.sleep(0)
+            await pilot.pause()
+            timings.extend(name, latencies)
+
+        with timings.stage('update_tree'):
+            app.update_tree()
+        await pilot.pause()
+        with timings.stage('update_history_table'):
+            app.update_history_table()
+        await pilot.pause()
+
+        with timings.stage('action_save_graph'):
+            app.action_save_graph()
+            while app.save_running:
+                await pilot.pause(0.01)
+
+        graph = app.graph.snapshot()
+        app.action_reset()
+    return graph
+
+
+def time_exports(timings: Timings, graph, question: str, work_dir: str):
+    """내보내기 함수 하나씩 (TUI 저장과 같은 함수)"""
+    path = os.path.join(work_dir, 'bench')
+    exports = [
+        ('save_csv_with_thoughts', lambda: exporters.save_csv_with_thoughts(graph, path + '.csv')),
+        ('save_json', lambda: exporters.save_json(graph, question, path + '.json')),
+        ('save_dot_with_thoughts', lambda: exporters.save_dot_with_thoughts(graph, path + '.dot')),
+        ('save_binary', lambda: save_binary(graph, question, path + '.gmb')),
+        ('save_svg', lambda: save_svg(graph, path + '.svg')),
+    ]
+    for name, save in exports:
+        with timings.stage(name):
+            save()
+
+
+def time_cli(timings: Timings, question: str, thoughts, pairs: str, work_dir: str):
+    """gridmind.py 회전 루프 - 질문, 생각들, 저장 안 함(n) 을 stdin 으로"""
+    stdin = '\n'.join([question, *(t.replace('\n', ' ') for t in thoughts), 'n']) + '\n'
+    with timings.stage('cli_rotation'):
+        subprocess.run([sys.executable, os.path.join(ROOT, 'gridmind.py'), '--pairs', pairs],
+                       input=stdin, text=True, encoding='utf-8', cwd=work_dir,
+                       stdout=subprocess.DEVNULL, check=True)
+
+
+def run_case(case: str, args, corpus: Corpus) -> dict:
+    question_words, thought_words = (int(n) for n in case.split(':'))
+    question = corpus.question(question_words)
+    total = PairPlan.from_spec(split_words(question), args.pairs).total
+    n_inputs = min(total, args.max_inputs)
+    thoughts = [corpus.thought(thought_words) for _ in range(n_inputs)]
+
+    timings = Timings()
+    for _ in range(args.repeat):
+        with tempfile.TemporaryDirectory(prefix='gridmind_bench_') as work_dir:
+            cwd = os.getcwd()
+            os.chdir(work_dir)  # action_save_graph 는 현재 디렉터리에 저장
+            try:
+                graph = asyncio.run(drive_app(timings, question, thoughts, args.pairs, work_dir))
+            finally:
+                os.chdir(cwd)
+            time_exports(timings, graph, question, work_dir)
+            if total <= args.max_inputs and not args.no_cli:
+                time_cli(timings, question, thoughts, args.pairs, work_dir)
+
+    return {
+        'question_words': question_words,
+        'thought_words': thought_words,
+        'inputs': n_inputs,
+        'edges': len(graph),
+        'stages': timings.summary(),
+    }
+
+
+# ----------------------------------------------------------------------
+# 기준 비교
+# ----------------------------------------------------------------------
+def compare(results: dict, baseline: dict, threshold: float):
+    """(case, stage, 기준, 현재, 비율, 회귀 여부) 목록"""
+    rows = []
+    for case, result in results['cases'].items():
+        base_case = baseline.get('cases', {}).get(case)
+        if base_case is None:
+            continue
+        for stage, seconds in result['stages'].items():
+            base = base_case['stages'].get(stage)
+            if base is None:
+                continue
+            ratio = seconds / base if base else float('inf')
+            regressed = ratio > 1 + threshold and seconds - base > NOISE_FLOOR
+            rows.append((case, stage, base, seconds, ratio, regressed))
+    return rows
+
+
+def print_results(results: dict, rows):
+    compared = {(case, stage): row for case, stage, *row in rows}
+    for case, result in results['cases'].items():
+        print(f"\n[{case}] 질문 {result['question_words']}단어, 생각 {result['thought_words']}단어"
+              f" - 입력 {result['inputs']}개, 연결 {result['edges']}개")
+        for stage, seconds in result['stages'].items():
+            line = f"  {stage:<28} {seconds * 1000:10.2f} ms"
+            row = compared.get((case, stage))
+            if row is not None:
+                base, _, ratio, regressed = row
+                line += f"   기준 {base * 1000:10.2f} ms  x{ratio:.2f}{'  ← 회귀' if regressed else ''}"
+            print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="gridmind 벤치마크")
+    parser.add_argument('--case', action='append', metavar='Q:T',
+                        help=f"질문 단어 수:생각 단어 수 (여러 번, 기본 {' '.join(DEFAULT_CASES)})")
+    parser.add_argument('--pairs', default='all', help="짝 전략 (pairing.PairPlan.from_spec)")
+    parser.add_argument('--max-inputs', type=int, default=400,
+                        help="케이스당 최대 입력 수 (넘으면 CLI 측정은 건너뜀)")
+    parser.add_argument('--repeat', type=int, default=3, help="반복 횟수 (중앙값 사용)")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--no-cli', action='store_true', help="gridmind.py 측정 건너뛰기")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="결과 JSON")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="비교할 기준 JSON")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="이 비율 이상 느려지면 회귀 (기본 0.25 = 25%%)")
+    parser.add_argument('--save-baseline', action='store_true', help="결과를 기준 파일로도 저장")
+    args = parser.parse_args(argv)
+
+    corpus = Corpus(args.seed)
+    results = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': args.seed,
+            'pairs': args.pairs,
+            'max_inputs': args.max_inputs,
+            'repeat': args.repeat,
+        },
+        'cases': {},
+    }
+    for case in args.case or DEFAULT_CASES:
+        print(f"… {case}", file=sys.stderr)
+        results['cases'][case] = run_case(case, args, corpus)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with exporters.atomic_open(args.output) as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+
+    rows = []
+    if args.save_baseline:
+        with exporters.atomic_open(args.baseline) as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            rows = compare(results, json.load(f), args.threshold)
+
+    print_results(results, rows)
+    print(f"\n✓ {args.output}", file=sys.stderr)
+    regressions = [row for row in rows if row[-1]]
+    if regressions:
+        print(f"✗ 회귀 {len(regressions)}개 (기준 대비 +{args.threshold:.0%} 이상)", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
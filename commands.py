@@ -0,0 +1,119 @@
+"""
+명령 로그 - 입력/건너뛰기/부모 전환을 되돌릴 수 있는 명령으로 기록 (undo/redo)
+
+명령마다 (op, i, j) 정수 세 개만 array 에 쌓는다. i, j 는 명령 직전의
+current_index / current_child_index 이고, 연결 내용은 그래프에 이미 있으므로
+로그에 복사하지 않는다. 되돌린 명령만 redo 스택에 연결을 들고 있는다.
+
+    EDGE     연결 추가 (생각 입력 또는 건너뛰기)       되돌리기: graph.pop_edge()
+    MOVE     빈 입력으로 다음 관계로                   되돌리기: 위치만
+    PARENT   다음 부모로 넘어가며 새 부모 노드 추가    되돌리기: graph.pop_parent()
+    ADVANCE  다음 부모로 (이미 있는 부모 / 매핑 완료)  되돌리기: 위치만
+
+PARENT / ADVANCE 는 사용자 입력이 부모를 끝냈을 때 자동으로 따라붙는 명령이라
+undo/redo 는 사용자 명령 하나와 그 뒤의 자동 명령들을 한 번에 처리한다.
+첫 부모에 자식이 없으면 로그가 자동 명령으로 시작하는데, 이 앞머리는 되돌릴
+사용자 명령이 없으므로 undo 하지 않는다 (되돌리면 다시 그 위치로 자동 전환되며
+redo 스택이 지워진다).
+
+메모리: undo 스택은 명령 max_depth 개까지만 되돌릴 수 있게 둔다. 2배가 쌓이면
+오래된 절반을 사용자 명령 경계에서 한 번에 잘라 내므로 기록은 평균 O(1) 이다.
+redo 스택은 되돌린 명령만 들고 있으므로 undo 스택보다 길어지지 않는다.
+"""
+from array import array
+
+EDGE, MOVE, PARENT, ADVANCE = 0, 1, 2, 3
+AUTOMATIC = (PARENT, ADVANCE)
+MAX_DEPTH = 10_000  # 되돌릴 수 있는 명령 수 (명령 하나 = 정수 3개)
+
+
+class CommandLog:
+    """undo 스택 (정수 array) + redo 스택"""
+
+    __slots__ = ('_undo', '_redo', '_commands', 'max_depth')
+
+    def __init__(self, max_depth: int = MAX_DEPTH):
+        self._undo = array('l')  # op, i, j 가 세 칸씩
+        self._redo = []  # (op, 되돌린 연결 또는 부모 단어, 명령 직후 i, j)
+        self._commands = 0  # undo 스택의 사용자 명령 수 (자동 명령 제외)
+        self.max_depth = max_depth
+
+    def __len__(self):
+        return len(self._undo) // 3
+
+    def can_undo(self) -> bool:
+        return self._commands > 0
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def clear(self):
+        del self._undo[:]
+        self._redo.clear()
+        self._commands = 0
+
+    def record(self, op: int, i: int, j: int):
+        """새 명령 기록 - redo 스택은 버린다"""
+        self._undo.extend((op, i, j))
+        self._redo.clear()
+        if op not in AUTOMATIC:
+            self._commands += 1
+        if len(self._undo) > 6 * self.max_depth:
+            self._compact()
+
+    def _compact(self):
+        """최근 max_depth 개 명령만 남김 - 자동 명령이 앞에 홀로 남지 않게 경계에서 자른다"""
+        undo = self._undo
+        start = len(undo) - 3 * self.max_depth
+        while start < len(undo) and undo[start] in AUTOMATIC:
+            start += 3
+        self._commands -= sum(1 for op in undo[:start:3] if op not in AUTOMATIC)
+        del undo[:start]
+
+    def undo(self, graph, i: int, j: int):
+        """사용자 명령 하나(와 뒤따른 자동 명령)를 graph 에서 되돌림
+
+        i, j 는 현재 위치. [(op, 연결 또는 부모 단어, 명령 직전 i, j), ...] 를 되돌린 순서로 반환
+        """
+        undone = []
+        if not self._commands:
+            return undone  # 남은 것은 사용자 명령 없는 자동 명령뿐
+        while self._undo:
+            op, before_i, before_j = self._undo[-3:]
+            del self._undo[-3:]
+            if op == EDGE:
+                payload = graph.pop_edge()
+            elif op == PARENT:
+                payload = graph.pop_parent()
+            else:
+                payload = None
+            self._redo.append((op, payload, i, j))
+            undone.append((op, payload, before_i, before_j))
+            i, j = before_i, before_j
+            if op not in AUTOMATIC:
+                self._commands -= 1
+                break
+        return undone
+
+    def redo(self, graph, i: int, j: int):
+        """되돌린 사용자 명령 하나(와 뒤따르던 자동 명령)를 다시 적용
+
+        [(op, 연결 ID 또는 부모 단어, 명령 직후 i, j), ...] 를 적용한 순서로 반환
+        """
+        redone = []
+        while self._redo:
+            op, payload, after_i, after_j = self._redo[-1]
+            if redone and op not in AUTOMATIC:
+                break
+            self._redo.pop()
+            if op == EDGE:
+                payload = graph.add_edge(payload.parent, payload.child,
+                                         payload.thought, payload.keywords)
+            elif op == PARENT:
+                graph.add_parent(payload)
+            self._undo.extend((op, i, j))
+            if op not in AUTOMATIC:
+                self._commands += 1
+            redone.append((op, payload, after_i, after_j))
+            i, j = after_i, after_j
+        return redone
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+압축 파일 - 확장자(.gz / .xz / .bz2)로 stdlib 코덱을 골라 스트리밍으로 읽고 쓰기
+
+indent=2 인 mindmap_*.json 이나 같은 모양이 반복되는 DOT 는 압축이 잘 된다.
+exporters.atomic_open 과 리더들(loader, mindfile, store, gridmind_batch)이 확장자를 보고
+알아서 쓰므로, 파일 이름에 .gz / .xz / .bz2 만 붙이면 된다.
+쓰기는 압축 전용 스레드가 맡는다 (zlib / lzma / bz2 는 압축하는 동안 GIL 을 놓는다).
+내용을 만드는 쪽은 청크를 큐에 넘기고 바로 다음 내용을 만든다.
+
+    exporters.save_json(graph, question, "mindmap.json.gz")
+    open_reader("mindmap.json.xz")
+    python gridmind_textual_v2.py --compress xz                  # 저장 파일을 모두 압축
+    python compressed.py mindmap_*.json mindmap_*.dot --codec xz # 기존 파일 압축
+"""
+import argparse
+import bz2
+import gzip
+import io
+import lzma
+import os
+import queue
+import shutil
+import threading
+
+CODECS = {'.gz': gzip, '.xz': lzma, '.bz2': bz2}
+CHUNK_SIZE = 1 << 18  # 압축 스레드에 넘기는 단위
+QUEUE_DEPTH = 8  # 압축이 밀리면 쓰는 쪽이 기다린다 (메모리 상한 = CHUNK_SIZE × QUEUE_DEPTH)
+
+
+def codec_for(path: str):
+    """확장자에 맞는 코덱 모듈 (압축 파일이 아니면 None)"""
+    return CODECS.get(os.path.splitext(path)[1])
+
+
+def base_name(path: str) -> str:
+    """압축 확장자를 뗀 이름 - 'mindmap.json.gz' → 'mindmap.json'"""
+    root, ext = os.path.splitext(path)
+    return root if ext in CODECS else path
+
+
+def open_read(path: str, mode: str = 'r', encoding: str = 'utf-8', newline=None):
+    """압축 여부와 상관없이 읽기용으로 열기 (스트리밍 압축 해제)"""
+    binary = 'b' in mode
+    codec = codec_for(path)
+    if codec is None:
+        if binary:
+            return open(path, 'rb')
+        return open(path, 'r', encoding=encoding, newline=newline)
+    if binary:
+        return codec.open(path, 'rb')
+    return codec.open(path, 'rt', encoding=encoding, newline=newline)
+
+
+def _compressor(codec, fileobj):
+    if codec is gzip:
+        # mtime=0 - 같은 내용이면 같은 파일 (레벨 6 은 9 보다 훨씬 빠르고 크기는 거의 같다)
+        return gzip.GzipFile(fileobj=fileobj, mode='wb', compresslevel=6, mtime=0)
+    if codec is lzma:
+        return lzma.LZMAFile(fileobj, 'wb')
+    return bz2.BZ2File(fileobj, 'wb')
+
+
+class _CompressThread(io.RawIOBase):
+    """write() 한 청크를 압축 스레드로 넘기는 raw 스트림 (fileobj 는 닫지 않는다)"""
+
+    def __init__(self, codec, fileobj):
+        super().__init__()
+        self._queue = queue.Queue(QUEUE_DEPTH)
+        self._position = 0
+        self._error = None
+        self._thread = threading.Thread(target=self._run, args=(codec, fileobj),
+                                        name="gridmind-compress", daemon=True)
+        self._thread.start()
+
+    def _run(self, codec, fileobj):
+        finished = False  # 끝 표시(None)를 이미 받았는지
+        try:
+            with _compressor(codec, fileobj) as out:
+                while not finished:
+                    chunk = self._queue.get()
+                    if chunk is None:
+                        finished = True
+                    else:
+                        out.write(chunk)
+        except BaseException as exc:
+            self._error = exc
+            # 쓰는 쪽이 put 에서 막히지 않도록 끝 표시까지 비운다
+            # (마무리 flush 에서 실패했으면 끝 표시는 이미 받았으므로 기다리지 않는다)
+            while not finished:
+                finished = self._queue.get() is None
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        if self._error is not None:
+            raise self._error
+        data = bytes(b)  # BufferedWriter 는 버퍼를 다시 쓰므로 복사해서 넘긴다
+        self._queue.put(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        """압축 전 기준 위치"""
+        return self._position
+
+    def close(self):
+        if self.closed:
+            return
+        super().close()
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+
+def open_write(fileobj, path: str, mode: str = 'w', encoding: str = 'utf-8', newline=None,
+               buffering: int = -1):
+    """fileobj 에 path 확장자의 코덱으로 압축해서 쓰는 파일 객체 (닫으면 압축 마무리)"""
+    raw = _CompressThread(codec_for(path), fileobj)
+    buffered = io.BufferedWriter(raw, buffering if buffering > 0 else CHUNK_SIZE)
+    if 'b' in mode:
+        return buffered
+    return io.TextIOWrapper(buffered, encoding=encoding, newline=newline)
+
+
+def compress_file(path: str, codec: str = 'gz', keep: bool = False) -> str:
+    """기존 파일을 압축 파일로 바꾸고 새 이름 반환 (keep 이면 원본도 남김)"""
+    target = f"{path}.{codec}"
+    tmp_path = f"{target}.tmp"
+    try:
+        with open(path, 'rb') as src, open(tmp_path, 'wb') as raw:
+            with open_write(raw, target, 'wb') as dst:
+                shutil.copyfileobj(src, dst, CHUNK_SIZE)
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    if not keep:
+        os.unlink(path)
+    return target
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="저장된 마인드맵 파일 압축")
+    parser.add_argument('files', nargs='+', help="mindmap_*.json / .dot / .csv / .gmb ...")
+    parser.add_argument('--codec', choices=[ext[1:] for ext in CODECS], default='gz')
+    parser.add_argument('--keep', action='store_true', help="원본 파일을 지우지 않음")
+    args = parser.parse_args(argv)
+
+    for path in args.files:
+        if codec_for(path) is not None:
+            print(f"- {path} (이미 압축됨)")
+            continue
+        before = os.path.getsize(path)
+        target = compress_file(path, args.codec, args.keep)
+        after = os.path.getsize(target)
+        print(f"✓ {target}  {before:,} → {after:,} bytes ({after / max(before, 1):.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+"""
+마인드맵 내보내기 - CSV / JSON / DOT / JSON Lines
+
+모든 파일은 임시 파일에 쓴 뒤 rename 하므로, 저장 도중 중단되어도
+반쯤 쓰인 파일이 남지 않는다.
+파일 이름이 .gz / .xz / .bz2 로 끝나면 압축 스레드를 거쳐 압축해서 쓴다 (compressed.py).
+"""
+import csv
+import json
+import os
+import sys
+from contextlib import ExitStack, contextmanager
+from datetime import datetime
+
+import compressed
+from instrument import timed
+
+BUFFER_SIZE = 1 << 20  # 스트리밍 sink 의 쓰기 버퍼 (1 MiB)
+
+# 임시 파일은 mkstemp(0600) 대신 0666 으로 만들어 커널이 umask 를 적용하게 한다
+# (일반 open() 과 같은 권한 - 프로세스 umask 를 읽으려고 바꿨다 되돌리지 않는다)
+_TMP_FLAGS = os.O_RDWR | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+
+
+def _create_tmp(filename: str):
+    """filename 옆에 새 임시 파일 - (fd, 경로)"""
+    directory = os.path.dirname(os.path.abspath(filename))
+    for _ in range(100):
+        tmp_path = os.path.join(
+            directory, f".{os.path.basename(filename)}.{os.urandom(4).hex()}.tmp")
+        try:
+            return os.open(tmp_path, _TMP_FLAGS, 0o666), tmp_path
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"임시 파일을 만들 수 없습니다: {filename}")
+
+
+@contextmanager
+def atomic_open(filename: str, newline=None, buffering=-1, mode: str = 'w'):
+    """임시 파일에 쓰고 성공하면 filename 으로 교체 (mode='wb' 면 바이너리, 압축 확장자면 압축)"""
+    fd, tmp_path = _create_tmp(filename)
+    try:
+        encoding = None if 'b' in mode else 'utf-8'
+        if compressed.codec_for(filename) is None:
+            with open(fd, mode, buffering=buffering, encoding=encoding, newline=newline) as f:
+                yield f
+                f.flush()
+                os.fsync(f.fileno())
+        else:
+            with open(fd, 'wb') as raw:
+                with compressed.open_write(raw, filename, mode, encoding, newline, buffering) as f:
+                    yield f
+                raw.flush()
+                os.fsync(raw.fileno())
+        os.replace(tmp_path, filename)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+CSV_HEADER = ['from', 'to', 'label', 'thought', 'keywords']
+
+DOT_HEADER = (
+    'digraph G {\n'
+    '  rankdir=LR;\n'
+    '  node [shape=box, fontname="Malgun Gothic"];\n\n'
+)
+
+
+def csv_row(edge):
+    """save_csv_with_thoughts 의 한 행"""
+    return [
+        edge.parent,
+        edge.child,
+        edge.child,
+        edge.thought,
+        ', '.join(edge.keywords[:5])
+    ]
+
+
+@timed("exporters.save_csv_with_thoughts")
+def save_csv_with_thoughts(graph, filename: str):
+    """CSV 파일로 저장 - 원문 포함"""
+    with atomic_open(filename, newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+
+        for edge in graph.edges():
+            writer.writerow(csv_row(edge))
+
+
+@timed("exporters.save_json")
+def save_json(graph, question: str, filename: str, progress=None, pairs=None, session=None):
+    """JSON 파일로 저장 - 완전한 구조
+
+    progress: (current_index, current_child_index) - 이어서 진행할 위치
+    pairs: 짝 전략 스펙 (pairing.PairPlan.from_spec)
+    session: 세션 키 - 불러와서 이어 할 때 SQLite 저장소의 같은 맵을 덮어쓰도록
+    """
+    data = {
+        'version': '2.0',
+        'question': question,
+        'timestamp': datetime.now().isoformat(),
+    }
+    if progress is not None:
+        # 스트리밍 로더가 structure 전에 읽을 수 있도록 앞쪽에 둔다
+        data['current_index'], data['current_child_index'] = progress
+    if pairs and pairs != 'all':
+        data['pairs'] = pairs
+    if session:
+        data['session'] = session
+    data.update({
+        'structure': graph.to_structure(),
+        'connection_history': list(graph.history())
+    })
+
+    with atomic_open(filename) as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def write_dot_edge(f, edge):
+    """save_dot_with_thoughts 의 연결 하나 (툴팁에 원문, 키워드 노드)"""
+    top_node = edge.parent
+    child = edge.child
+    thought = edge.thought.replace('"', '\\"')
+
+    # 노드 연결 (툴팁에 원문)
+    f.write(f'  "{top_node}" -> "{child}" [\n')
+    f.write(f'    label="",\n')
+    if thought:
+        f.write(f'    tooltip="{thought}",\n')
+    f.write(f'  ];\n')
+
+    # 키워드 노드들
+    for kw in edge.keywords[:3]:
+        f.write(f'  "{child}" -> "{kw}" [style=dashed];\n')
+
+    f.write('\n')
+
+
+@timed("exporters.save_dot_with_thoughts")
+def save_dot_with_thoughts(graph, filename: str):
+    """DOT 파일로 저장 - 툴팁에 원문 포함"""
+    with atomic_open(filename) as f:
+        f.write(DOT_HEADER)
+
+        for edge in graph.edges():
+            write_dot_edge(f, edge)
+
+        f.write('}\n')
+
+
+# ----------------------------------------------------------------------
+# gridmind.py 용 스트리밍 내보내기 - 그래프를 한 번만 순회하며 여러 sink 에 동시에 기록
+# ----------------------------------------------------------------------
+class CsvSink:
+    """from,to,label 형식 CSV (부모 → 부모_자식 → 부모_자식_키워드)"""
+
+    newline = ''
+
+    def __init__(self, filename: str = 'graph.csv'):
+        self.filename = filename
+
+    def attach(self, f):
+        """header 없이 f 에 본문만 쓰도록 연결 (병렬 배치의 part 파일용)"""
+        self.writer = csv.writer(f)
+
+    def begin(self, f):
+        self.attach(f)
+        self.writer.writerow(['from', 'to', 'label'])
+
+    def write(self, edge, question=None):
+        top_node = edge.parent
+        mid_node = edge.child
+        edge_label = f"{top_node}_{mid_node}"
+
+        # 최상위 -> 중간 레벨
+        self.writer.writerow((top_node, edge_label, mid_node))
+
+        # 중간 레벨 -> 리프 노드
+        for leaf in edge.keywords:
+            self.writer.writerow((edge_label, f"{top_node}_{mid_node}_{leaf}", leaf))
+
+    def end(self):
+        pass
+
+    def done_message(self):
+        return f"✓ {self.filename} 파일 생성 완료!"
+
+
+class DotSink:
+    """Graphviz DOT (중간 노드에 자식 단어, 리프에 키워드)"""
+
+    newline = None
+
+    def __init__(self, filename: str = 'graph.dot'):
+        self.filename = filename
+
+    def attach(self, f):
+        """header 없이 f 에 본문만 쓰도록 연결 (병렬 배치의 part 파일용)"""
+        self.f = f
+
+    def begin(self, f):
+        self.attach(f)
+        f.write('digraph G {\n')
+        f.write('  rankdir=LR;\n')
+        f.write('  node [shape=box, fontname="Malgun Gothic"];\n\n')
+
+    def write(self, edge, question=None):
+        top_node = edge.parent
+        mid_node = edge.child
+        edge_label = f"{top_node}_{mid_node}"
+
+        write = self.f.write
+        write(f'  "{top_node}" -> "{edge_label}";\n')
+        write(f'  "{edge_label}" [label="{mid_node}"];\n')
+
+        for leaf in edge.keywords:
+            leaf_label = f"{top_node}_{mid_node}_{leaf}"
+            write(f'  "{edge_label}" -> "{leaf_label}";\n')
+            write(f'  "{leaf_label}" [label="{leaf}"];\n')
+
+        write('\n')
+
+    def end(self):
+        self.f.write('}\n')
+
+    def done_message(self):
+        return (
+            f"✓ {self.filename} 파일 생성 완료!\n"
+            "\n[DOT 파일 사용법]\n"
+            f"이미지 생성: dot -Tpng {self.filename} -o output.png\n"
+            f"또는:       dot -Tsvg {self.filename} -o output.svg"
+        )
+
+
+class JsonlSink:
+    """연결 하나당 JSON 한 줄"""
+
+    newline = None
+
+    def __init__(self, filename: str = 'graph.jsonl'):
+        self.filename = filename
+
+    def attach(self, f):
+        """header 없이 f 에 본문만 쓰도록 연결 (병렬 배치의 part 파일용)"""
+        self.f = f
+
+    def begin(self, f):
+        self.attach(f)
+
+    def write(self, edge, question=None):
+        record = {
+            'from': edge.parent,
+            'to': edge.child,
+            'thought': edge.thought,
+            'keywords': list(edge.keywords),
+        }
+        if question is not None:
+            record['question'] = question
+        self.f.write(json.dumps(record, ensure_ascii=False))
+        self.f.write('\n')
+
+    def end(self):
+        pass
+
+    def done_message(self):
+        return f"✓ {self.filename} 파일 생성 완료!"
+
+
+class StreamExporter:
+    """sink 들을 열어 두고 그래프 여러 개를 이어서 기록 (filename 이 '-' 이면 stdout)
+
+    with StreamExporter([CsvSink(), JsonlSink()]) as exporter:
+        exporter.write_graph(graph)
+    """
+
+    def __init__(self, sinks):
+        self.sinks = sinks
+        self.files = []
+        self._stack = ExitStack()
+
+    def __enter__(self):
+        with ExitStack() as stack:
+            for sink in self.sinks:
+                if sink.filename == '-':
+                    f = sys.stdout
+                else:
+                    f = stack.enter_context(
+                        atomic_open(sink.filename, newline=sink.newline, buffering=BUFFER_SIZE)
+                    )
+                sink.begin(f)
+                self.files.append(f)
+            self._stack = stack.pop_all()
+        return self
+
+    def write_graph(self, graph, question=None):
+        """graph 를 한 번만 순회하면서 모든 sink 에 기록"""
+        sinks = self.sinks
+        for edge in graph.edges():
+            for sink in sinks:
+                sink.write(edge, question)
+
+    def append_part(self, index: int, path: str, start: int, length: int):
+        """다른 프로세스가 미리 써 둔 본문(part 파일의 byte 범위)을 index 번째 sink 에 이어 붙임"""
+        f = self.files[index]
+        f.flush()
+        with open(path, 'rb') as part:
+            part.seek(start)
+            while length > 0:
+                block = part.read(min(length, BUFFER_SIZE))
+                if not block:
+                    break
+                f.buffer.write(block)
+                length -= len(block)
+        f.buffer.flush()
+
+    def __exit__(self, exc_type, exc, tb):
+        # 실패하면 footer 없이 닫아서 임시 파일이 버려지게 한다
+        if exc_type is None:
+            for sink in self.sinks:
+                sink.end()
+        return self._stack.__exit__(exc_type, exc, tb)
+
+
+@timed("exporters.stream_export")
+def stream_export(graph, sinks):
+    """graph 를 한 번만 순회하면서 모든 sink 에 기록"""
+    with StreamExporter(sinks) as exporter:
+        exporter.write_graph(graph)
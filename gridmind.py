@@ -1,32 +1,60 @@
-import re
+import argparse
+from mindgraph import MindGraph
+from loader import open_reader
+from mindfile import save_binary
+from render import save_svg
+from pairing import PairPlan
+from tokenizer import extract_keywords, set_strip_particles, split_words
+from exporters import CsvSink, DotSink, JsonlSink, stream_export
+
+# python gridmind.py [mindmap_YYYYmmdd_HHMMSS.json] [--pairs undirected,topk=8]
+parser = argparse.ArgumentParser(description="gridmind")
+parser.add_argument("load", nargs="?", help="이어서 진행할 mindmap_*.json 또는 .gmb (.gz/.xz/.bz2 압축 가능)")
+parser.add_argument("--pairs", default="all",
+                    help="짝 전략: all, undirected, unique|merge, distinct, topk=K, window=W (쉼표로 조합)")
+parser.add_argument("--strip-particles", action="store_true", help="키워드에서 한국어 조사 떼기")
+args = parser.parse_args()
+if args.strip_particles:
+    set_strip_particles(True)
 
-question = input("Ask Yourself!") # Input == sentences
 i = 0
-X = []
+start_child = 0 # 불러온 맵에서 이어서 진행할 자식 위치
+if args.load:
+    reader = open_reader(args.load) # .json 또는 .gmb
+    graph = reader.load_graph()
+    question = reader.meta.get('question', '')
+    args.pairs = reader.meta.get('pairs', args.pairs)
+    print(f"불러옴: {args.load} ({len(graph)}개 연결)")
+else:
+    question = input("Ask Yourself!") # Input == sentences
+    graph = MindGraph() # parent -> [child, thought, keywords] 연결 저장소
 print(question)
 
-splited = re.split(r"\W+", question) # split sentences by space (\s)
+splited = split_words(question) # split sentences by space (\s)
 print(splited)
-const_spl = splited.copy() # memo(splited sentences)
+plan = PairPlan.from_spec(splited, args.pairs) # 부모마다 물어볼 자식 (짝 전략, 위치 기준)
+print(f"질문 수 = {plan.total}")
+
+if args.load:
+    i, start_child = reader.progress() or (len(splited), 0) # 저장 당시 위치 (없으면 완성된 맵)
+    reader.close()
 
 while i < len(splited): # make a rotation between Parent node and children node
-    Y = []
-    parent = splited[i]
+    parent = plan.node(i) # 위치별 노드 이름 (반복 단어는 word#2)
     print(f"부모 = {parent}")
-    splited.remove(parent)
-    print(f"splited = {splited}")
-    Y.append(parent)
-    for j in splited:
-        notes = input("take your mind!")
+    children = plan.children(i)
+    print(f"children = {children}")
+    graph.add_parent(parent)
+    for n, j in enumerate(children[start_child:], plan.done_before(i) + start_child + 1):
+        notes = input(f"[{n}/{plan.total}] take your mind!")
         print(f"notes = {notes}")
-        Z = re.split(r"\W+", notes) # for infinite expansions
-        Y.append([j, Z])
-        print(f"기록 a = {Y}")
-    X.append(Y)
-    splited = const_spl.copy()
+        Z = extract_keywords(notes) # for infinite expansions
+        graph.add_edge(parent, j, notes, Z)
+        print(f"기록 a = {parent} -> {graph.children_of(parent)}")
+    start_child = 0
     i += 1
 
-print(f"최종 : {X}") # final mapping
+print(f"최종 : {graph.to_structure()}") # final mapping
 
 """ filesave as csv and dot, for using data analyze tools. """
 while True:
@@ -38,116 +66,23 @@ while True:
         print("Please try again.")
 
 if save == 'y' or save == 'Y':
-    print("1) .csv\n2) .dot\n3) both of them.")
+    print("1) .csv\n2) .dot\n3) both of them.\n4) .jsonl\n5) .gmb (이어서 하기용 세션)\n6) .svg (Graphviz 없이 그림)")
     data = int(input("which?"))
-    if data == 1: # csv session
-        import csv
-        edges = []
-        for top_item in X:
-            top_node = top_item[0]
-            
-            for mid_item in top_item[1:]:
-                mid_node = mid_item[0]
-                edge_label = f"{top_node}_{mid_node}"
-                
-                # 최상위 -> 중간 레벨
-                edges.append((top_node, edge_label, mid_node))
-                
-                # 중간 레벨 -> 리프 노드
-                for leaf in mid_item[1]:
-                    leaf_label = f"{top_node}_{mid_node}_{leaf}"
-                    edges.append((edge_label, leaf_label, leaf))
-        
-        with open('graph.csv', 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['from', 'to', 'label'])
-            writer.writerows(edges)
-        print("✓ graph.csv 파일 생성 완료!")
-        
-    elif data == 2: # dot session
-        with open('graph.dot', 'w', encoding='utf-8') as f:
-            f.write('digraph G {\n')
-            f.write('  rankdir=LR;\n')
-            f.write('  node [shape=box, fontname="Malgun Gothic"];\n\n')
-            
-            for top_item in X:
-                top_node = top_item[0]
-                
-                for mid_item in top_item[1:]:
-                    mid_node = mid_item[0]
-                    edge_label = f"{top_node}_{mid_node}"
-                    
-                    f.write(f'  "{top_node}" -> "{edge_label}";\n')
-                    f.write(f'  "{edge_label}" [label="{mid_node}"];\n')
-                    
-                    for leaf in mid_item[1]:
-                        leaf_label = f"{top_node}_{mid_node}_{leaf}"
-                        f.write(f'  "{edge_label}" -> "{leaf_label}";\n')
-                        f.write(f'  "{leaf_label}" [label="{leaf}"];\n')
-                    
-                    f.write('\n')
-            
-            f.write('}\n')
-        print("✓ graph.dot 파일 생성 완료!")
-        print("\n[DOT 파일 사용법]")
-        print("이미지 생성: dot -Tpng graph.dot -o output.png")
-        print("또는:       dot -Tsvg graph.dot -o output.svg")
-    elif data == 3: # both of them
-        import csv
-        edges = []
-        for top_item in X:
-            top_node = top_item[0]
-            
-            for mid_item in top_item[1:]:
-                mid_node = mid_item[0]
-                edge_label = f"{top_node}_{mid_node}"
-                
-                # 최상위 -> 중간 레벨
-                edges.append((top_node, edge_label, mid_node))
-                
-                # 중간 레벨 -> 리프 노드
-                for leaf in mid_item[1]:
-                    leaf_label = f"{top_node}_{mid_node}_{leaf}"
-                    edges.append((edge_label, leaf_label, leaf))
-        
-        with open('graph.csv', 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['from', 'to', 'label'])
-            writer.writerows(edges)
-        print("✓ graph.csv 파일 생성 완료!")
-        
-        with open('graph.dot', 'w', encoding='utf-8') as f:
-            f.write('digraph G {\n')
-            f.write('  rankdir=LR;\n')
-            f.write('  node [shape=box, fontname="Malgun Gothic"];\n\n')
-            
-            for top_item in X:
-                top_node = top_item[0]
-                
-                for mid_item in top_item[1:]:
-                    mid_node = mid_item[0]
-                    edge_label = f"{top_node}_{mid_node}"
-                    
-                    f.write(f'  "{top_node}" -> "{edge_label}";\n')
-                    f.write(f'  "{edge_label}" [label="{mid_node}"];\n')
-                    
-                    for leaf in mid_item[1]:
-                        leaf_label = f"{top_node}_{mid_node}_{leaf}"
-                        f.write(f'  "{edge_label}" -> "{leaf_label}";\n')
-                        f.write(f'  "{leaf_label}" [label="{leaf}"];\n')
-                    
-                    f.write('\n')
-            
-            f.write('}\n')
-        print("✓ graph.dot 파일 생성 완료!")
-        print("\n[DOT 파일 사용법]")
-        print("이미지 생성: dot -Tpng graph.dot -o output.png")
-        print("또는:       dot -Tsvg graph.dot -o output.svg")
+    sinks = {
+        1: [CsvSink()], # csv session
+        2: [DotSink()], # dot session
+        3: [CsvSink(), DotSink()], # both of them
+        4: [JsonlSink()], # json lines
+    }.get(data)
+    if data == 5:
+        save_binary(graph, question, "graph.gmb", None, args.pairs)
+        print("✓ graph.gmb 저장 완료")
+    elif data == 6:
+        save_svg(graph, "graph.svg")
+        print("✓ graph.svg 파일 생성 완료!")
+    elif sinks:
+        stream_export(graph, sinks) # 한 번의 순회로 모든 파일 작성
+        for sink in sinks:
+            print(sink.done_message())
     else:
-        print("Wrong access. It will be broken.") 
-            
-
-    
-
-    
-
+        print("Wrong access. It will be broken.")
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+gridmind 배치 모드 - 질문과 미리 써 둔 생각을 파일로 받아 사람 입력 없이 매핑
+
+입력 (파일 또는 stdin):
+  JSONL  {"question": "...", "notes": {"부모->자식": "생각", ...}}
+         notes 는 질문 순서대로 쓴 리스트여도 된다 (gridmind.py 의 input() 에 답하던 순서)
+  CSV    question,from,to,thought  (같은 질문의 행은 이어서)
+
+출력: --jsonl / --csv / --dot (아무것도 없으면 JSON Lines 를 stdout 으로)
+    python gridmind_batch.py questions.jsonl --csv graph.csv --dot graph.dot
+
+병렬 처리: --jobs N 이면 질문을 --chunk-size 개씩 묶어 프로세스 풀에 나눠 준다.
+각 워커는 자기 part 파일에 본문을 이어 쓰고, 끝나면 part 파일들을 하나로 합친다.
+    python gridmind_batch.py corpus.jsonl --jobs 0 --csv graph.csv   # 0 = CPU 개수
+
+SQLite: --db maps.db 면 질문마다 맵 하나로 저장 (store.MindStore, 묶음마다 트랜잭션 하나)
+병렬 처리 때도 DB 에는 부모 프로세스 하나만 쓴다 (워커는 그래프를 돌려준다).
+
+짝 전략: --pairs undirected,topk=8 (pairing.PairPlan.from_spec, 기본 all)
+반복된 단어는 위치마다 다른 노드('a', 'a#2')이고, --pairs merge 면 한 노드로 합친다.
+notes 의 키도 그 노드 이름을 쓴다: {"a#2->b": "..."}
+
+MindMapApp 과 같은 쪼개기/짝 규칙(pairing.py)을 쓰고, Textual 은 import 하지 않는다.
+"""
+import argparse
+import csv
+import io
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+from contextlib import nullcontext
+from itertools import groupby, islice
+
+import compressed
+from exporters import CsvSink, DotSink, JsonlSink, StreamExporter
+from mindgraph import MindGraph
+from pairing import PairPlan
+from store import MindStore
+from tokenizer import keyword_tokenizer, set_strip_particles, split_words, tokenize_many
+
+
+def read_jsonl(f):
+    """(question, notes) - notes 는 {(부모, 자식): 생각} 또는 질문 순서의 리스트"""
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        record = json.loads(line)
+        notes = record.get('notes', {})
+        if isinstance(notes, dict):
+            notes = {tuple(key.split('->', 1)): thought for key, thought in notes.items()}
+        yield record['question'], notes
+
+
+def read_csv(f):
+    """(question, {(부모, 자식): 생각}) - 같은 question 의 연속된 행을 묶는다"""
+    rows = csv.DictReader(f)
+    for question, group in groupby(rows, key=lambda row: row['question']):
+        yield question, {(row['from'], row['to']): row['thought'] for row in group}
+
+
+def build_graph(question: str, notes, pairs: str = 'all') -> MindGraph:
+    """질문 하나를 MindMapApp 과 같은 순서로 매핑 (생각이 없는 짝은 건너뜀)"""
+    words = split_words(question)
+    plan = PairPlan.from_spec(words, pairs)
+    answers = iter(notes) if isinstance(notes, list) else None
+    graph = MindGraph()
+
+    # 짝마다 생각을 모은 뒤 키워드는 한 번에 추출
+    answered = []
+    for index, parent in enumerate(plan.nodes):
+        graph.add_parent(parent)
+        for child in plan.children(index):
+            if answers is not None:
+                thought = next(answers, '')
+            else:
+                thought = notes.get((parent, child), '')
+            thought = thought.strip()
+            if thought:
+                answered.append((parent, child, thought))
+
+    keywords = tokenize_many([thought for _, _, thought in answered])
+    for (parent, child, thought), Z in zip(answered, keywords):
+        graph.add_edge(parent, child, thought, Z)
+
+    return graph
+
+
+def process_chunk(task):
+    """워커 프로세스 - 질문 묶음을 매핑해서 자기 part 파일에 이어 쓰고 byte 범위를 반환
+
+    keep_maps 면 (question, graph) 목록도 돌려준다 - DB 는 부모 프로세스가 한 연결로 쓴다.
+    """
+    chunk_index, records, formats, pairs, part_dir, keep_maps = task
+
+    buffers = [io.StringIO() for _ in formats]
+    sinks = [SINKS[fmt]('-') for fmt in formats]
+    for sink, buffer in zip(sinks, buffers):
+        sink.attach(buffer)
+
+    questions = edges = 0
+    maps = []
+    for question, notes in records:
+        graph = build_graph(question, notes, pairs)
+        for edge in graph.edges():
+            for sink in sinks:
+                sink.write(edge, question)
+        questions += 1
+        edges += len(graph)
+        if keep_maps:
+            maps.append((question, graph))
+
+    parts = []
+    for fmt, buffer in zip(formats, buffers):
+        data = buffer.getvalue().encode('utf-8')
+        path = os.path.join(part_dir, f"part-{os.getpid()}.{fmt}")
+        with open(path, 'ab') as f:
+            start = f.tell()
+            f.write(data)
+        parts.append((path, start, len(data)))
+
+    return chunk_index, parts, questions, edges, maps
+
+
+def chunked(records, size: int):
+    """records 를 size 개씩 묶기 (입력은 필요한 만큼만 읽음)"""
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_parallel(records, sinks, formats, pairs: str, jobs: int, chunk_size: int, ordered: bool,
+                 db_path: str = None):
+    """프로세스 풀로 처리하고 part 파일을 sink 순서대로 병합
+
+    DB 는 끝난 묶음이 올 때마다 부모 프로세스가 묶음 하나 = 트랜잭션 하나로 쓴다
+    (워커들이 같은 SQLite 파일의 쓰기 잠금을 두고 기다리지 않게).
+    """
+    part_dir = tempfile.mkdtemp(prefix="gridmind_batch_")
+    store = MindStore(db_path) if db_path else None
+    try:
+        tasks = (
+            (chunk_index, chunk, formats, pairs, part_dir, store is not None)
+            for chunk_index, chunk in enumerate(chunked(records, chunk_size))
+        )
+        results = []
+        # spawn 으로 뜬 워커도 부모와 같은 키워드 설정을 쓰도록
+        with multiprocessing.Pool(jobs, initializer=set_strip_particles,
+                                  initargs=(keyword_tokenizer.strip_particles,)) as pool:
+            run = pool.imap if ordered else pool.imap_unordered
+            for _, parts, chunk_questions, chunk_edges, maps in run(process_chunk, tasks):
+                if store is not None:
+                    store.add_maps(maps, source='batch', pairs=pairs)
+                results.append((parts, chunk_questions, chunk_edges))
+
+        questions = edges = 0
+        with StreamExporter(sinks) as exporter:
+            for parts, chunk_questions, chunk_edges in results:
+                for index, (path, start, length) in enumerate(parts):
+                    exporter.append_part(index, path, start, length)
+                questions += chunk_questions
+                edges += chunk_edges
+        return questions, edges
+    finally:
+        if store is not None:
+            store.close()
+        shutil.rmtree(part_dir, ignore_errors=True)
+
+
+def run_serial(records, sinks, pairs: str, db_path: str = None, chunk_size: int = 256):
+    questions = edges = 0
+    store = MindStore(db_path) if db_path else None
+    try:
+        with StreamExporter(sinks) as exporter:
+            for chunk in chunked(records, chunk_size):
+                maps = []
+                for question, notes in chunk:
+                    graph = build_graph(question, notes, pairs)
+                    exporter.write_graph(graph, question)
+                    questions += 1
+                    edges += len(graph)
+                    maps.append((question, graph))
+                if store is not None:
+                    store.add_maps(maps, source='batch', pairs=pairs)
+    finally:
+        if store is not None:
+            store.close()
+    return questions, edges
+
+
+def open_input(path: str):
+    if path == '-':
+        return nullcontext(sys.stdin)
+    return compressed.open_read(path, newline='')
+
+
+SINKS = {'csv': CsvSink, 'dot': DotSink, 'jsonl': JsonlSink}
+
+
+def build_sinks(args):
+    """(sink 목록, 형식 이름 목록)"""
+    outputs = []
+    if args.csv:
+        outputs.append(('csv', args.csv))
+    if args.dot:
+        outputs.append(('dot', args.dot))
+    if args.jsonl or not outputs:
+        outputs.append(('jsonl', args.jsonl or '-'))
+    return [SINKS[fmt](filename) for fmt, filename in outputs], [fmt for fmt, _ in outputs]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="gridmind 배치 모드 (사람 입력 없이 매핑)")
+    parser.add_argument('input', nargs='?', default='-', help="입력 파일 (기본: stdin)")
+    parser.add_argument('--format', choices=['jsonl', 'csv'],
+                        help="입력 형식 (기본: 확장자로 판단, stdin 은 jsonl)")
+    parser.add_argument('--jsonl', help="JSON Lines 출력 ('-' 는 stdout)")
+    parser.add_argument('--csv', help="CSV 출력")
+    parser.add_argument('--dot', help="DOT 출력")
+    parser.add_argument('--db', help="SQLite 저장소에도 저장 (store.py)")
+    parser.add_argument('--pairs', default='all',
+                        help="짝 전략: all, undirected, unique|merge, distinct, topk=K, window=W (쉼표로 조합)")
+    parser.add_argument('--strip-particles', action='store_true',
+                        help="키워드에서 한국어 조사 떼기 (GRIDMIND_STRIP_PARTICLES=1 과 같음)")
+    parser.add_argument('--jobs', type=int, default=1,
+                        help="워커 프로세스 수 (기본 1 = 병렬 처리 안 함, 0 = CPU 개수)")
+    parser.add_argument('--chunk-size', type=int, default=256,
+                        help="워커에 한 번에 넘길 질문 수 (기본 256)")
+    parser.add_argument('--unordered', action='store_true',
+                        help="끝난 묶음 순서대로 출력 (입력 순서 보장 안 함)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    input_format = args.format or (
+        'csv' if compressed.base_name(args.input).endswith('.csv') else 'jsonl')
+    read = read_csv if input_format == 'csv' else read_jsonl
+
+    if args.strip_particles:
+        set_strip_particles(True)
+    sinks, formats = build_sinks(args)
+    jobs = args.jobs or os.cpu_count()
+
+    with open_input(args.input) as f:
+        if jobs > 1:
+            questions, edges = run_parallel(read(f), sinks, formats, args.pairs, jobs,
+                                            args.chunk_size, not args.unordered, args.db)
+        else:
+            questions, edges = run_serial(read(f), sinks, args.pairs, args.db, args.chunk_size)
+
+    print(f"✓ {questions}개 질문, {edges}개 연결 처리 완료", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,18 +2,69 @@
 """
 Mind Mapper TUI v2 - 원문 보존 + 향상된 시각화
 """
-import re
-import csv
-import json
+import argparse
+import os
+import uuid
 from datetime import datetime
+from functools import partial
 from textual.app import App, ComposeResult
 from textual.widgets import (
     Header, Footer, Tree, Input, Button, 
     Static, Label, TextArea, DataTable
 )
+from textual.widgets.data_table import CellKey
 from textual.containers import Container, Vertical, Horizontal, ScrollableContainer
 from textual.binding import Binding
 from textual.reactive import reactive
+from textual.worker import Worker, WorkerState
+from rich.markup import escape
+from rich.text import Text
+
+import exporters
+from instrument import TRACE_ENV_VAR, profiler, timed
+from commands import ADVANCE, EDGE, MOVE, PARENT, CommandLog
+from journal import DEFAULT_JOURNAL, Journal
+from keyword_index import KeywordIndex
+from loader import MindMapReader, open_reader
+from mindfile import save_binary
+from mindgraph import MindGraph
+from pairing import PairPlan
+from render import LayeredLayout, save_svg
+from segments import SegmentExport
+from similarity import ThoughtIndex
+from store import MindStore
+from tokenizer import extract_keywords, set_strip_particles, split_words
+
+
+class HistoryTable(DataTable):
+    """입력 이력 테이블 - 전체 이력을 들고 화면에 보이는 행만 그린다 (DataTable 가상 스크롤)"""
+    
+    def pop_row(self, row_key: str):
+        """행 제거 - 마지막 행이면 O(1) (되돌리기용)
+        
+        DataTable.remove_row 는 뒤 행들의 위치를 다시 매기려고 행 위치 색인 전체를
+        새로 만들고, 커서/호버 좌표를 다시 대입해 행 목록을 다시 계산한다(둘 다 O(n)).
+        마지막 행은 다른 행의 위치가 바뀌지 않으므로 그 행의 항목만 지우고,
+        좌표는 지운 행을 가리킬 때만 안쪽으로 당긴다.
+        """
+        if self._row_locations.get(row_key) != self.row_count - 1:
+            self.remove_row(row_key)
+            return
+        
+        self._require_update_dimensions = True
+        self.check_idle()
+        del self._row_locations[row_key]
+        for column_key in self._data[row_key]:
+            self._updated_cells.discard(CellKey(row_key, column_key))
+        del self.rows[row_key]
+        del self._data[row_key]
+        
+        if self.cursor_coordinate.row >= self.row_count:
+            self.cursor_coordinate = self.cursor_coordinate  # validate 가 마지막 행으로 당긴다
+        if self.hover_coordinate.row >= self.row_count:
+            self.hover_coordinate = self.cursor_coordinate
+        self._update_count += 1
+        self.refresh(layout=True)
 
 
 class MindMapApp(App):
@@ -55,6 +106,18 @@ class MindMapApp(App):
         margin-top: 1;
     }
     
+    #perf-container {
+        height: 12;
+        border: solid $error;
+        padding: 1;
+        margin-top: 1;
+        display: none;
+    }
+    
+    #perf-title {
+        display: none;
+    }
+    
     #input-area {
         height: auto;
         border: solid $warning;
@@ -84,6 +147,10 @@ class MindMapApp(App):
         height: 100%;
     }
     
+    #search-input {
+        margin: 0;
+    }
+    
     Input {
         margin: 1 0;
     }
@@ -128,26 +195,57 @@ class MindMapApp(App):
     BINDINGS = [
         Binding("ctrl+q", "quit", "Quit", show=True),
         Binding("ctrl+s", "save_graph", "Save", show=True),
+        Binding("ctrl+e", "export_graph", "Export", show=True),
         Binding("ctrl+r", "reset", "Reset", show=True),
         Binding("ctrl+h", "toggle_history", "History", show=True),
+        Binding("ctrl+t", "toggle_perf", "Perf", show=True),
     ]
     
+    SUGGEST_DELAY = 0.15  # 입력이 멈춘 뒤 비슷한 생각을 찾기까지 (초)
+    
     # 상태 관리
     current_phase = reactive("init")
     current_index = reactive(0)
     current_parent = reactive("")
     show_history = reactive(True)
+    show_perf = reactive(False)
     
-    def __init__(self):
+    def __init__(self, journal_path: str = DEFAULT_JOURNAL, load_path: str = None,
+                 pairs: str = "all", db_path: str = None, segments_dir: str = None,
+                 compress: str = None, trace_path: str = None):
         super().__init__()
-        self.X = []
+        self.journal = Journal(journal_path)
+        self.load_path = load_path
+        self.pair_spec = pairs  # 짝 전략 (pairing.PairPlan.from_spec)
+        self.db_path = db_path  # SQLite 저장소 (없으면 파일로만 저장)
+        self.session_key = None  # 저장소의 맵 키 - 같은 세션을 다시 저장하면 그 맵을 덮어씀
+        self.segments_dir = segments_dir  # 증분 조각 디렉터리 (있으면 Ctrl+S 는 조각만, 전체는 Ctrl+E)
+        self.save_dirty = None  # 저장 중인 dirty 부모 (실패하면 되돌림)
+        self.save_suffix = f".{compress}" if compress else ""  # 저장 파일 압축 (compressed.py)
+        self.trace_path = trace_path  # 끝날 때 Chrome trace 저장 (instrument.py)
+        self.perf_timer = None  # 계측 패널이 보이는 동안 1초마다 갱신
+        self.plan = None
+        self.graph = MindGraph()
+        self.keyword_index = KeywordIndex()
+        self.thought_index = ThoughtIndex()
+        self.graph_layout = LayeredLayout()  # SVG 용 배치 (바뀐 rank 만 다시 배치)
+        self.suggest_timer = None  # 비슷한 생각 찾기 debounce 타이머
+        self.journal_timer = None  # 입력이 멈춘 동안 저널에 남은 기록 fsync
+        self.search_matches = set()  # 검색에 걸린 연결 ID
         self.question = ""
         self.question_words = []
         self.const_spl = []
-        self.current_Y = []
         self.current_child_index = 0
         self.remaining_children = []
-        self.connection_history = []  # 입력 이력
+        self.connection_history = []  # 입력 이력 (graph 의 연결 ID)
+        self.commands = CommandLog()  # undo/redo 명령 로그
+        self.parent_nodes = {}  # 부모 단어 → TreeNode
+        self.edge_nodes = {}  # 연결 ID → TreeNode
+        self.loaded_parents = set()  # 자식 노드가 만들어진 부모 브랜치
+        self.save_running = False
+        self.save_pending = False
+        self.export_pending = False  # 밀린 저장이 전체 내보내기인지
+        self.checkpoint_due = False  # 저널이 checkpoint 를 원함 (명령이 끝난 뒤에 한다)
     
     def compose(self) -> ComposeResult:
         """UI 구성"""
@@ -157,13 +255,20 @@ class MindMapApp(App):
             # 왼쪽 패널 - 트리 시각화 + 히스토리
             with Vertical(id="left-panel"):
                 yield Static("🧠 Mind Structure", classes="title")
+                yield Input(placeholder="🔍 키워드 검색", id="search-input")
                 with ScrollableContainer(id="tree-container"):
                     yield Tree("Mindmap", id="mindmap-tree")
                 
                 yield Static("📝 Connection History", classes="title", id="history-title")
                 with ScrollableContainer(id="history-container"):
-                    table = DataTable(id="history-table")
-                    table.add_columns("From", "To", "Thought")
+                    table = HistoryTable(id="history-table")
+                    table.add_columns(("From", "from"), ("To", "to"), ("Thought", "thought"))
+                    yield table
+                
+                yield Static("⏱ Performance", classes="title", id="perf-title")
+                with ScrollableContainer(id="perf-container"):
+                    table = DataTable(id="perf-table")
+                    table.add_columns("Function", "Calls", "Total ms", "Mean ms", "Max ms")
                     yield table
             
             # 오른쪽 패널 - 입력 영역
@@ -193,6 +298,7 @@ class MindMapApp(App):
                     
                     yield Label("💡 Tip: 생각을 자유롭게 쓰세요. 단어만 추출됩니다.", 
                                classes="thought-preview")
+                    yield Static("", id="suggestions", classes="thought-preview")
         
         # 하단 컨트롤
         with Horizontal(id="controls"):
@@ -200,14 +306,59 @@ class MindMapApp(App):
             yield Button("Next →", id="next-btn", variant="primary", disabled=True)
             yield Button("Skip", id="skip-btn", variant="default", disabled=True)
             yield Button("Undo", id="undo-btn", variant="default", disabled=True)
+            yield Button("Redo", id="redo-btn", variant="default", disabled=True)
             yield Button("Save", id="save-btn", variant="warning", disabled=True)
             yield Button("Reset", id="reset-btn", variant="error")
         
         yield Footer()
     
     def on_mount(self):
-        """앱 시작 시"""
+        """앱 시작 시 - 불러올 파일이나 중단된 세션이 있으면 복원"""
         self.query_one("#question-input").focus()
+        self.journal_timer = self.set_interval(self.journal.sync_interval, self.journal.sync)
+        
+        if self.load_path:
+            self.load_session(self.load_path)
+            return
+        
+        session = self.journal.restore()
+        if session:
+            self.resume_session(session)
+    
+    def on_unmount(self):
+        """앱 종료 시 저널 fsync (+ Chrome trace 저장)"""
+        for timer in (self.suggest_timer, self.perf_timer, self.journal_timer):
+            if timer is not None:
+                timer.stop()
+        self.journal.close()
+        if self.trace_path:
+            profiler.dump_trace(self.trace_path)
+    
+    def write_journal(self, op: str, *args):
+        """저널에 기록 - checkpoint 할 때가 되면 표시만 하고 명령이 끝난 뒤에 한다"""
+        if self.journal.append(op, *args):
+            self.checkpoint_due = True
+    
+    def end_command(self):
+        """사용자 명령 하나가 끝남 - 그래프/위치가 기록과 맞는 지금만 checkpoint
+        
+        undo/redo 는 그래프를 먼저 다 바꾼 뒤 기록을 여러 개 쓰므로, 기록 중간에
+        checkpoint 를 뜨면 뒤의 기록이 복구 때 한 번 더 적용된다.
+        """
+        if self.checkpoint_due:
+            self.checkpoint_journal()
+    
+    def checkpoint_journal(self):
+        """현재 상태 전체를 저널 checkpoint 로"""
+        self.checkpoint_due = False
+        self.journal.checkpoint({
+            'question': self.question,
+            'pairs': self.pair_spec,
+            'session': self.session_key,
+            'structure': self.graph.to_structure(),
+            'current_index': self.current_index,
+            'current_child_index': self.current_child_index,
+        })
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """버튼 클릭 처리"""
@@ -221,16 +372,97 @@ class MindMapApp(App):
             self.skip_current()
         elif button_id == "undo-btn":
             self.undo_last()
+        elif button_id == "redo-btn":
+            self.redo_last()
         elif button_id == "save-btn":
             self.action_save_graph()
         elif button_id == "reset-btn":
             self.action_reset()
     
     def on_text_area_changed(self, event: TextArea.Changed) -> None:
-        """TextArea에서 Ctrl+Enter 감지"""
+        """생각 입력이 잠시 멈추면 비슷한 이전 생각 표시 (debounce)"""
         if event.text_area.id == "notes-textarea":
-            # Ctrl+Enter로 제출 (실제로는 버튼 클릭 권장)
-            pass
+            if self.suggest_timer is not None:
+                self.suggest_timer.stop()
+            # 타이머를 TextArea 에 건다 - 앱이 닫히며 위젯이 없어지면 타이머도 같이 멈춘다
+            self.suggest_timer = event.text_area.set_timer(self.SUGGEST_DELAY,
+                                                           self.show_suggestions)
+    
+    @timed("MindMapApp.show_suggestions")
+    def show_suggestions(self, limit: int = 3):
+        """입력 중인 생각과 닮은 이전 생각들"""
+        self.suggest_timer = None
+        text = self.query_one("#notes-textarea", TextArea).text
+        suggestions = self.query_one("#suggestions", Static)
+        matches = self.thought_index.similar(text, limit) if text.strip() else []
+        if not matches:
+            suggestions.update("")
+            return
+        
+        lines = Text("🔗 비슷한 생각:")
+        for edge_id, _ in matches:
+            edge = self.graph.edge(edge_id)
+            preview = edge.thought if len(edge.thought) <= 40 else edge.thought[:37] + "..."
+            lines.append(f"\n  {edge.parent} → {edge.child}: {preview}")
+        suggestions.update(lines)
+    
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """검색창 입력 즉시 검색"""
+        if event.input.id == "search-input":
+            self.search_keywords(event.value)
+    
+    @timed("MindMapApp.search_keywords")
+    def search_keywords(self, query: str, limit: int = 50):
+        """키워드 역색인으로 검색 - 걸린 브랜치와 히스토리 행 강조"""
+        previous = self.search_matches
+        matches = self.keyword_index.search(query, limit) if query.strip() else []
+        self.search_matches = set(matches)
+        
+        # 강조가 바뀐 노드만 라벨 갱신
+        for edge_id in previous ^ self.search_matches:
+            if edge_id in self.search_matches:
+                self.populate_tree_parent(self.graph.edge(edge_id).parent)
+                self.parent_nodes[self.graph.edge(edge_id).parent].expand()
+            node = self.edge_nodes.get(edge_id)
+            if node is not None:
+                node.set_label(self.edge_label(self.graph.edge(edge_id)))
+        
+        shown = escape(query.strip())  # 상태 줄은 Rich 마크업 - '[/]' 같은 입력도 글자 그대로
+        if matches:
+            first = self.edge_nodes.get(matches[0])
+            if first is not None:
+                self.query_one("#mindmap-tree", Tree).move_cursor(first)
+            self.update_status(f"🔍 '{shown}': {len(matches)}개 연결", "success")
+        elif shown:
+            self.update_status(f"🔍 '{shown}': 결과 없음", "warning")
+        
+        self.refresh_history_rows(previous ^ self.search_matches)
+    
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        """브랜치를 펼칠 때 자식 노드 생성 (lazy)"""
+        node = event.node
+        if not node.data:
+            return
+        
+        kind, key = node.data
+        if kind == "parent":
+            self.populate_tree_parent(key)
+        elif node.children:
+            return
+        elif kind == "edge":
+            edge = self.graph.edge(key)
+            thought = edge.thought
+            
+            # 생각 프리뷰 (첫 30자)
+            preview = thought[:30] + "..." if len(thought) > 30 else thought
+            node.add_leaf(f"💭 {preview}")
+            
+            # 키워드들
+            if edge.keywords:
+                node.add(f"🔑 Keywords", data=("keywords", key), expand=False)
+        elif kind == "keywords":
+            for kw in self.graph.edge(key).keywords[:5]:  # 최대 5개만
+                node.add_leaf(f"🟢 {kw}")
     
     def start_mapping(self):
         """매핑 시작"""
@@ -242,48 +474,158 @@ class MindMapApp(App):
             return
         
         # 질문 파싱
-        self.question_words = [s for s in re.split(r"\W+", self.question) if s]
+        self.question_words = split_words(self.question)
         
         if len(self.question_words) < 2:
             self.update_status("❌ 최소 2개 이상의 단어가 필요합니다!", "warning")
             return
         
-        self.const_spl = self.question_words.copy()
+        self.plan = PairPlan.from_spec(self.question_words, self.pair_spec)
+        self.const_spl = self.plan.nodes  # 위치별 노드 이름 (반복 단어는 word#2)
+        self.commands.clear()
         self.current_phase = "collecting"
         self.current_index = 0
+        self.session_key = uuid.uuid4().hex
+        self.write_journal("q", self.question, self.pair_spec, self.session_key)
+        
+        self.enable_mapping_controls()
+        
+        # 첫 단계 시작
+        self.start_next_parent()
+        self.end_command()
+    
+    def resume_session(self, session: dict, rebuild_tree: bool = True):
+        """저널/파일에서 복원한 세션 이어서 진행
+        
+        current_index 가 None 이면 완성된 맵으로 본다.
+        """
+        self.question = session['question']
+        self.question_words = split_words(self.question)
+        self.pair_spec = session.get('pairs') or self.pair_spec
+        self.session_key = session.get('session') or uuid.uuid4().hex
+        self.plan = PairPlan.from_spec(self.question_words, self.pair_spec)
+        self.const_spl = self.plan.nodes
+        self.graph = session['graph']
+        self.keyword_index = KeywordIndex.from_graph(self.graph)
+        self.thought_index = ThoughtIndex.from_graph(self.graph)
+        self.graph_layout = LayeredLayout.from_graph(self.graph)
+        self.search_matches = set()
+        self.connection_history = [
+            edge_id for edge_id in range(len(self.graph)) if self.graph.edge(edge_id).thought
+        ]
+        self.commands.clear()  # 복원 시점 이전으로는 되돌리지 않음
+        
+        self.query_one("#question-input", Input).value = self.question
+        if rebuild_tree:
+            self.update_tree()
+        self.update_history_table()
         
-        # UI 상태 업데이트
-        question_input.disabled = True
+        self.current_phase = "collecting"
+        if session['current_index'] is None:
+            self.current_index = len(self.const_spl)
+        else:
+            self.current_index = session['current_index']
+        self.enable_mapping_controls()
+        self.start_next_parent(session['current_child_index'])
+        self.notify(f"↻ 이전 세션 복원: {len(self.graph)}개 연결")
+    
+    def load_session(self, path: str):
+        """저장된 mindmap_*.json / .gmb 불러오기 - 워커 스레드에서 스트리밍 파싱"""
+        self.journal.clear()
+        self.graph = MindGraph()
+        self.question = ""
+        self.update_tree()
+        
+        self.query_one("#question-input").disabled = True
+        self.query_one("#start-btn").disabled = True
+        self.update_status(f"📂 불러오는 중... {path}", "warning")
+        
+        self.run_worker(
+            partial(self.load_worker, path),
+            name="load", group="load", thread=True, exit_on_error=False
+        )
+    
+    def load_worker(self, path: str):
+        """워커 스레드 - 부모 항목을 묶음으로 UI 스레드에 전달"""
+        reader = open_reader(path)
+        try:
+            for batch in reader.batches():
+                self.call_from_thread(self.load_batch, batch, reader.meta.get('question', ''))
+        finally:
+            reader.close()  # meta / progress() 는 닫은 뒤에도 쓸 수 있다
+        return reader
+    
+    def load_batch(self, batch: list, question: str):
+        """불러온 부모 항목 묶음을 그래프/트리에 추가 (첫 묶음부터 바로 표시)"""
+        if not self.question:
+            self.question = question
+            self.query_one("#question-input", Input).value = question
+        
+        for top_item in batch:
+            self.graph.add_structure_item(top_item)
+            if top_item:
+                self.add_tree_parent(top_item[0], populate=False)
+        
+        self.update_status(f"📂 불러오는 중... {len(self.graph)}개 연결", "warning")
+    
+    def finish_load(self, reader: MindMapReader):
+        """불러오기 완료 - 저장 당시 위치에서 이어서 진행"""
+        current_index, current_child_index = reader.progress() or (None, 0)
+        self.resume_session({
+            'question': reader.meta.get('question', ''),
+            'pairs': reader.meta.get('pairs'),
+            'session': reader.meta.get('session'),  # 저장소의 같은 맵을 계속 덮어쓰도록
+            'graph': self.graph,
+            'current_index': current_index,
+            'current_child_index': current_child_index,
+        }, rebuild_tree=False)
+        self.checkpoint_journal()
+    
+    def enable_mapping_controls(self):
+        """매핑 중 UI 상태"""
+        self.query_one("#question-input").disabled = True
         self.query_one("#start-btn").disabled = True
         self.query_one("#next-btn").disabled = False
         self.query_one("#skip-btn").disabled = False
-        self.query_one("#undo-btn").disabled = False
         self.query_one("#notes-textarea").disabled = False
-        
-        # 첫 단계 시작
-        self.start_next_parent()
+        self.update_undo_buttons()
+    
+    def update_undo_buttons(self):
+        self.query_one("#undo-btn").disabled = not self.commands.can_undo()
+        self.query_one("#redo-btn").disabled = not self.commands.can_redo()
     
-    def start_next_parent(self):
-        """다음 부모 노드 처리 시작"""
+    def start_next_parent(self, child_index: int = 0, before: tuple = None):
+        """다음 부모 노드 처리 시작
+        
+        before 는 부모를 끝낸 직후의 위치 - 주어지면 부모 전환을 되돌릴 수 있는 명령으로 기록
+        """
         if self.current_index >= len(self.const_spl):
+            if before is not None:
+                self.commands.record(ADVANCE, *before)
             self.complete_mapping()
             return
         
         self.current_parent = self.const_spl[self.current_index]
-        self.current_Y = [self.current_parent]
-        self.remaining_children = [w for w in self.const_spl if w != self.current_parent]
-        self.current_child_index = 0
+        new_parent = not self.graph.has_parent(self.current_parent)
+        if before is not None:
+            self.commands.record(PARENT if new_parent else ADVANCE, *before)
+        self.graph.add_parent(self.current_parent)
+        if new_parent:
+            self.graph_layout.add_parent(self.current_parent)
+        self.write_journal("p", self.current_parent)
+        self.add_tree_parent(self.current_parent)
+        self.remaining_children = self.plan.children(self.current_index)
+        self.current_child_index = child_index
         
         self.prompt_next_relation()
     
     def prompt_next_relation(self):
         """다음 관계 입력 프롬프트"""
         if self.current_child_index >= len(self.remaining_children):
-            # 현재 부모 노드 완료
-            self.X.append(self.current_Y)
-            self.update_tree()
+            # 현재 부모 노드 완료 (트리는 이미 동기화됨)
+            before = (self.current_index, self.current_child_index)
             self.current_index += 1
-            self.start_next_parent()
+            self.start_next_parent(before=before)
             return
         
         current_child = self.remaining_children[self.current_child_index]
@@ -295,8 +637,10 @@ class MindMapApp(App):
         relation_text = f"💭 '{self.current_parent}' ↔ '{current_child}' 의 관계를 설명하세요:"
         self.query_one("#relation-label").update(relation_text)
         
+        done = self.plan.done_before(self.current_index) + self.current_child_index
         self.update_status(
-            f"진행 중... ({self.current_child_index + 1}/{len(self.remaining_children)} 관계)",
+            f"진행 중... ({self.current_child_index + 1}/{len(self.remaining_children)} 관계"
+            f" · 전체 {done + 1}/{self.plan.total})",
             "success"
         )
         
@@ -304,73 +648,132 @@ class MindMapApp(App):
         text_area = self.query_one("#notes-textarea", TextArea)
         text_area.clear()
         text_area.focus()
+        self.update_undo_buttons()
     
+    @timed("MindMapApp.process_current")
     def process_current(self):
         """현재 입력 처리"""
         text_area = self.query_one("#notes-textarea", TextArea)
         notes = text_area.text.strip()
         
+        current_child = self.remaining_children[self.current_child_index]
+        self.commands.record(EDGE if notes else MOVE, self.current_index, self.current_child_index)
         if notes:
-            current_child = self.remaining_children[self.current_child_index]
-            Z = [s for s in re.split(r"\W+", notes) if s]
+            Z = extract_keywords(notes)
             
             # ✅ 원문 보존
-            connection = {
-                'child': current_child,
-                'raw_thought': notes,  # 원문
-                'keywords': Z
-            }
-            
-            self.current_Y.append(connection)
+            edge_id = self.graph.add_edge(self.current_parent, current_child, notes, Z)
+            self.keyword_index.add(self.graph.edge(edge_id))
+            self.thought_index.add(self.graph.edge(edge_id))
+            self.graph_layout.add_edge(self.current_parent, current_child)
+            self.add_tree_edge(edge_id)
             
             # 히스토리에 추가
-            self.connection_history.append({
-                'from': self.current_parent,
-                'to': current_child,
-                'thought': notes,
-                'keywords': Z
-            })
+            self.connection_history.append(edge_id)
             
-            # 히스토리 테이블 업데이트
-            self.update_history_table()
+            # 히스토리 테이블에 한 행 추가
+            self.append_history_row(edge_id)
             
             self.notify(f"✓ 기록됨: {self.current_parent} → {current_child}")
         
         self.current_child_index += 1
+        if notes:
+            self.write_journal("e", self.current_parent, current_child, notes, Z,
+                     self.current_index, self.current_child_index)
+        else:
+            self.write_journal("n", self.current_index, self.current_child_index)
         self.prompt_next_relation()
+        self.end_command()
     
     def skip_current(self):
         """현재 관계 건너뛰기"""
         current_child = self.remaining_children[self.current_child_index]
         
-        connection = {
-            'child': current_child,
-            'raw_thought': '',
-            'keywords': []
-        }
-        
-        self.current_Y.append(connection)
+        self.commands.record(EDGE, self.current_index, self.current_child_index)
+        edge_id = self.graph.add_edge(self.current_parent, current_child)
+        self.graph_layout.add_edge(self.current_parent, current_child)
+        self.add_tree_edge(edge_id)
         self.notify(f"⊘ 건너뜀: {self.current_parent} → {current_child}")
         
         self.current_child_index += 1
+        self.write_journal("e", self.current_parent, current_child, "", [],
+                 self.current_index, self.current_child_index)
         self.prompt_next_relation()
+        self.end_command()
     
     def undo_last(self):
-        """마지막 입력 되돌리기"""
-        if self.connection_history:
-            last = self.connection_history.pop()
-            
-            # current_Y에서도 제거
-            if len(self.current_Y) > 1:
-                self.current_Y.pop()
-            
-            self.update_history_table()
-            self.notify(f"↶ 되돌림: {last['from']} → {last['to']}")
-            
-            # 이전 단계로
-            if self.current_child_index > 0:
-                self.current_child_index -= 1
-                self.prompt_next_relation()
+        """마지막 명령 되돌리기 - 부모 경계를 넘어서도 되돌린다"""
+        undone = self.commands.undo(self.graph, self.current_index, self.current_child_index)
+        if not undone:
+            return
+        
+        for op, payload, i, j in undone:
+            if op == EDGE:
+                self.keyword_index.remove(payload)
+                self.thought_index.remove(payload)
+                self.graph_layout.remove_edge(payload.parent, payload.child)
+                self.search_matches.discard(payload.id)
+                self.remove_tree_edge(payload.id)
+                if self.connection_history and self.connection_history[-1] == payload.id:
+                    self.connection_history.pop()
+                    self.remove_history_row(payload.id)
+                self.write_journal("u", i, j)
+                self.notify(f"↶ 되돌림: {payload.parent} → {payload.child}")
+            elif op == PARENT:
+                self.graph_layout.remove_parent(payload)
+                self.remove_tree_parent(payload)
+                self.write_journal("x", i, j)
+            else:
+                self.write_journal("n", i, j)
+        
+        self.move_to(i, j)
+        self.end_command()
+    
+    def redo_last(self):
+        """되돌린 명령 다시 적용"""
+        redone = self.commands.redo(self.graph, self.current_index, self.current_child_index)
+        if not redone:
+            return
+        
+        for op, payload, i, j in redone:
+            if op == EDGE:
+                edge = self.graph.edge(payload)
+                self.keyword_index.add(edge)
+                self.thought_index.add(edge)
+                self.graph_layout.add_edge(edge.parent, edge.child)
+                self.add_tree_edge(payload)
+                if edge.thought:
+                    self.connection_history.append(payload)
+                    self.append_history_row(payload)
+                self.write_journal("e", edge.parent, edge.child, edge.thought,
+                                   list(edge.keywords), i, j)
+                self.notify(f"↷ 다시 적용: {edge.parent} → {edge.child}")
+            elif op == PARENT:
+                self.graph_layout.add_parent(payload)
+                self.add_tree_parent(payload)
+                self.write_journal("p", payload)
+                self.write_journal("n", i, j)
+            else:
+                self.write_journal("n", i, j)
+        
+        self.move_to(i, j)
+        self.end_command()
+    
+    def move_to(self, index: int, child_index: int):
+        """undo/redo 후 해당 위치의 관계로 이동 (명령은 기록하지 않음)"""
+        self.current_index = index
+        self.current_child_index = child_index
+        if index >= len(self.const_spl):
+            self.complete_mapping()
+            return
+        
+        if self.current_phase == "complete":
+            self.current_phase = "collecting"
+            self.enable_mapping_controls()
+        self.current_parent = self.const_spl[index]
+        self.add_tree_parent(self.current_parent)
+        self.remaining_children = self.plan.children(index)
+        self.prompt_next_relation()
     
     def complete_mapping(self):
         """매핑 완료"""
@@ -379,68 +782,132 @@ class MindMapApp(App):
         self.query_one("#notes-textarea").disabled = True
         self.query_one("#next-btn").disabled = True
         self.query_one("#skip-btn").disabled = True
-        self.query_one("#undo-btn").disabled = True
         self.query_one("#save-btn").disabled = False
+        self.update_undo_buttons()
         
         self.update_status("✨ 완성! 저장할 수 있습니다.", "success")
         self.query_one("#progress-label").update("")
         self.query_one("#relation-label").update("")
         
-        self.update_tree()
         self.notify("🎉 마인드맵 생성 완료!")
     
+    @timed("MindMapApp.update_tree")
     def update_tree(self):
-        """트리 UI 업데이트 - 원문 프리뷰 포함"""
+        """트리 UI 전체 재구성 - 불러오기/초기화 때만 사용"""
         tree = self.query_one("#mindmap-tree", Tree)
         tree.clear()
+        self.parent_nodes = {}
+        self.edge_nodes = {}
+        self.loaded_parents = set()
         
-        root = tree.root
-        root.expand()
+        tree.root.expand()
         
-        for top_item in self.X:
-            if not top_item:
-                continue
-                
-            top_node = top_item[0]
-            top_branch = root.add(f"🔵 {top_node}", expand=True)
-            
-            for connection in top_item[1:]:
-                if not isinstance(connection, dict):
-                    continue
-                
-                child = connection['child']
-                thought = connection['raw_thought']
-                keywords = connection['keywords']
-                
-                # 생각 프리뷰 (첫 30자)
-                preview = thought[:30] + "..." if len(thought) > 30 else thought
-                
-                if thought:
-                    # 생각이 있으면 상세 표시
-                    mid_branch = top_branch.add(f"🟡 {child}", expand=False)
-                    mid_branch.add_leaf(f"💭 {preview}")
-                    
-                    # 키워드들
-                    if keywords:
-                        kw_branch = mid_branch.add(f"🔑 Keywords", expand=False)
-                        for kw in keywords[:5]:  # 최대 5개만
-                            kw_branch.add_leaf(f"🟢 {kw}")
-                else:
-                    # 생각 없음 (스킵)
-                    top_branch.add_leaf(f"⊘ {child}")
+        # 부모 브랜치만 만들고 자식은 펼칠 때 생성
+        for top_node in self.graph.parents():
+            self.add_tree_parent(top_node, populate=False)
+    
+    def add_tree_parent(self, parent: str, populate: bool = True):
+        """부모 노드 브랜치 추가 (이미 있으면 기존 노드 사용)"""
+        top_branch = self.parent_nodes.get(parent)
+        if top_branch is None:
+            tree = self.query_one("#mindmap-tree", Tree)
+            tree.root.expand()
+            top_branch = tree.root.add(f"🔵 {parent}", data=("parent", parent), expand=False)
+            self.parent_nodes[parent] = top_branch
+            if populate:
+                self.loaded_parents.add(parent)
+                top_branch.expand()
+        elif populate and parent not in self.loaded_parents:
+            # 복원된 맵에서 접혀 있던 부모를 이어서 진행하는 경우
+            self.populate_tree_parent(parent)
+            top_branch.expand()
+        return top_branch
+    
+    def populate_tree_parent(self, parent: str):
+        """접혀 있던 부모 브랜치의 연결 노드 생성"""
+        if parent in self.loaded_parents:
+            return
+        self.loaded_parents.add(parent)
+        for edge_id in self.graph.edge_ids(parent):
+            self.add_tree_edge(edge_id)
+    
+    def add_tree_edge(self, edge_id: int):
+        """연결 하나를 부모 브랜치에 추가 - 프리뷰/키워드는 펼칠 때 생성"""
+        edge = self.graph.edge(edge_id)
+        top_branch = self.add_tree_parent(edge.parent)
+        if edge.parent not in self.loaded_parents:
+            return
+        
+        if edge.thought:
+            # 생각이 있으면 상세 표시 (펼치면 원문 프리뷰 + 키워드)
+            mid_branch = top_branch.add(self.edge_label(edge), data=("edge", edge_id), expand=False)
+        else:
+            # 생각 없음 (스킵)
+            mid_branch = top_branch.add_leaf(self.edge_label(edge))
+        
+        self.edge_nodes[edge_id] = mid_branch
     
+    def edge_label(self, edge) -> str:
+        """연결 노드 라벨 (검색에 걸리면 강조)"""
+        label = f"🟡 {edge.child}" if edge.thought else f"⊘ {edge.child}"
+        if edge.id in self.search_matches:
+            label = f"[reverse]{label}[/]"
+        return label
+    
+    def remove_tree_edge(self, edge_id: int):
+        """연결 하나에 해당하는 노드만 제거"""
+        node = self.edge_nodes.pop(edge_id, None)
+        if node is not None:
+            node.remove()
+    
+    def remove_tree_parent(self, parent: str):
+        """(연결이 없는) 부모 브랜치 제거"""
+        node = self.parent_nodes.pop(parent, None)
+        self.loaded_parents.discard(parent)
+        if node is not None:
+            node.remove()
+    
+    def history_row(self, edge_id: int):
+        """히스토리 테이블의 한 행 (From, To, Thought)"""
+        item = self.graph.edge(edge_id)
+        thought_preview = item.thought[:40] + "..." if len(item.thought) > 40 else item.thought
+        style = "reverse" if edge_id in self.search_matches else ""
+        return (
+            Text(item.parent, style=style),
+            Text(item.child, style=style),
+            Text(thought_preview, style=style)
+        )
+    
+    @timed("MindMapApp.update_history_table")
     def update_history_table(self):
-        """히스토리 테이블 업데이트"""
-        table = self.query_one("#history-table", DataTable)
+        """히스토리 테이블 전체 다시 채우기 (세션 복원/불러오기 때만)"""
+        table = self.query_one("#history-table", HistoryTable)
         table.clear()
         
-        for item in self.connection_history[-10:]:  # 최근 10개만
-            thought_preview = item['thought'][:40] + "..." if len(item['thought']) > 40 else item['thought']
-            table.add_row(
-                item['from'],
-                item['to'],
-                thought_preview
-            )
+        for edge_id in self.connection_history:
+            table.add_row(*self.history_row(edge_id), key=str(edge_id))
+        table.call_after_refresh(table.scroll_end, animate=False)
+    
+    @timed("MindMapApp.append_history_row")
+    def append_history_row(self, edge_id: int):
+        """새 입력 한 행만 추가하고 맨 아래로 스크롤"""
+        table = self.query_one("#history-table", HistoryTable)
+        table.add_row(*self.history_row(edge_id), key=str(edge_id))
+        table.call_after_refresh(table.scroll_end, animate=False)
+    
+    def remove_history_row(self, edge_id: int):
+        """되돌린 입력의 행만 제거 (항상 마지막 행이라 O(1))"""
+        self.query_one("#history-table", HistoryTable).pop_row(str(edge_id))
+    
+    def refresh_history_rows(self, edge_ids):
+        """검색 강조가 바뀐 행만 다시 그리기"""
+        table = self.query_one("#history-table", HistoryTable)
+        for edge_id in edge_ids:
+            key = str(edge_id)
+            if key not in table.rows:
+                continue  # 생각이 없는 연결 (건너뜀)
+            for column, cell in zip(("from", "to", "thought"), self.history_row(edge_id)):
+                table.update_cell(key, column, cell)
     
     def update_status(self, message: str, style: str = ""):
         """상태 메시지 업데이트"""
@@ -455,118 +922,168 @@ class MindMapApp(App):
         else:
             label.update(message)
     
-    def action_save_graph(self):
-        """그래프 저장 - 원문 포함"""
-        if not self.X:
+    @timed("MindMapApp.action_save_graph")
+    def action_save_graph(self, export: bool = False):
+        """그래프 저장 - 백그라운드 스레드에서 스냅샷을 저장
+        
+        --segments 면 바뀐 부모의 조각만 쓰고, 전체 파일은 export 때만 쓴다.
+        """
+        if not self.graph:
             self.notify("저장할 데이터가 없습니다!", severity="warning")
             return
         
+        # 저장 중이면 끝난 뒤 한 번만 다시 저장 (연속 Ctrl+S 병합)
+        if self.save_running:
+            self.save_pending = True
+            self.export_pending = self.export_pending or export
+            self.update_status("⏳ 저장 중... 완료 후 최신 상태로 다시 저장합니다", "warning")
+            return
+        
+        self.start_save(export)
+    
+    def action_export_graph(self):
+        """전체 파일 내보내기 (CSV / DOT / GMB / JSON / SVG) - --segments 가 아니면 저장과 같다"""
+        self.action_save_graph(export=True)
+    
+    def start_save(self, export: bool = False):
+        """스냅샷을 떠서 저장 워커 시작"""
+        self.save_running = True
+        self.save_pending = False
+        self.export_pending = False
+        
+        full = export or not self.segments_dir  # 전체 파일까지 쓰는지
+        snapshot = self.graph.snapshot()
+        layout = self.graph_layout.snapshot() if full else None  # 바뀐 rank 만 다시 배치
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # CSV 저장 (원문 포함)
-        csv_filename = f"mindmap_{timestamp}.csv"
-        self.save_csv_with_thoughts(csv_filename)
+        progress = (self.current_index, self.current_child_index)
+        # 증분 내보내기면 지난 저장 이후 바뀐 부모만 넘긴다
+        self.save_dirty = self.graph.take_dirty() if self.segments_dir else None
+        
+        self.run_worker(
+            partial(self.save_worker, snapshot, self.question, timestamp, progress, self.pair_spec,
+                    layout, self.save_dirty, self.session_key, full),
+            name="save", group="save", thread=True, exit_on_error=False
+        )
+    
+    @timed("MindMapApp.save_worker")
+    def save_worker(self, graph, question: str, timestamp: str, progress: tuple, pairs: str,
+                    layout=None, dirty=None, session: str = None, full: bool = True):
+        """워커 스레드 - (증분 조각) / CSV / DOT / GMB / JSON / SVG (/ SQLite) 순서로 저장
+        
+        full 이 아니면 전체 파일은 건너뛴다 - 저장 비용이 맵 크기가 아니라 수정량에 비례
+        """
+        suffix = self.save_suffix  # 압축 확장자면 atomic_open 이 압축 스레드로 쓴다
+        csv_filename = f"mindmap_{timestamp}.csv{suffix}"
+        json_filename = f"mindmap_{timestamp}.json{suffix}"
+        dot_filename = f"mindmap_{timestamp}.dot{suffix}"
+        session_filename = f"mindmap_{timestamp}.gmb{suffix}"
+        svg_filename = f"mindmap_{timestamp}.svg{suffix}"
+        
+        steps = []
+        if self.segments_dir:
+            # CSV / DOT 는 바뀐 부모의 조각만 다시 쓴다 (segments.py 로 합칠 수 있음)
+            steps.append((self.segments_dir,
+                          lambda: SegmentExport(self.segments_dir).update(graph, dirty, question)))
         
-        # JSON 저장 (완전한 구조)
-        json_filename = f"mindmap_{timestamp}.json"
-        self.save_json(json_filename)
+        if full:
+            steps += [
+                # CSV 저장 (원문 포함)
+                (csv_filename, lambda: exporters.save_csv_with_thoughts(graph, csv_filename)),
+                # DOT 저장 (시각화용)
+                (dot_filename, lambda: exporters.save_dot_with_thoughts(graph, dot_filename)),
+                # 바이너리 세션 (불러오기/이어서 하기용)
+                (session_filename,
+                 lambda: save_binary(graph, question, session_filename, progress, pairs, session)),
+                # JSON 저장 (완전한 구조, 다른 도구와 교환용)
+                (json_filename,
+                 lambda: exporters.save_json(graph, question, json_filename, progress, pairs,
+                                             session)),
+                # SVG 저장 (내장 렌더러, Graphviz 불필요)
+                (svg_filename, lambda: save_svg(graph, svg_filename, layout)),
+            ]
         
-        # DOT 저장 (시각화용)
-        dot_filename = f"mindmap_{timestamp}.dot"
-        self.save_dot_with_thoughts(dot_filename)
+        if self.db_path:
+            # SQLite 저장소 (맵 하나 = 트랜잭션 하나)
+            steps.append((self.db_path,
+                          lambda: self.save_to_store(graph, question, timestamp, pairs, session)))
         
-        self.notify(f"💾 저장 완료!\n{csv_filename}\n{json_filename}\n{dot_filename}", 
-                   severity="information")
-        self.update_status(f"✓ 파일 저장됨", "success")
+        for step, (filename, save) in enumerate(steps, 1):
+            self.call_from_thread(
+                self.update_status, f"💾 저장 중... ({step}/{len(steps)}) {filename}"
+            )
+            save()
+        
+        return [filename for filename, _ in steps]
     
-    def save_csv_with_thoughts(self, filename: str):
-        """CSV 파일로 저장 - 원문 포함"""
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['from', 'to', 'label', 'thought', 'keywords'])
-            
-            for top_item in self.X:
-                top_node = top_item[0]
-                
-                for connection in top_item[1:]:
-                    if not isinstance(connection, dict):
-                        continue
-                    
-                    child = connection['child']
-                    thought = connection['raw_thought']
-                    keywords = ', '.join(connection['keywords'][:5])
-                    
-                    writer.writerow([
-                        top_node,
-                        child,
-                        child,
-                        thought,
-                        keywords
-                    ])
-    
-    def save_json(self, filename: str):
-        """JSON 파일로 저장 - 완전한 구조"""
-        data = {
-            'version': '2.0',
-            'question': self.question,
-            'timestamp': datetime.now().isoformat(),
-            'structure': self.X,
-            'connection_history': self.connection_history
-        }
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    
-    def save_dot_with_thoughts(self, filename: str):
-        """DOT 파일로 저장 - 툴팁에 원문 포함"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write('digraph G {\n')
-            f.write('  rankdir=LR;\n')
-            f.write('  node [shape=box, fontname="Malgun Gothic"];\n\n')
-            
-            for top_item in self.X:
-                top_node = top_item[0]
-                
-                for connection in top_item[1:]:
-                    if not isinstance(connection, dict):
-                        continue
-                    
-                    child = connection['child']
-                    thought = connection['raw_thought'].replace('"', '\\"')
-                    
-                    edge_label = f"{top_node}_{child}"
-                    
-                    # 노드 연결 (툴팁에 원문)
-                    f.write(f'  "{top_node}" -> "{child}" [\n')
-                    f.write(f'    label="",\n')
-                    if thought:
-                        f.write(f'    tooltip="{thought}",\n')
-                    f.write(f'  ];\n')
-                    
-                    # 키워드 노드들
-                    for kw in connection['keywords'][:3]:
-                        f.write(f'  "{child}" -> "{kw}" [style=dashed];\n')
-                    
-                    f.write('\n')
+    def save_to_store(self, graph, question: str, timestamp: str, pairs: str, session: str = None):
+        """워커 스레드 - SQLite 저장소에 맵 저장 (연결은 이 스레드에서 열고 닫는다)
+        
+        같은 세션은 처음 저장한 맵 하나를 계속 덮어쓴다.
+        """
+        with MindStore(self.db_path) as store:
+            store.save_map(graph, question, timestamp=timestamp,
+                           source=f"mindmap_{timestamp}", pairs=pairs, session=session)
+    
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """저장/불러오기 워커 완료/실패 처리"""
+        if event.worker.group == "load":
+            if event.state == WorkerState.SUCCESS:
+                self.finish_load(event.worker.result)
+            elif event.state == WorkerState.ERROR:
+                self.notify(f"불러오기 실패: {event.worker.error}", severity="error")
+                self.action_reset()
+            return
+        
+        if event.worker.group != "save":
+            return
+        
+        if event.state == WorkerState.SUCCESS:
+            filenames = "\n".join(event.worker.result)
+            self.notify(f"💾 저장 완료!\n{filenames}", severity="information")
+            self.update_status(f"✓ 파일 저장됨", "success")
+            self.save_dirty = None
             
-            f.write('}\n')
+            # 저장이 끝난 완성 세션은 더 이상 복구할 필요 없음
+            if self.current_phase == "complete" and not self.save_pending:
+                self.journal.clear()
+        elif event.state == WorkerState.ERROR:
+            self.notify(f"저장 실패: {event.worker.error}", severity="error")
+            if self.save_dirty is not None:
+                # 조각에 반영되지 않은 부모는 다음 저장 때 다시 쓴다
+                self.graph.mark_dirty(self.save_dirty)
+                self.save_dirty = None
+            self.update_status(f"❌ 저장 실패", "error")
+        else:
+            return
+        
+        self.save_running = False
+        if self.save_pending:
+            self.start_save(self.export_pending)
     
     def action_reset(self):
         """초기화"""
-        self.X = []
+        self.journal.clear()
+        self.graph = MindGraph()
+        self.keyword_index = KeywordIndex()
+        self.thought_index = ThoughtIndex()
+        self.graph_layout = LayeredLayout()
+        self.search_matches = set()
         self.question = ""
+        self.session_key = None
         self.question_words = []
         self.const_spl = []
-        self.current_Y = []
         self.current_index = 0
         self.current_child_index = 0
         self.remaining_children = []
         self.current_phase = "init"
         self.connection_history = []
+        self.commands.clear()
         
         # UI 초기화
         self.query_one("#question-input", Input).value = ""
         self.query_one("#question-input").disabled = False
+        self.query_one("#search-input", Input).value = ""
         self.query_one("#notes-textarea", TextArea).clear()
         self.query_one("#notes-textarea").disabled = True
         
@@ -574,6 +1091,7 @@ class MindMapApp(App):
         self.query_one("#next-btn").disabled = True
         self.query_one("#skip-btn").disabled = True
         self.query_one("#undo-btn").disabled = True
+        self.query_one("#redo-btn").disabled = True
         self.query_one("#save-btn").disabled = True
         
         self.query_one("#status-label").update("시작하려면 질문을 입력하세요")
@@ -584,9 +1102,12 @@ class MindMapApp(App):
         tree = self.query_one("#mindmap-tree", Tree)
         tree.clear()
         tree.root.set_label("Mindmap")
+        self.parent_nodes = {}
+        self.edge_nodes = {}
+        self.loaded_parents = set()
         
         # 히스토리 테이블 초기화
-        table = self.query_one("#history-table", DataTable)
+        table = self.query_one("#history-table", HistoryTable)
         table.clear()
         
         self.query_one("#question-input").focus()
@@ -605,8 +1126,58 @@ class MindMapApp(App):
         else:
             history_container.display = False
             history_title.display = False
+    
+    def action_toggle_perf(self):
+        """계측 패널 토글 (히스토리 패널 아래)"""
+        self.show_perf = not self.show_perf
+        self.query_one("#perf-container").display = self.show_perf
+        self.query_one("#perf-title").display = self.show_perf
+        
+        if self.show_perf:
+            self.refresh_perf_table()
+            # 표 위젯에 건다 (앱이 닫힌 뒤 #perf-table 을 찾지 않게)
+            self.perf_timer = self.query_one("#perf-table").set_interval(1.0, self.refresh_perf_table)
+        elif self.perf_timer is not None:
+            self.perf_timer.stop()
+            self.perf_timer = None
+    
+    def refresh_perf_table(self):
+        """계측 결과 표 다시 채우기 (총 시간 순)"""
+        table = self.query_one("#perf-table", DataTable)
+        table.clear()
+        if not profiler.enabled:
+            table.add_row("계측 꺼짐 (--profile 또는 GRIDMIND_PROFILE=1)", "", "", "", "")
+            return
+        for name, count, total, mean, longest in profiler.summary():
+            table.add_row(name, str(count), f"{total:.1f}", f"{mean:.2f}", f"{longest:.1f}")
 
 
 if __name__ == "__main__":
-    app = MindMapApp()
+    # python gridmind_textual_v2.py [mindmap_YYYYmmdd_HHMMSS.json] [--pairs undirected,topk=8]
+    parser = argparse.ArgumentParser(description="Mind Mapper TUI v2")
+    parser.add_argument("load", nargs="?",
+                        help="이어서 진행할 mindmap_*.json 또는 .gmb (.gz/.xz/.bz2 압축 가능)")
+    parser.add_argument("--pairs", default="all",
+                        help="짝 전략: all, undirected, unique|merge, distinct, topk=K, window=W (쉼표로 조합)")
+    parser.add_argument("--db", help="저장할 때 이 SQLite 파일에도 저장 (store.py)")
+    parser.add_argument("--segments", metavar="DIR",
+                        help="Ctrl+S 는 이 디렉터리의 부모별 CSV/DOT 조각만 증분 저장,"
+                             " 전체 파일은 Ctrl+E (segments.py)")
+    parser.add_argument("--compress", choices=["gz", "xz", "bz2"],
+                        help="저장 파일을 압축 (백그라운드 스레드에서 스트리밍 압축)")
+    parser.add_argument("--strip-particles", action="store_true",
+                        help="키워드에서 한국어 조사 떼기 (GRIDMIND_STRIP_PARTICLES=1 과 같음)")
+    parser.add_argument("--profile", action="store_true",
+                        help="핫 패스 계측 켜기 (Ctrl+T 패널, GRIDMIND_PROFILE=1 과 같음)")
+    parser.add_argument("--trace", metavar="FILE",
+                        help="끝날 때 Chrome trace JSON 저장 (--profile 포함)")
+    args = parser.parse_args()
+    if args.strip_particles:
+        set_strip_particles(True)
+    if args.profile or args.trace:
+        profiler.enable()
+    
+    app = MindMapApp(load_path=args.load, pairs=args.pairs, db_path=args.db,
+                     segments_dir=args.segments, compress=args.compress,
+                     trace_path=args.trace or os.environ.get(TRACE_ENV_VAR))
     app.run()
@@ -0,0 +1,118 @@
+"""
+성능 계측 (선택) - 핫 패스의 호출 수와 시간
+
+TUI 가 느려질 때 시간이 화면 재구성, 토큰화, 파일 쓰기 중 어디에 쓰였는지 본다.
+GRIDMIND_PROFILE=1 이나 --profile 로 켠다. 꺼져 있으면 @timed 함수는 플래그만 보고
+바로 원래 함수를 부른다. 켜져 있으면 이름별 (호출 수, 총 시간, 최대 시간)을 모으고,
+최근 호출들을 Chrome trace 이벤트로 남긴다 (chrome://tracing, Perfetto 에서 열림).
+
+    GRIDMIND_PROFILE=1 python gridmind_textual_v2.py         # Ctrl+T 로 계측 패널
+    python gridmind_textual_v2.py --trace trace.json         # 끝날 때 trace 저장 (--profile 포함)
+
+    @timed("exporters.save_json")
+    def save_json(...): ...
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+ENV_VAR = 'GRIDMIND_PROFILE'
+TRACE_ENV_VAR = 'GRIDMIND_TRACE'  # 끝날 때 Chrome trace 를 저장할 파일
+MAX_EVENTS = 100_000  # trace 에 남기는 최근 호출 수
+
+
+class Profiler:
+    """이름별 호출 수 / 총 시간 / 최대 시간 + 최근 호출 이벤트"""
+
+    def __init__(self, enabled: bool = False, max_events: int = MAX_EVENTS):
+        self.enabled = enabled
+        self.stats = {}  # 이름 → [호출 수, 총 ns, 최대 ns]
+        self.events = deque(maxlen=max_events)  # (이름, 시작 ns, 길이 ns, 스레드 ID)
+        self._lock = threading.Lock()  # 저장 워커 스레드에서도 기록한다
+        self._origin = time.perf_counter_ns()
+
+    def enable(self, enabled: bool = True):
+        self.enabled = enabled
+
+    def reset(self):
+        with self._lock:
+            self.stats = {}
+            self.events.clear()
+
+    def record(self, name: str, start: int, duration: int):
+        with self._lock:
+            stat = self.stats.get(name)
+            if stat is None:
+                stat = self.stats[name] = [0, 0, 0]
+            stat[0] += 1
+            stat[1] += duration
+            if duration > stat[2]:
+                stat[2] = duration
+            self.events.append((name, start, duration, threading.get_ident()))
+
+    @contextmanager
+    def span(self, name: str):
+        """with profiler.span("이름"): ... - 함수가 아닌 구간 계측"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter_ns() - start)
+
+    def timed(self, name: str = None):
+        """함수 계측 데코레이터 (name 이 없으면 함수의 qualname)"""
+        def decorator(func):
+            label = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter_ns()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(label, start, time.perf_counter_ns() - start)
+            return wrapper
+        return decorator
+
+    def summary(self):
+        """(이름, 호출 수, 총 ms, 평균 ms, 최대 ms) - 총 시간 내림차순"""
+        with self._lock:
+            stats = [(name, *stat) for name, stat in self.stats.items()]
+        rows = [
+            (name, count, total / 1e6, total / count / 1e6, longest / 1e6)
+            for name, count, total, longest in stats
+        ]
+        rows.sort(key=lambda row: -row[2])
+        return rows
+
+    def chrome_trace(self) -> dict:
+        """Chrome trace 형식 (완료 이벤트 'X', 시간 단위 µs)"""
+        pid = os.getpid()
+        with self._lock:
+            events = list(self.events)
+        return {
+            'traceEvents': [
+                {'name': name, 'cat': name.split('.', 1)[0], 'ph': 'X', 'pid': pid, 'tid': tid,
+                 'ts': (start - self._origin) / 1000, 'dur': duration / 1000}
+                for name, start, duration, tid in events
+            ],
+            'displayTimeUnit': 'ms',
+        }
+
+    def dump_trace(self, filename: str):
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f)
+
+
+profiler = Profiler(enabled=os.environ.get(ENV_VAR, '') not in ('', '0')
+                    or bool(os.environ.get(TRACE_ENV_VAR)))
+timed = profiler.timed
@@ -0,0 +1,185 @@
+"""
+세션 저널 (write-ahead log) - 진행 중인 마인드맵을 크래시에서 복구
+
+입력 하나마다 짧은 JSON 한 줄을 추가하고, fsync 는 여러 기록을 모아서 한 번에 한다.
+입력이 멈춰도 남은 기록은 sync_interval 안에 fsync 된다 (앱 타이머가 sync 를 부른다).
+checkpoint / close 때도 먼저 fsync 한다.
+일정 개수마다 전체 상태를 checkpoint 파일로 남기고 저널을 비운다.
+복구는 checkpoint 를 읽은 뒤 그 이후의 기록만 다시 적용한다.
+
+기록 형식: [seq, op, ...]
+    ["q", question, pairs, session]                새 세션 시작 (pairs: 짝 전략 스펙, session: 저장 키)
+    ["p", parent]                                  부모 노드 시작
+    ["e", parent, child, thought, keywords, i, j]  연결 추가 (스킵은 thought 가 빈 문자열)
+    ["n", i, j]                                    빈 입력으로 다음 관계로 이동
+    ["u", i, j]                                    마지막 연결 되돌리기
+    ["x", i, j]                                    연결 없는 마지막 부모 되돌리기
+i, j 는 기록 직후의 current_index / current_child_index
+"""
+import json
+import os
+import time
+
+import exporters
+from mindgraph import MindGraph
+
+DEFAULT_JOURNAL = ".mindmap_session.journal"
+
+
+class Journal:
+    """fsync 를 묶어서 하는 append-only 세션 저널"""
+
+    def __init__(self, path: str = DEFAULT_JOURNAL, sync_every: int = 32,
+                 sync_interval: float = 1.0, checkpoint_every: int = 500):
+        self.path = path
+        self.checkpoint_path = path + ".checkpoint"
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.checkpoint_every = checkpoint_every
+
+        self.seq = 0
+        self._file = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._since_checkpoint = 0
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+    def _open(self):
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        return self._file
+
+    def append(self, op: str, *args) -> bool:
+        """기록 하나 추가. checkpoint 할 때가 되면 True 반환"""
+        self.seq += 1
+        f = self._open()
+        f.write(json.dumps([self.seq, op, *args], ensure_ascii=False, separators=(',', ':')))
+        f.write('\n')
+        f.flush()  # 프로세스가 죽어도 OS 버퍼에는 남는다
+
+        self._unsynced += 1
+        if (self._unsynced >= self.sync_every
+                or time.monotonic() - self._last_sync >= self.sync_interval):
+            self.sync()
+
+        self._since_checkpoint += 1
+        return self._since_checkpoint >= self.checkpoint_every
+
+    def sync(self):
+        """모아 둔 기록을 디스크에 fsync (남은 기록이 없으면 아무것도 안 함)"""
+        if self._file is not None and self._unsynced:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def checkpoint(self, state: dict):
+        """전체 상태를 checkpoint 로 남기고 저널을 비움"""
+        self.sync()
+        state = dict(state, seq=self.seq)
+        with exporters.atomic_open(self.checkpoint_path) as f:
+            json.dump(state, f, ensure_ascii=False, separators=(',', ':'))
+
+        # checkpoint 이후에 크래시가 나도 seq 로 중복 적용을 막는다
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        open(self.path, 'w').close()
+        self._since_checkpoint = 0
+
+    def clear(self):
+        """세션 종료 - 저널과 checkpoint 삭제"""
+        self.close()
+        for path in (self.path, self.checkpoint_path):
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+        self.seq = 0
+        self._since_checkpoint = 0
+
+    def close(self):
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    # ------------------------------------------------------------------
+    # 복구
+    # ------------------------------------------------------------------
+    def load(self):
+        """(checkpoint 상태 또는 None, checkpoint 이후 기록 목록)"""
+        state = None
+        try:
+            with open(self.checkpoint_path, encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            pass
+
+        base_seq = state['seq'] if state else 0
+        records = []
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # 크래시로 잘린 마지막 줄
+                    if record[0] > base_seq:
+                        records.append(record)
+        except FileNotFoundError:
+            pass
+
+        self.seq = records[-1][0] if records else base_seq
+        return state, records
+
+    def restore(self):
+        """checkpoint + 저널 재생으로 세션 복원 (없으면 None)
+
+        반환값: {'question', 'pairs', 'session', 'graph', 'current_index', 'current_child_index'}
+        """
+        state, records = self.load()
+        if state is None and not records:
+            return None
+
+        if state is None:
+            session = {'question': '', 'pairs': 'all', 'session': None, 'graph': MindGraph(),
+                       'current_index': 0, 'current_child_index': 0}
+        else:
+            session = {
+                'question': state['question'],
+                'pairs': state.get('pairs', 'all'),
+                'session': state.get('session'),
+                'graph': MindGraph.from_structure(state['structure']),
+                'current_index': state['current_index'],
+                'current_child_index': state['current_child_index'],
+            }
+
+        graph = session['graph']
+        for record in records:
+            op = record[1]
+            if op == 'q':
+                graph = session['graph'] = MindGraph()
+                session['question'] = record[2]
+                session['pairs'] = record[3] if len(record) > 3 else 'all'
+                session['session'] = record[4] if len(record) > 4 else None
+                session['current_index'] = session['current_child_index'] = 0
+            elif op == 'p':
+                graph.add_parent(record[2])
+            elif op == 'e':
+                _, _, parent, child, thought, keywords, i, j = record
+                graph.add_edge(parent, child, thought, keywords)
+                session['current_index'], session['current_child_index'] = i, j
+            elif op == 'n':
+                session['current_index'], session['current_child_index'] = record[2], record[3]
+            elif op == 'u':
+                graph.pop_edge()
+                session['current_index'], session['current_child_index'] = record[2], record[3]
+            elif op == 'x':
+                graph.pop_parent()
+                session['current_index'], session['current_child_index'] = record[2], record[3]
+
+        self._since_checkpoint = len(records)
+        return session if session['question'] else None
@@ -0,0 +1,106 @@
+"""
+키워드 역색인 - 키워드 → 연결 ID
+
+연결이 추가/되돌려질 때마다 같이 갱신해서, 검색할 때 그래프 전체를 훑지 않는다.
+대소문자는 구분하지 않는다 (casefold).
+"""
+import sys
+from array import array
+from bisect import bisect_left
+
+from tokenizer import extract_keywords
+
+
+class KeywordIndex:
+    """키워드 → 연결 ID 목록 (ID 는 추가된 순서로 정렬되어 있음)"""
+
+    def __init__(self):
+        self._postings = {}
+        self._edge_keys = {}  # 연결 ID → 키워드들 (접두어 필터용)
+        self._sorted_keys = []
+        self._keys_dirty = False
+
+    @classmethod
+    def from_graph(cls, graph):
+        index = cls()
+        for edge_id in range(len(graph)):
+            index.add(graph.edge(edge_id))
+        return index
+
+    def __len__(self):
+        """색인된 키워드 수"""
+        return len(self._postings)
+
+    def add(self, edge):
+        keys = tuple({sys.intern(kw.casefold()) for kw in edge.keywords})
+        self._edge_keys[edge.id] = keys
+        for key in keys:
+            ids = self._postings.get(key)
+            if ids is None:
+                ids = self._postings[key] = array('l')
+                self._keys_dirty = True
+            ids.append(edge.id)
+
+    def remove(self, edge):
+        for key in self._edge_keys.pop(edge.id, ()):
+            ids = self._postings.get(key)
+            if not ids:
+                continue
+            # 되돌리기는 항상 마지막 연결이므로 보통 끝에서 바로 빠진다
+            if ids[-1] == edge.id:
+                ids.pop()
+            elif edge.id in ids:
+                ids.remove(edge.id)
+            if not ids:
+                del self._postings[key]
+                self._keys_dirty = True
+
+    def lookup(self, keyword: str):
+        """키워드와 정확히 일치하는 연결 ID"""
+        return self._postings.get(keyword.casefold(), array('l'))
+
+    def prefix_keys(self, prefix: str):
+        """prefix 로 시작하는 키워드들"""
+        if self._keys_dirty:
+            self._sorted_keys = sorted(self._postings)
+            self._keys_dirty = False
+
+        prefix = prefix.casefold()
+        keys = self._sorted_keys
+        start = bisect_left(keys, prefix)
+        end = start
+        while end < len(keys) and keys[end].startswith(prefix):
+            end += 1
+        return keys[start:end]
+
+    def search(self, query: str, limit: int = 200):
+        """검색어의 모든 단어를 키워드로 가진 연결 ID (마지막 단어는 접두어 일치)
+
+        입력 중인 마지막 단어를 접두어로 보기 때문에 타이핑하는 동안 바로 결과가 나온다.
+        """
+        words = extract_keywords(query)
+        if not words:
+            return []
+
+        *exact, last = words
+        matched = None
+        for word in sorted(exact, key=lambda w: len(self.lookup(w))):
+            ids = self.lookup(word)
+            matched = set(ids) if matched is None else matched.intersection(ids)
+            if not matched:
+                return []
+
+        if matched is not None:
+            # 이미 좁혀진 후보의 키워드만 확인
+            prefix = last.casefold()
+            return [
+                i for i in sorted(matched)
+                if any(key.startswith(prefix) for key in self._edge_keys[i])
+            ][:limit]
+
+        prefix_ids = set()
+        for key in self.prefix_keys(last):
+            prefix_ids.update(self._postings[key])
+            if len(prefix_ids) >= limit:
+                break
+        return sorted(prefix_ids)[:limit]
@@ -0,0 +1,145 @@
+"""
+저장된 mindmap_*.json 불러오기 - 스트리밍 파서
+
+파일 전체를 json.load 하지 않고 청크 단위로 읽으면서 'structure' 배열의
+부모 항목을 하나씩 꺼낸다. 그래서 수백 MB 짜리 파일도 첫 부모부터 바로
+화면에 보여줄 수 있고, 메모리에는 현재 청크만 남는다.
+
+바이너리 세션 파일(.gmb)은 mindfile.MindMapFile 이 같은 인터페이스로 읽는다.
+open_reader(path) 가 확장자를 보고 골라 준다. .gz / .xz / .bz2 는 풀면서 읽는다.
+"""
+import json
+
+import compressed
+import mindfile
+from mindgraph import MindGraph
+
+CHUNK_SIZE = 1 << 16
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+class _ChunkStream:
+    """파일을 청크로 읽으면서 JSON 값 단위로 꺼내는 버퍼"""
+
+    def __init__(self, f, chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """청크 하나 더 읽기 (소비한 앞부분은 버림)"""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """공백을 건너뛴 다음 글자 (끝이면 '')"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, ch: str):
+        if self.peek() != ch:
+            raise ValueError(f"잘못된 mindmap JSON: '{ch}' 위치 {self.pos}")
+        self.pos += 1
+
+    def value(self):
+        """JSON 값 하나 디코딩 (버퍼가 모자라면 더 읽음)"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # 숫자 등은 청크 경계에서 잘려도 디코딩되므로 끝에 닿았으면 더 읽고 다시
+            if end == len(self.buf) and not self.eof and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+class MindMapReader:
+    """mindmap_*.json 스트리밍 리더
+
+    reader = MindMapReader(path)
+    for top_item in reader.parents():   # [parent, {child, raw_thought, keywords}, ...]
+        ...
+    reader.meta                          # structure 앞에 있던 키들 (version, question, ...)
+    """
+
+    def __init__(self, path: str, chunk_size: int = CHUNK_SIZE):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.meta = {}
+
+    def parents(self):
+        """'structure' 의 부모 항목을 하나씩 반환 (그 뒤의 connection_history 는 읽지 않음)"""
+        with compressed.open_read(self.path) as f:
+            stream = _ChunkStream(f, self.chunk_size)
+            stream.expect('{')
+
+            while stream.peek() not in ('}', ''):
+                key = stream.value()
+                stream.expect(':')
+
+                if key == 'structure':
+                    stream.expect('[')
+                    while stream.peek() != ']':
+                        yield stream.value()
+                        if stream.peek() == ',':
+                            stream.pos += 1
+                    return
+
+                self.meta[key] = stream.value()
+                if stream.peek() == ',':
+                    stream.pos += 1
+
+    def batches(self, size: int = 200):
+        """부모 항목을 size 개씩 묶어서 반환"""
+        batch = []
+        for top_item in self.parents():
+            batch.append(top_item)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def load_graph(self) -> MindGraph:
+        """파일 전체를 MindGraph 로 읽기"""
+        graph = MindGraph()
+        for top_item in self.parents():
+            graph.add_structure_item(top_item)
+        return graph
+
+    def progress(self):
+        """저장 당시 (current_index, current_child_index) - 기록이 없으면(완성된 맵) None"""
+        if 'current_index' in self.meta:
+            return self.meta['current_index'], self.meta.get('current_child_index', 0)
+        return None
+
+    def close(self):
+        """MindMapFile 과 맞춘 인터페이스 - 파일은 parents() 안에서만 열려 있다"""
+
+
+def open_reader(path: str):
+    """확장자에 맞는 리더 - .gmb 는 MindMapFile, 그 외는 JSON 스트리밍 리더"""
+    if mindfile.is_binary(path):
+        return mindfile.MindMapFile(path)
+    return MindMapReader(path)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+여러 세션 합치기 - 저장된 맵 N 개를 중복 없는 전역 그래프 하나로
+
+같은 (부모, 자식) 연결은 하나로 합치고, 몇 번 나왔는지(count)와
+생각마다 어느 맵/질문에서 왔는지(provenance)를 남긴다.
+반복 단어의 노드 이름('a#2')은 질문 안에서만 뜻이 있으므로 단어('a')로 합친다.
+
+메모리는 입력 맵 하나 크기 + 열린 run 파일 수만큼만 쓴다.
+    1. 맵 하나씩 읽어서 (부모, 자식) 순으로 정렬한 run 파일(JSON Lines)로 내려쓴다
+    2. run 파일들을 heapq.merge 로 k-way 병합 (fan_in 개씩, 넘으면 단계적으로)
+    3. 같은 키가 이어지는 동안만 모아서 합친 연결 하나를 내보낸다
+
+    python merge.py mindmap_*.json mindmap_*.gmb --jsonl merged.jsonl --dot merged.dot
+"""
+import argparse
+import heapq
+import json
+import os
+import shutil
+import sys
+import tempfile
+from contextlib import ExitStack
+from itertools import groupby
+
+from exporters import BUFFER_SIZE, DotSink, JsonlSink, StreamExporter
+from loader import open_reader
+from pairing import base_word
+
+FAN_IN = 64  # 한 번에 여는 run 파일 수
+
+
+class MergedEdge:
+    """합친 연결 - 등장 횟수와 생각별 출처"""
+
+    __slots__ = ('parent', 'child', 'count', 'thoughts')
+
+    def __init__(self, parent, child, count, thoughts):
+        self.parent = parent
+        self.child = child
+        self.count = count
+        self.thoughts = thoughts  # [{thought, keywords, source, question, timestamp}, ...]
+
+    def to_dict(self):
+        return {'from': self.parent, 'to': self.child, 'count': self.count,
+                'thoughts': self.thoughts}
+
+    def __repr__(self):
+        return f"MergedEdge({self.parent!r} -> {self.child!r}, x{self.count})"
+
+
+def _key(record):
+    return record[0], record[1]
+
+
+def _dump(record) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def write_run(path: str, source_index: int, run_dir: str):
+    """맵 하나를 (부모, 자식) 순으로 정렬한 run 파일로 - (run 경로, 출처 정보)"""
+    reader = open_reader(path)
+    try:
+        graph = reader.load_graph()
+    finally:
+        reader.close()
+
+    # [parent, child, thought, keywords, source, seq] - seq 로 같은 맵 안의 입력 순서 유지
+    # 'a#2' 는 그 질문 안에서만 뜻이 있으므로 맵끼리는 단어로 합친다
+    records = [
+        [base_word(edge.parent), base_word(edge.child), edge.thought, list(edge.keywords),
+         source_index, seq]
+        for seq, edge in enumerate(graph.edges())
+    ]
+    records.sort(key=_key)
+
+    run_path = os.path.join(run_dir, f"run-{source_index}.jsonl")
+    with open(run_path, 'w', encoding='utf-8', buffering=BUFFER_SIZE) as f:
+        f.writelines(_dump(record) for record in records)
+
+    source = {
+        'source': os.path.basename(path),
+        'question': reader.meta.get('question', ''),
+        'timestamp': reader.meta.get('timestamp'),
+    }
+    return run_path, source
+
+
+def _read_run(f):
+    for line in f:
+        yield json.loads(line)
+
+
+def _merge_files(paths):
+    """run 파일 여러 개를 키 순서로 병합한 레코드 스트림 (파일은 끝나면 닫힘)"""
+    with ExitStack() as stack:
+        streams = [
+            _read_run(stack.enter_context(open(path, encoding='utf-8', buffering=BUFFER_SIZE)))
+            for path in paths
+        ]
+        yield from heapq.merge(*streams, key=lambda r: (r[0], r[1], r[4], r[5]))
+
+
+def _reduce_runs(runs, run_dir: str, fan_in: int):
+    """run 이 fan_in 개를 넘으면 묶음별로 미리 병합해서 줄인다"""
+    level = 0
+    while len(runs) > fan_in:
+        merged = []
+        for start in range(0, len(runs), fan_in):
+            path = os.path.join(run_dir, f"merge-{level}-{start}.jsonl")
+            with open(path, 'w', encoding='utf-8', buffering=BUFFER_SIZE) as f:
+                f.writelines(_dump(record) for record in _merge_files(runs[start:start + fan_in]))
+            for old in runs[start:start + fan_in]:
+                os.unlink(old)
+            merged.append(path)
+        runs = merged
+        level += 1
+    return runs
+
+
+def merge_maps(paths, fan_in: int = FAN_IN, tmp_dir: str = None):
+    """저장된 맵들을 합친 연결을 (부모, 자식) 순으로 하나씩 반환"""
+    run_dir = tempfile.mkdtemp(prefix="gridmind_merge_", dir=tmp_dir)
+    try:
+        runs, sources = [], []
+        for source_index, path in enumerate(paths):
+            run_path, source = write_run(path, source_index, run_dir)
+            runs.append(run_path)
+            sources.append(source)
+
+        runs = _reduce_runs(runs, run_dir, max(2, fan_in))
+        for (parent, child), group in groupby(_merge_files(runs), key=_key):
+            count = 0
+            thoughts = []
+            for _, _, thought, keywords, source_index, _ in group:
+                count += 1
+                if thought:
+                    thoughts.append(dict(sources[source_index], thought=thought,
+                                         keywords=keywords))
+            yield MergedEdge(parent, child, count, thoughts)
+    finally:
+        shutil.rmtree(run_dir, ignore_errors=True)
+
+
+class MergedJsonlSink(JsonlSink):
+    """합친 연결 하나당 JSON 한 줄 (count, 출처별 thoughts)"""
+
+    def write(self, edge, question=None):
+        self.f.write(json.dumps(edge.to_dict(), ensure_ascii=False))
+        self.f.write('\n')
+
+
+class MergedDotSink(DotSink):
+    """합친 그래프 DOT - 노드는 단어 하나에 하나, 선 굵기 = 등장 횟수"""
+
+    def write(self, edge, question=None):
+        self.f.write(f'  "{edge.parent}" -> "{edge.child}" '
+                     f'[label="{edge.count}", penwidth={min(edge.count, 10)}];\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="저장된 마인드맵 합치기")
+    parser.add_argument('files', nargs='+', help="mindmap_*.json / .gmb")
+    parser.add_argument('--jsonl', help="합친 연결 JSON Lines ('-' 는 stdout)")
+    parser.add_argument('--dot', help="합친 그래프 DOT")
+    parser.add_argument('--fan-in', type=int, default=FAN_IN,
+                        help=f"한 번에 병합할 run 파일 수 (기본 {FAN_IN})")
+    parser.add_argument('--tmp-dir', help="run 파일을 둘 디렉터리 (기본: 시스템 임시 디렉터리)")
+    args = parser.parse_args(argv)
+
+    sinks = []
+    if args.dot:
+        sinks.append(MergedDotSink(args.dot))
+    if args.jsonl or not sinks:
+        sinks.append(MergedJsonlSink(args.jsonl or '-'))
+
+    total = 0
+    with StreamExporter(sinks) as exporter:
+        for edge in merge_maps(args.files, args.fan_in, args.tmp_dir):
+            for sink in exporter.sinks:
+                sink.write(edge)
+            total += 1
+
+    print(f"✓ {len(args.files)}개 맵 → {total}개 연결", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
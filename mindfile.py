@@ -0,0 +1,304 @@
+"""
+바이너리 세션 파일 (.gmb) - mmap 으로 필요한 부모만 바로 읽기
+
+JSON 은 단어를 structure 와 connection_history 에 반복해서 적지만, 이 형식은
+단어/키워드를 문자열 테이블에 한 번만 두고 연결은 고정 길이 레코드로 적는다.
+부모 색인이 있어서 파일 전체를 파싱하지 않고 임의의 부모 연결을 꺼낼 수 있다.
+JSON (exporters.save_json) 은 다른 도구와 주고받는 형식으로 그대로 둔다.
+압축된 파일(.gmb.gz 등)은 mmap 할 수 없어서 풀어서 메모리에 올린 뒤 같은 방식으로 읽는다.
+
+    save_binary(graph, question, "mindmap.gmb", progress, pairs, session)
+    with MindMapFile("mindmap.gmb") as f:
+        f.edges_of("시스템")         # 그 부모의 연결만 읽음
+        graph = f.load_graph()
+
+레이아웃 (little-endian, 섹션은 8 byte 정렬):
+    헤더        magic, version, 개수 4개, 섹션 오프셋 10개
+    meta        JSON (question, timestamp, pairs, session, current_index, current_child_index)
+    strings     u32[n_strings + 1] 오프셋 + UTF-8 데이터
+    parents     (word, adj_start, adj_count) u32 × 3 - 부모 순서
+    by_word     u32[n_parents] - 단어 바이트 순으로 정렬한 parents 인덱스 (이진 탐색)
+    adjacency   u32[n_edges] - 부모별로 모은 연결 ID
+    edges       (parent, child, kw_start, kw_end) u32 × 4 - 연결 ID 순서 (입력 순서)
+    keywords    u32[n_kw] - 문자열 ID
+    thoughts    u64[n_edges + 1] 오프셋 + UTF-8 데이터
+"""
+import json
+import mmap
+import struct
+import sys
+from array import array
+from datetime import datetime
+
+import compressed
+from exporters import atomic_open
+from instrument import timed
+from mindgraph import Edge, MindGraph
+
+MAGIC = b'GMND'
+VERSION = 1
+EXTENSION = '.gmb'
+
+_HEADER = struct.Struct('<4sHHIIII10Q')
+_SECTIONS = ('meta', 'string_offsets', 'string_data', 'parents', 'by_word',
+             'adjacency', 'edges', 'keywords', 'thought_offsets', 'thought_data')
+_LITTLE = sys.byteorder == 'little'
+
+
+def is_binary(path: str) -> bool:
+    return compressed.base_name(path).endswith(EXTENSION)
+
+
+def _le(values: array) -> bytes:
+    if not _LITTLE:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _u32(values) -> bytes:
+    return _le(array('I', values))
+
+
+@timed("mindfile.save_binary")
+def save_binary(graph, question: str, filename: str, progress=None, pairs=None, session=None):
+    """그래프를 .gmb 로 저장 (save_json 과 같은 인자)"""
+    strings, parent_order, adjacency, src, dst, thoughts, kw_ids, kw_offsets = graph.columns()
+
+    meta = {'version': VERSION, 'question': question,
+            'timestamp': datetime.now().isoformat()}
+    if progress is not None:
+        meta['current_index'], meta['current_child_index'] = progress
+    if pairs and pairs != 'all':
+        meta['pairs'] = pairs
+    if session:
+        meta['session'] = session
+
+    encoded = [word.encode('utf-8') for word in strings]
+    string_offsets = array('I', [0])
+    for data in encoded:
+        string_offsets.append(string_offsets[-1] + len(data))
+
+    parents = array('I')
+    adjacency_ids = array('I')
+    for parent_id in parent_order:
+        ids = adjacency[parent_id]
+        parents.extend((parent_id, len(adjacency_ids), len(ids)))
+        adjacency_ids.extend(iter(ids))
+    by_word = sorted(range(len(parent_order)), key=lambda k: encoded[parent_order[k]])
+
+    edges = array('I')
+    for edge_id in range(len(src)):
+        edges.extend((src[edge_id], dst[edge_id], kw_offsets[edge_id], kw_offsets[edge_id + 1]))
+
+    thought_data = [thought.encode('utf-8') for thought in thoughts]
+    thought_offsets = array('Q', [0])
+    for data in thought_data:
+        thought_offsets.append(thought_offsets[-1] + len(data))
+
+    sections = [
+        json.dumps(meta, ensure_ascii=False).encode('utf-8'),
+        _le(string_offsets),
+        b''.join(encoded),
+        _le(parents),
+        _u32(by_word),
+        _le(adjacency_ids),
+        _le(edges),
+        _u32(iter(kw_ids)),
+        _le(thought_offsets),
+        b''.join(thought_data),
+    ]
+
+    offsets = []
+    position = _HEADER.size
+    for data in sections:
+        position += -position % 8
+        offsets.append(position)
+        position += len(data)
+
+    with atomic_open(filename, mode='wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, len(strings), len(parent_order),
+                             len(src), len(kw_ids), *offsets))
+        for offset, data in zip(offsets, sections):
+            f.write(b'\0' * (offset - f.tell()))
+            f.write(data)
+
+
+class MindMapFile:
+    """.gmb 리더 - mmap 위의 뷰라서 읽은 부분만 메모리에 올라온다
+
+    loader.MindMapReader 와 같은 인터페이스(meta, parents, batches, load_graph,
+    progress)에 부모 단위 임의 접근(edges_of, edge)을 더했다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if compressed.codec_for(path) is None:
+            with open(path, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            with compressed.open_read(path, 'rb') as f:
+                self._mmap = f.read()
+        buf = self._view = memoryview(self._mmap)
+
+        (magic, version, _, self.n_strings, self.n_parents, self.n_edges, self.n_kw,
+         *offsets) = _HEADER.unpack_from(buf)
+        if magic != MAGIC:
+            raise ValueError(f"gridmind 바이너리 파일이 아닙니다: {path}")
+        if version > VERSION:
+            raise ValueError(f"지원하지 않는 버전입니다: {version}")
+        section = dict(zip(_SECTIONS, offsets))
+
+        def u32(name, count):
+            start = section[name]
+            return self._cast(buf[start:start + 4 * count], 'I')
+
+        self._string_offsets = u32('string_offsets', self.n_strings + 1)
+        self._string_data = section['string_data']
+        self._parents = u32('parents', 3 * self.n_parents)
+        self._by_word = u32('by_word', self.n_parents)
+        self._adjacency = u32('adjacency', self.n_edges)
+        self._edges = u32('edges', 4 * self.n_edges)
+        self._keywords = u32('keywords', self.n_kw)
+        start = section['thought_offsets']
+        self._thought_offsets = self._cast(buf[start:start + 8 * (self.n_edges + 1)], 'Q')
+        self._thought_data = section['thought_data']
+
+        self.meta = json.loads(bytes(buf[section['meta']:section['string_offsets']]).rstrip(b'\0'))
+
+    @staticmethod
+    def _cast(view, typecode):
+        if _LITTLE:
+            return view.cast(typecode)
+        values = array(typecode, view)
+        values.byteswap()
+        return values
+
+    def close(self):
+        """mmap 해제 (꺼낸 뷰를 모두 버린 뒤에)"""
+        if self._mmap is None:
+            return
+        for name in ('_string_offsets', '_parents', '_by_word', '_adjacency',
+                     '_edges', '_keywords', '_thought_offsets'):
+            view = getattr(self, name)
+            if isinstance(view, memoryview):
+                view.release()
+        self._view.release()
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # 임의 접근
+    # ------------------------------------------------------------------
+    def _bytes(self, string_id: int) -> bytes:
+        start = self._string_data + self._string_offsets[string_id]
+        end = self._string_data + self._string_offsets[string_id + 1]
+        return self._mmap[start:end]
+
+    def string(self, string_id: int) -> str:
+        return self._bytes(string_id).decode('utf-8')
+
+    def thought(self, edge_id: int) -> str:
+        start = self._thought_data + self._thought_offsets[edge_id]
+        end = self._thought_data + self._thought_offsets[edge_id + 1]
+        return self._mmap[start:end].decode('utf-8')
+
+    def edge(self, edge_id: int) -> Edge:
+        parent, child, kw_start, kw_end = self._edges[4 * edge_id:4 * edge_id + 4]
+        string = self.string
+        return Edge(edge_id, string(parent), string(child), self.thought(edge_id),
+                    tuple(string(k) for k in self._keywords[kw_start:kw_end]))
+
+    def parent_words(self):
+        """부모 단어 (저장된 순서)"""
+        parents = self._parents
+        return [self.string(parents[3 * k]) for k in range(self.n_parents)]
+
+    def _find_parent(self, word: str):
+        """부모 레코드 인덱스 - 단어 바이트 순 색인에서 이진 탐색 (없으면 None)"""
+        key = word.encode('utf-8')
+        parents, by_word = self._parents, self._by_word
+        lo, hi = 0, self.n_parents
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._bytes(parents[3 * by_word[mid]]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.n_parents and self._bytes(parents[3 * by_word[lo]]) == key:
+            return by_word[lo]
+        return None
+
+    def edge_ids(self, parent: str):
+        """parent 의 연결 ID"""
+        k = self._find_parent(parent)
+        if k is None:
+            return array('l')
+        _, start, count = self._parents[3 * k:3 * k + 3]
+        return array('l', self._adjacency[start:start + count])
+
+    def edges_of(self, parent: str):
+        """parent 의 연결들 - 해당 레코드만 읽는다"""
+        return [self.edge(edge_id) for edge_id in self.edge_ids(parent)]
+
+    # ------------------------------------------------------------------
+    # MindMapReader 와 같은 인터페이스
+    # ------------------------------------------------------------------
+    def parents(self):
+        """X 형식의 부모 항목을 하나씩 - [parent, {child, raw_thought, keywords}, ...]"""
+        parents, adjacency = self._parents, self._adjacency
+        for k in range(self.n_parents):
+            parent_id, start, count = parents[3 * k:3 * k + 3]
+            yield [self.string(parent_id)] + [
+                self.edge(edge_id).to_dict() for edge_id in adjacency[start:start + count]
+            ]
+
+    def batches(self, size: int = 200):
+        batch = []
+        for top_item in self.parents():
+            batch.append(top_item)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def load_graph(self) -> MindGraph:
+        """파일 전체를 MindGraph 로 - 컬럼을 그대로 복사하고 문자열만 디코드"""
+        data = self._mmap
+        base, offsets = self._string_data, self._string_offsets
+        strings = [
+            sys.intern(data[base + offsets[i]:base + offsets[i + 1]].decode('utf-8'))
+            for i in range(self.n_strings)
+        ]
+
+        parents, adjacency = self._parents, self._adjacency
+        parent_order = array('l')
+        graph_adjacency = {}
+        for k in range(self.n_parents):
+            parent_id, start, count = parents[3 * k:3 * k + 3]
+            parent_order.append(parent_id)
+            graph_adjacency[parent_id] = array('l', adjacency[start:start + count])
+
+        edges = self._edges
+        kw_offsets = array('l', edges[2::4])
+        kw_offsets.append(edges[-1] if self.n_edges else 0)
+        thoughts = [self.thought(edge_id) for edge_id in range(self.n_edges)]
+
+        return MindGraph.from_columns(
+            strings, parent_order, graph_adjacency,
+            array('l', edges[0::4]), array('l', edges[1::4]), thoughts,
+            array('l', self._keywords), kw_offsets,
+        )
+
+    def progress(self):
+        if 'current_index' in self.meta:
+            return self.meta['current_index'], self.meta.get('current_child_index', 0)
+        return None
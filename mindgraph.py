@@ -0,0 +1,286 @@
+"""
+MindGraph - gridmind.py / MindMapApp 가 공유하는 마인드맵 그래프 코어
+
+단어(노드)와 키워드는 문자열 테이블에 한 번만 저장(intern)하고 정수 ID 로 참조한다.
+연결(edge)은 array 기반 컬럼에 저장하고, 부모별 인접 인덱스로 바로 찾는다.
+바뀐 부모는 dirty 로 기록해 두어서, 증분 내보내기(segments.py)가 그 부모만 다시 쓴다.
+"""
+from array import array
+
+
+class Edge:
+    """연결 하나에 대한 가벼운 뷰 (parent → child, 원문, 키워드)"""
+
+    __slots__ = ('id', 'parent', 'child', 'thought', 'keywords')
+
+    def __init__(self, id, parent, child, thought, keywords):
+        self.id = id
+        self.parent = parent
+        self.child = child
+        self.thought = thought
+        self.keywords = keywords
+
+    def to_dict(self):
+        """MindMapApp v2 의 connection dict 형식"""
+        return {
+            'child': self.child,
+            'raw_thought': self.thought,
+            'keywords': list(self.keywords),
+        }
+
+    def __repr__(self):
+        return f"Edge({self.parent!r} -> {self.child!r}, {len(self.keywords)} keywords)"
+
+
+class MindGraph:
+    """부모 노드 순서와 연결을 보관하는 그래프"""
+
+    __slots__ = (
+        '_strings', '_ids', '_parent_order', '_adjacency',
+        '_src', '_dst', '_thoughts', '_kw_ids', '_kw_offsets', '_dirty',
+    )
+
+    def __init__(self):
+        # 문자열 테이블 (단어 + 키워드)
+        self._strings = []
+        self._ids = {}
+
+        # 부모 노드 순서 / 부모별 연결 ID 목록
+        self._parent_order = array('l')
+        self._adjacency = {}
+
+        # 연결 컬럼
+        self._src = array('l')
+        self._dst = array('l')
+        self._thoughts = []
+        self._kw_ids = array('l')
+        self._kw_offsets = array('l', [0])
+
+        # 마지막 take_dirty() 이후 추가/변경/제거된 부모 ID
+        self._dirty = set()
+
+    # ------------------------------------------------------------------
+    # 문자열 테이블
+    # ------------------------------------------------------------------
+    def intern(self, word: str) -> int:
+        """단어를 문자열 테이블에 등록하고 ID 반환"""
+        node_id = self._ids.get(word)
+        if node_id is None:
+            node_id = len(self._strings)
+            self._strings.append(word)
+            self._ids[word] = node_id
+        return node_id
+
+    def word(self, node_id: int) -> str:
+        return self._strings[node_id]
+
+    def node_id(self, word: str):
+        """등록된 단어의 ID (없으면 None)"""
+        return self._ids.get(word)
+
+    # ------------------------------------------------------------------
+    # 구조 변경
+    # ------------------------------------------------------------------
+    def add_parent(self, word: str) -> int:
+        """부모 노드 추가 (이미 있으면 그대로 사용)"""
+        parent_id = self.intern(word)
+        if parent_id not in self._adjacency:
+            self._adjacency[parent_id] = array('l')
+            self._parent_order.append(parent_id)
+            self._dirty.add(parent_id)
+        return parent_id
+
+    def add_edge(self, parent: str, child: str, thought: str = '', keywords=()) -> int:
+        """parent → child 연결 추가, 연결 ID 반환"""
+        parent_id = self.add_parent(parent)
+        edge_id = len(self._src)
+
+        self._src.append(parent_id)
+        self._dst.append(self.intern(child))
+        self._thoughts.append(thought)
+        for kw in keywords:
+            self._kw_ids.append(self.intern(kw))
+        self._kw_offsets.append(len(self._kw_ids))
+
+        self._adjacency[parent_id].append(edge_id)
+        self._dirty.add(parent_id)
+        return edge_id
+
+    def pop_parent(self):
+        """마지막 부모 노드 제거 (연결이 없을 때만) - 제거한 단어 반환 (없으면 None)"""
+        if not self._parent_order or self._adjacency[self._parent_order[-1]]:
+            return None
+        parent_id = self._parent_order.pop()
+        del self._adjacency[parent_id]
+        self._dirty.add(parent_id)
+        return self._strings[parent_id]
+
+    def pop_edge(self):
+        """마지막 연결 제거 후 반환 (없으면 None)"""
+        if not self._src:
+            return None
+
+        edge = self.edge(len(self._src) - 1)
+        parent_id = self._src.pop()
+        self._dst.pop()
+        self._thoughts.pop()
+        self._kw_offsets.pop()
+        del self._kw_ids[self._kw_offsets[-1]:]
+        self._adjacency[parent_id].pop()
+        self._dirty.add(parent_id)
+        return edge
+
+    def clear(self):
+        self.__init__()
+
+    def snapshot(self):
+        """현재 상태의 복사본 - 백그라운드 저장용 (원본 수정과 무관)"""
+        copy = MindGraph.__new__(MindGraph)
+        copy._strings = list(self._strings)
+        copy._ids = dict(self._ids)
+        copy._parent_order = array('l', self._parent_order)
+        copy._adjacency = {p: array('l', ids) for p, ids in self._adjacency.items()}
+        copy._src = array('l', self._src)
+        copy._dst = array('l', self._dst)
+        copy._thoughts = list(self._thoughts)
+        copy._kw_ids = array('l', self._kw_ids)
+        copy._kw_offsets = array('l', self._kw_offsets)
+        copy._dirty = set(self._dirty)
+        return copy
+
+    def take_dirty(self):
+        """마지막 호출 이후 바뀐 부모 단어들 (제거된 부모 포함) - 기록은 비운다"""
+        strings = self._strings
+        dirty = {strings[p] for p in self._dirty}
+        self._dirty = set()
+        return dirty
+
+    def mark_dirty(self, parents=None):
+        """부모들을 다시 dirty 로 (저장 실패 시 되돌리기용, None 이면 모든 부모)"""
+        if parents is None:
+            self._dirty.update(self._parent_order)
+        else:
+            self._dirty.update(self.intern(word) for word in parents)
+
+    def columns(self):
+        """내부 컬럼 (저장용, 복사하지 않음)
+
+        (strings, parent_order, adjacency, src, dst, thoughts, kw_ids, kw_offsets)
+        """
+        return (self._strings, self._parent_order, self._adjacency, self._src,
+                self._dst, self._thoughts, self._kw_ids, self._kw_offsets)
+
+    @classmethod
+    def from_columns(cls, strings, parent_order, adjacency, src, dst, thoughts,
+                     kw_ids, kw_offsets):
+        """columns() 와 같은 형식의 컬럼으로 그래프 생성 (인자를 그대로 사용)"""
+        graph = cls.__new__(cls)
+        graph._strings = strings
+        graph._ids = {word: i for i, word in enumerate(strings)}
+        graph._parent_order = parent_order
+        graph._adjacency = adjacency
+        graph._src = src
+        graph._dst = dst
+        graph._thoughts = thoughts
+        graph._kw_ids = kw_ids
+        graph._kw_offsets = kw_offsets
+        graph._dirty = set(parent_order)
+        return graph
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def __len__(self):
+        """연결 개수"""
+        return len(self._src)
+
+    def __bool__(self):
+        return bool(self._parent_order)
+
+    def has_parent(self, word: str) -> bool:
+        parent_id = self._ids.get(word)
+        return parent_id is not None and parent_id in self._adjacency
+
+    def edge(self, edge_id: int) -> Edge:
+        start = self._kw_offsets[edge_id]
+        end = self._kw_offsets[edge_id + 1]
+        strings = self._strings
+        return Edge(
+            edge_id,
+            strings[self._src[edge_id]],
+            strings[self._dst[edge_id]],
+            self._thoughts[edge_id],
+            tuple(strings[k] for k in self._kw_ids[start:end]),
+        )
+
+    def parents(self):
+        """부모 노드 단어 (추가된 순서)"""
+        strings = self._strings
+        return [strings[p] for p in self._parent_order]
+
+    def edge_ids(self, parent: str):
+        """parent 의 연결 ID 목록"""
+        parent_id = self._ids.get(parent)
+        if parent_id is None or parent_id not in self._adjacency:
+            return array('l')
+        return self._adjacency[parent_id]
+
+    def edges_of(self, parent: str):
+        """parent 의 연결들"""
+        for edge_id in self.edge_ids(parent):
+            yield self.edge(edge_id)
+
+    def children_of(self, parent: str):
+        strings = self._strings
+        return [strings[self._dst[e]] for e in self.edge_ids(parent)]
+
+    def edges(self):
+        """모든 연결 (부모 순서 → 입력 순서)"""
+        for parent_id in self._parent_order:
+            for edge_id in self._adjacency[parent_id]:
+                yield self.edge(edge_id)
+
+    def history(self):
+        """생각이 입력된 연결만 (입력 순서) - connection_history 형식"""
+        for edge_id, thought in enumerate(self._thoughts):
+            if thought:
+                edge = self.edge(edge_id)
+                yield {
+                    'from': edge.parent,
+                    'to': edge.child,
+                    'thought': edge.thought,
+                    'keywords': list(edge.keywords),
+                }
+
+    # ------------------------------------------------------------------
+    # 기존 X 구조와의 변환
+    # ------------------------------------------------------------------
+    def to_structure(self):
+        """MindMapApp v2 의 X 형식: [[parent, {child, raw_thought, keywords}, ...], ...]"""
+        return [
+            [parent] + [edge.to_dict() for edge in self.edges_of(parent)]
+            for parent in self.parents()
+        ]
+
+    def add_structure_item(self, top_item):
+        """X 형식의 부모 항목 하나 추가 - v2 dict 또는 gridmind.py 의 [child, keywords] 쌍"""
+        if not top_item:
+            return
+        parent = top_item[0]
+        self.add_parent(parent)
+        for connection in top_item[1:]:
+            if isinstance(connection, dict):
+                self.add_edge(parent, connection['child'],
+                              connection.get('raw_thought', ''),
+                              connection.get('keywords', ()))
+            else:
+                child, keywords = connection
+                self.add_edge(parent, child, '', keywords)
+
+    @classmethod
+    def from_structure(cls, structure):
+        """X 형식에서 그래프 생성"""
+        graph = cls()
+        for top_item in structure:
+            graph.add_structure_item(top_item)
+        return graph
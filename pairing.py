@@ -0,0 +1,218 @@
+"""
+부모/자식 짝 만들기 - MindMapApp, gridmind.py, 배치 모드가 같은 규칙을 쓴다
+
+질문을 단어로 쪼개는 것은 tokenizer.split_words
+
+기본은 모든 순서쌍(N×(N−1))을 묻는다. PairPlan 의 전략을 섞으면 물어볼 짝이 줄어든다.
+    undirected   A→B 만 묻고 B→A 는 묻지 않음
+    unique       반복된 단어는 처음 나온 것만 (= merge)
+    topk=K       중요도 상위 K 단어끼리만 (단어마다 처음 나온 위치 하나)
+    window=W     질문에서 W 단어 안쪽 이웃끼리만
+스펙 문자열로도 만든다: PairPlan.from_spec(words, "undirected,topk=8")
+
+단어는 질문 속 위치로 구분한다. 반복된 단어는
+    distinct     (기본) 위치마다 다른 노드 - 두 번째 'a' 는 'a#2'
+    merge        한 노드로 합침 - 처음 나온 위치만 부모/자식이 된다 (unique)
+'a#2' 는 그 질문 안에서만 쓰는 이름이다. 맵을 모으는 store / merge 는 split_node 로
+단어('a')와 등장 순번(2)을 나눠서 단어 기준으로 묶는다.
+자식 목록은 위치 배열 위의 범위 뷰(ChildView)라서 부모마다 리스트를 새로 만들지 않는다.
+"""
+from bisect import bisect_left
+from collections.abc import Sequence
+
+STRATEGIES = ('all', 'undirected', 'unique', 'topk', 'window', 'distinct', 'merge')
+
+
+def node_name(word: str, occurrence: int = 1) -> str:
+    """단어의 occurrence 번째 등장 노드 이름 - ('a', 2) → 'a#2'"""
+    return word if occurrence == 1 else f"{word}#{occurrence}"
+
+
+def node_names(words):
+    """위치별 노드 이름 - 반복된 단어는 두 번째부터 'word#2', 'word#3' ..."""
+    seen = {}
+    names = []
+    for word in words:
+        count = seen[word] = seen.get(word, 0) + 1
+        names.append(node_name(word, count))
+    return names
+
+
+def split_node(name: str):
+    """노드 이름 → (단어, 몇 번째 등장) - 'a#2' → ('a', 2), 'a' → ('a', 1)
+
+    'word#2' 는 한 질문 안에서만 뜻이 있는 이름이라, 여러 맵을 모으는 곳(store, merge)은
+    단어로 되돌려서 쓴다.
+    """
+    word, sep, occurrence = name.rpartition('#')
+    if sep and word and occurrence.isdigit():
+        return word, int(occurrence)
+    return name, 1
+
+
+def base_word(name: str) -> str:
+    """노드 이름의 단어 - 'a#2' → 'a'"""
+    return split_node(name)[0]
+
+
+def word_importance(word: str, count: int) -> int:
+    """기본 중요도 - 질문에 자주 나오고 긴 단어일수록 중요"""
+    return count * len(word)
+
+
+class ChildView(Sequence):
+    """한 부모의 자식 노드 - 정렬된 위치 배열의 [lo, hi) 구간에서 skip 하나를 뺀 뷰"""
+
+    __slots__ = ('_names', '_base', '_lo', '_hi', '_skip')
+
+    def __init__(self, names, base, lo: int, hi: int, skip: int = -1):
+        self._names = names
+        self._base = base
+        self._lo = lo
+        self._hi = hi
+        self._skip = skip if lo <= skip < hi else -1
+
+    def __len__(self):
+        return self._hi - self._lo - (self._skip >= 0)
+
+    def position(self, k: int) -> int:
+        """k 번째 자식의 질문 속 위치"""
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError(k)
+        i = self._lo + k
+        if 0 <= self._skip <= i:
+            i += 1
+        return self._base[i]
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            start, stop, step = k.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            # 앞을 잘라낸 뷰 (불러온 맵에서 이어서 할 때)
+            return ChildView(self._names, self._base,
+                             self._raw(start), self._raw(max(start, stop)), self._skip)
+        return self._names[self.position(k)]
+
+    def _raw(self, k: int) -> int:
+        """k 번째 자식의 base 인덱스 (끝이면 hi)"""
+        i = self._lo + k
+        if 0 <= self._skip <= i:
+            i += 1
+        return min(i, self._hi)
+
+    def __iter__(self):
+        names, base = self._names, self._base
+        for i in range(self._lo, self._hi):
+            if i != self._skip:
+                yield names[base[i]]
+
+    def __repr__(self):
+        return f"ChildView({list(self)!r})"
+
+
+class PairPlan:
+    """질문 단어들에 대한 부모/자식 짝 계획 - 부모 하나씩 필요할 때 자식을 만든다"""
+
+    def __init__(self, words, directed: bool = True, unique: bool = False,
+                 top_k: int = None, window: int = None, importance=word_importance):
+        self.words = list(words)
+        self.directed = directed
+        self.unique = unique  # True 면 반복 단어를 한 노드로 합침 (merge)
+        self.top_k = top_k
+        self.window = window
+
+        # 위치별 노드 이름 (merge 면 단어 그대로)
+        self.nodes = list(self.words) if unique else node_names(self.words)
+
+        # 부모/자식이 될 수 있는 위치 (정렬됨) - 부모마다 이 위의 구간만 본다
+        base = range(len(self.words))
+        if unique:
+            first = {}
+            for position, word in enumerate(self.words):
+                first.setdefault(word, position)
+            base = sorted(first.values())
+        if top_k is not None:
+            # 위치가 아니라 서로 다른 단어를 순위 매긴다 (반복 단어가 자리를 여럿 차지하지 않게)
+            counts = {}
+            for word in self.words:
+                counts[word] = counts.get(word, 0) + 1
+            first = {}
+            for position in base:
+                first.setdefault(self.words[position], position)
+            ranked = sorted(first, key=lambda w: (-importance(w, counts[w]), first[w]))
+            base = sorted(first[word] for word in ranked[:top_k])
+        self._base = base
+
+        self._offsets = None
+
+    @classmethod
+    def from_spec(cls, words, spec: str = 'all'):
+        """'undirected,topk=8,window=2' 같은 스펙 문자열로 생성"""
+        options = {}
+        for part in (spec or 'all').split(','):
+            name, _, value = part.strip().partition('=')
+            if name in ('', 'all'):
+                continue
+            if name not in STRATEGIES:
+                raise ValueError(f"알 수 없는 짝 전략: {name} (가능: {', '.join(STRATEGIES)})")
+            if name == 'undirected':
+                options['directed'] = False
+            elif name in ('unique', 'merge'):
+                options['unique'] = True
+            elif name == 'distinct':
+                options['unique'] = False
+            elif name == 'topk':
+                options['top_k'] = int(value or 8)
+            elif name == 'window':
+                options['window'] = int(value or 2)
+        return cls(words, **options)
+
+    def __len__(self):
+        """부모 수 (질문 단어 수)"""
+        return len(self.words)
+
+    def node(self, index: int) -> str:
+        """index 위치의 노드 이름"""
+        return self.nodes[index]
+
+    def children(self, index: int) -> ChildView:
+        """index 위치를 부모로 할 때 물어볼 자식 노드들 (뷰)"""
+        base = self._base
+        k = bisect_left(base, index)
+        if k == len(base) or base[k] != index:
+            return ChildView(self.nodes, base, 0, 0)  # 부모가 되지 않는 위치
+
+        if self.window is None:
+            start, stop = 0, len(self.words)
+        else:
+            start, stop = index - self.window, index + self.window + 1
+        if not self.directed:
+            start = max(start, index + 1)
+        lo = bisect_left(base, start) if start > 0 else 0
+        hi = bisect_left(base, stop)
+        return ChildView(self.nodes, base, lo, hi, k)
+
+    def pairs(self):
+        """(부모 위치, 부모, 자식) 을 질문 순서대로 - 필요할 때마다 생성"""
+        nodes = self.nodes
+        for index, parent in enumerate(nodes):
+            for child in self.children(index):
+                yield index, parent, child
+
+    def done_before(self, index: int) -> int:
+        """index 번째 부모 전까지 계획된 질문 수"""
+        if self._offsets is None:
+            offsets = [0]
+            for i in range(len(self.words)):
+                offsets.append(offsets[-1] + len(self.children(i)))
+            self._offsets = offsets
+        return self._offsets[min(index, len(self.words))]
+
+    @property
+    def total(self) -> int:
+        """계획된 전체 질문 수"""
+        return self.done_before(len(self.words))
+
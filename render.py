@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+내장 그래프 렌더러 - Graphviz 없이 좌→우 계층 배치 (rankdir=LR) 후 SVG
+
+노드의 rank(열)는 처음 나타날 때 정해지고 바뀌지 않는다.
+    부모로 처음 나오면 rank 0, 자식으로 처음 나오면 부모 rank + 1
+연결이 더해지거나 빠지면 그 노드가 있는 rank 만 dirty 가 되고, 다음 렌더 때
+그 rank 안의 순서만 앞쪽 이웃의 평균 위치(barycenter)로 다시 정한다.
+rank 별 노드 SVG 조각도 같이 캐시해 두고, 열의 x 는 translate 로만 옮긴다.
+
+    layout = LayeredLayout.from_graph(graph)
+    layout.add_edge("시스템", "효율")     # 이 rank 만 다시 배치됨
+    save_svg(graph, "mindmap.svg", layout)
+
+    python render.py mindmap.gmb -o mindmap.svg
+"""
+import argparse
+import os
+import unicodedata
+from xml.sax.saxutils import escape
+
+import compressed
+from exporters import atomic_open
+from instrument import timed
+from loader import open_reader
+
+ROW_GAP = 36  # rank 안 노드 간격
+RANK_GAP = 60  # 열 간격
+NODE_HEIGHT = 24
+PADDING = 20
+FONT_SIZE = 14
+
+STYLE = """
+  .node rect { fill: white; stroke: #333; }
+  .node text { font-family: "Malgun Gothic", sans-serif; font-size: 14px; }
+  .edge { fill: none; stroke: #555; }
+  .edge.skipped { stroke: #aaa; stroke-dasharray: 4 3; }
+"""
+
+
+def text_width(text: str) -> int:
+    """대략적인 글자 폭 (전각 = FONT_SIZE, 반각 = FONT_SIZE * 0.6)"""
+    wide = sum(1 for ch in text if unicodedata.east_asian_width(ch) in 'WF')
+    return int(wide * FONT_SIZE + (len(text) - wide) * FONT_SIZE * 0.6) + 16
+
+
+class LayeredLayout:
+    """좌→우 계층 배치 - 노드 위치를 기억하고 바뀐 rank 만 다시 배치"""
+
+    def __init__(self):
+        self._nodes = {}  # 노드 → (rank, y, 폭)
+        self._ranks = []  # rank → [노드, ...] (위→아래 순서)
+        self._refs = {}  # 노드 → 참조 수 (부모 등록 + 연결 끝)
+        self._preds = {}  # 노드 → {앞쪽 rank 의 이웃: 연결 수}
+        self._dirty = set()
+        self._widths = []  # rank → 열 폭
+        self._fragments = []  # rank → 노드 SVG 조각 (rank 기준 상대 좌표)
+        self.relaid = 0  # 지금까지 다시 배치한 rank 수
+
+    @classmethod
+    def from_graph(cls, graph):
+        """부모 순서대로 부모와 그 연결을 더한다 (매핑할 때와 같은 순서)"""
+        layout = cls()
+        for parent in graph.parents():
+            layout.add_parent(parent)
+            for edge_id in graph.edge_ids(parent):
+                edge = graph.edge(edge_id)
+                layout.add_edge(edge.parent, edge.child)
+        return layout
+
+    def __len__(self):
+        """배치된 노드 수"""
+        return len(self._nodes)
+
+    def __contains__(self, node):
+        return node in self._nodes
+
+    # ------------------------------------------------------------------
+    # 변경 - MindGraph 와 같이 호출
+    # ------------------------------------------------------------------
+    def _ref(self, node: str, rank: int):
+        if node in self._nodes:
+            self._refs[node] += 1
+            return
+        while len(self._ranks) <= rank:
+            self._ranks.append([])
+            self._widths.append(0)
+            self._fragments.append('')
+        self._ranks[rank].append(node)
+        self._nodes[node] = (rank, None, text_width(node))
+        self._refs[node] = 1
+        self._dirty.add(rank)
+
+    def _unref(self, node: str):
+        self._refs[node] -= 1
+        if self._refs[node]:
+            return
+        rank = self._nodes.pop(node)[0]
+        del self._refs[node]
+        self._preds.pop(node, None)
+        self._ranks[rank].remove(node)
+        self._dirty.add(rank)
+
+    def add_parent(self, parent: str):
+        self._ref(parent, 0)
+
+    def remove_parent(self, parent: str):
+        if parent in self._nodes:
+            self._unref(parent)
+
+    def add_edge(self, parent: str, child: str):
+        self._ref(parent, 0)
+        parent_rank = self._nodes[parent][0]
+        self._ref(child, parent_rank + 1)
+        child_rank = self._nodes[child][0]
+        if parent_rank < child_rank:
+            preds = self._preds.setdefault(child, {})
+            preds[parent] = preds.get(parent, 0) + 1
+            self._dirty.add(child_rank)
+
+    def remove_edge(self, parent: str, child: str):
+        preds = self._preds.get(child)
+        if preds and parent in preds:
+            preds[parent] -= 1
+            if not preds[parent]:
+                del preds[parent]
+            self._dirty.add(self._nodes[child][0])
+        self._unref(child)
+        self._unref(parent)
+
+    # ------------------------------------------------------------------
+    # 배치
+    # ------------------------------------------------------------------
+    def _barycenter(self, node: str, fallback: float) -> float:
+        preds = self._preds.get(node)
+        if not preds:
+            return fallback
+        nodes = self._nodes
+        total = weight = 0
+        for pred, count in preds.items():
+            total += nodes[pred][1] * count
+            weight += count
+        return total / weight
+
+    def _relay_rank(self, rank: int):
+        """rank 하나의 순서와 y 를 다시 정하고 SVG 조각을 만든다"""
+        members = self._ranks[rank]
+        nodes = self._nodes
+        # 앞쪽 이웃이 없는 노드는 지금 자리를 유지 (새 노드는 맨 아래)
+        keyed = [
+            (self._barycenter(node, nodes[node][1] if nodes[node][1] is not None else float('inf')),
+             index, node)
+            for index, node in enumerate(members)
+        ]
+        keyed.sort()
+        members[:] = [node for _, _, node in keyed]
+
+        offset = (len(members) - 1) / 2
+        width = 0
+        parts = []
+        for slot, node in enumerate(members):
+            y = (slot - offset) * ROW_GAP
+            node_width = nodes[node][2]
+            nodes[node] = (rank, y, node_width)
+            width = max(width, node_width)
+            label = escape(node)
+            parts.append(
+                f'<g class="node"><title>{label}</title>'
+                f'<rect y="{y - NODE_HEIGHT / 2:g}" width="{node_width}" height="{NODE_HEIGHT}" rx="4"/>'
+                f'<text x="8" y="{y + FONT_SIZE * 0.35:g}">{label}</text></g>\n'
+            )
+        self._widths[rank] = width
+        self._fragments[rank] = ''.join(parts)
+        self.relaid += 1
+
+    def layout(self):
+        """dirty rank 만 왼쪽부터 다시 배치 - 다시 배치한 rank 목록"""
+        dirty = sorted(self._dirty)
+        for rank in dirty:
+            self._relay_rank(rank)
+        self._dirty.clear()
+        return dirty
+
+    def relayout(self):
+        """모든 rank 를 다시 배치 (여러 번 고친 뒤 교차를 줄이고 싶을 때)"""
+        self._dirty.update(range(len(self._ranks)))
+        return self.layout()
+
+    def snapshot(self):
+        """렌더링에 필요한 상태 복사본 - 워커 스레드에서 그려도 안전"""
+        self.layout()
+        xs = []
+        x = right = 0
+        for width, members in zip(self._widths, self._ranks):
+            xs.append(x)
+            if members:
+                right = x + width
+            x += width + RANK_GAP
+        half = max(((len(members) - 1) / 2 * ROW_GAP for members in self._ranks), default=0)
+        return LayoutSnapshot(dict(self._nodes), xs, list(self._fragments), right, half)
+
+    def position(self, node: str):
+        """노드 왼쪽 가운데 좌표 (x, y)"""
+        self.layout()
+        rank, y, _ = self._nodes[node]
+        return sum(self._widths[:rank]) + rank * RANK_GAP, y
+
+
+class LayoutSnapshot:
+    """LayeredLayout.snapshot() - 노드 위치와 rank 별 SVG 조각"""
+
+    __slots__ = ('nodes', 'xs', 'fragments', 'width', 'half_height')
+
+    def __init__(self, nodes, xs, fragments, width, half_height):
+        self.nodes = nodes
+        self.xs = xs
+        self.fragments = fragments
+        self.width = width
+        self.half_height = half_height
+
+    def edge_path(self, parent: str, child: str) -> str:
+        p_rank, p_y, p_width = self.nodes[parent]
+        c_rank, c_y, c_width = self.nodes[child]
+        x1 = self.xs[p_rank] + p_width
+        if p_rank < c_rank:
+            # 앞으로 가는 연결 - 부모 오른쪽 → 자식 왼쪽
+            x2 = self.xs[c_rank]
+            bend = (x2 - x1) / 2
+            return f"M{x1:g},{p_y:g} C{x1 + bend:g},{p_y:g} {x2 - bend:g},{c_y:g} {x2:g},{c_y:g}"
+        # 같은 열이나 뒤로 가는 연결 - 오른쪽으로 돌아 자식 오른쪽으로
+        x2 = self.xs[c_rank] + c_width
+        return (f"M{x1:g},{p_y:g} C{x1 + RANK_GAP / 2:g},{p_y:g} "
+                f"{x2 + RANK_GAP / 2:g},{c_y:g} {x2:g},{c_y:g}")
+
+    def write_svg(self, f, edges):
+        """edges: (parent, child, thought) - 생각은 툴팁으로"""
+        width = self.width + 2 * PADDING
+        height = 2 * self.half_height + NODE_HEIGHT + 2 * PADDING
+        top = -self.half_height - NODE_HEIGHT / 2 - PADDING
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:g}" height="{height:g}" '
+                f'viewBox="{-PADDING} {top:g} {width:g} {height:g}">\n')
+        f.write(f'<style>{STYLE}</style>\n<g class="edges">\n')
+        for parent, child, thought in edges:
+            path = self.edge_path(parent, child)
+            if thought:
+                f.write(f'<path class="edge" d="{path}"><title>{escape(thought)}</title></path>\n')
+            else:
+                f.write(f'<path class="edge skipped" d="{path}"/>\n')
+        f.write('</g>\n<g class="nodes">\n')
+        for x, fragment in zip(self.xs, self.fragments):
+            if fragment:
+                f.write(f'<g transform="translate({x:g},0)">\n{fragment}</g>\n')
+        f.write('</g>\n</svg>\n')
+
+
+@timed("render.save_svg")
+def save_svg(graph, filename: str, layout=None):
+    """그래프를 SVG 로 저장 - layout 은 LayeredLayout 또는 그 snapshot (없으면 새로 배치)"""
+    if layout is None:
+        layout = LayeredLayout.from_graph(graph)
+    if isinstance(layout, LayeredLayout):
+        layout = layout.snapshot()
+    with atomic_open(filename) as f:
+        layout.write_svg(f, ((e.parent, e.child, e.thought) for e in graph.edges()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="마인드맵 SVG 렌더링 (Graphviz 불필요)")
+    parser.add_argument('file', help="mindmap_*.json / .gmb")
+    parser.add_argument('-o', '--output', help="SVG 파일 (기본: 입력 이름.svg)")
+    args = parser.parse_args(argv)
+
+    reader = open_reader(args.file)
+    try:
+        graph = reader.load_graph()
+    finally:
+        reader.close()
+    output = args.output or os.path.splitext(compressed.base_name(args.file))[0] + '.svg'
+    save_svg(graph, output)
+    print(f"✓ {output} 파일 생성 완료!")
+
+
+if __name__ == "__main__":
+    main()
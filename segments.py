@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+증분 내보내기 - 부모별 조각 파일 + manifest
+
+저장할 때마다 CSV / DOT 전체를 다시 만들지 않고, 마지막 저장 이후 바뀐 부모
+(MindGraph.take_dirty)의 조각만 다시 쓴다. 자주 저장해도 비용은 맵 크기가 아니라 수정량에 비례한다.
+
+    DIR/manifest.json    부모 순서와 부모별 조각 번호
+    DIR/csv/<n>.csv      그 부모의 CSV 행 (header 없음)
+    DIR/dot/<n>.dot      그 부모의 DOT 연결
+
+조각을 manifest 순서로 이어 붙이면 save_csv_with_thoughts / save_dot_with_thoughts 결과와 같다.
+    export = SegmentExport("mindmap.parts")
+    export.update(graph, graph.take_dirty())
+    python gridmind_textual_v2.py --segments mindmap.parts        # Ctrl+S 가 조각만 갱신
+    python segments.py mindmap.parts --csv graph.csv --dot graph.dot  # 전체 파일로 합치기
+"""
+import argparse
+import csv
+import json
+import os
+import shutil
+
+from exporters import (BUFFER_SIZE, CSV_HEADER, DOT_HEADER, atomic_open, csv_row,
+                       write_dot_edge)
+from instrument import timed
+
+MANIFEST = 'manifest.json'
+FORMATS = ('csv', 'dot')
+_NEWLINE = {'csv': '', 'dot': None}
+
+
+class SegmentExport:
+    """부모별 조각 디렉터리 - 바뀐 부모의 조각만 다시 쓴다"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.manifest = self._read_manifest()
+
+    def _read_manifest(self):
+        try:
+            with open(os.path.join(self.directory, MANIFEST), encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {'version': 1, 'parents': [], 'next': 0}
+
+    def segment_path(self, fmt: str, n: int) -> str:
+        return os.path.join(self.directory, fmt, f"{n}.{fmt}")
+
+    def _write_segment(self, graph, parent: str, n: int):
+        with atomic_open(self.segment_path('csv', n), newline='') as f:
+            writer = csv.writer(f)
+            for edge in graph.edges_of(parent):
+                writer.writerow(csv_row(edge))
+        with atomic_open(self.segment_path('dot', n)) as f:
+            for edge in graph.edges_of(parent):
+                write_dot_edge(f, edge)
+
+    @timed("segments.update")
+    def update(self, graph, dirty=None, question: str = None):
+        """dirty 부모의 조각을 다시 쓰고 manifest 갱신 - 다시 쓴 부모 목록
+
+        dirty 가 None 이면 전부 다시 쓴다. manifest 에 없는 부모는 dirty 가 아니어도 쓰고,
+        그래프에서 사라진 부모의 조각은 지운다 (다른 세션이 쓰던 디렉터리여도 맞춰진다).
+        """
+        for fmt in FORMATS:
+            os.makedirs(os.path.join(self.directory, fmt), exist_ok=True)
+
+        segments = dict(self.manifest['parents'])  # 부모 단어 → 조각 번호
+        parents = graph.parents()
+        current = set(parents)
+        changed = current if dirty is None else set(dirty) | (current - segments.keys())
+
+        written = []
+        for parent in parents:
+            if parent not in changed:
+                continue
+            n = segments.get(parent)
+            if n is None:
+                n = segments[parent] = self.manifest['next']
+                self.manifest['next'] += 1
+            self._write_segment(graph, parent, n)
+            written.append(parent)
+
+        for parent in segments.keys() - current:
+            n = segments.pop(parent)
+            for fmt in FORMATS:
+                try:
+                    os.unlink(self.segment_path(fmt, n))
+                except FileNotFoundError:
+                    pass
+
+        self.manifest['parents'] = [[parent, segments[parent]] for parent in parents]
+        if question is not None:
+            self.manifest['question'] = question
+        with atomic_open(os.path.join(self.directory, MANIFEST)) as f:
+            json.dump(self.manifest, f, ensure_ascii=False)
+        return written
+
+    def assemble(self, fmt: str, filename: str):
+        """조각들을 manifest 순서로 이어서 전체 CSV / DOT 파일로"""
+        newline = _NEWLINE[fmt]
+        with atomic_open(filename, newline=newline, buffering=BUFFER_SIZE) as f:
+            if fmt == 'csv':
+                csv.writer(f).writerow(CSV_HEADER)
+            else:
+                f.write(DOT_HEADER)
+            for _, n in self.manifest['parents']:
+                with open(self.segment_path(fmt, n), encoding='utf-8', newline=newline) as part:
+                    shutil.copyfileobj(part, f, BUFFER_SIZE)
+            if fmt == 'dot':
+                f.write('}\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="증분 내보내기 조각을 전체 파일로 합치기")
+    parser.add_argument('directory', help="조각 디렉터리 (--segments 로 지정한 곳)")
+    parser.add_argument('--csv', help="합친 CSV 파일")
+    parser.add_argument('--dot', help="합친 DOT 파일")
+    args = parser.parse_args(argv)
+
+    export = SegmentExport(args.directory)
+    for fmt in FORMATS:
+        filename = getattr(args, fmt)
+        if filename:
+            export.assemble(fmt, filename)
+            print(f"✓ {filename} 파일 생성 완료!")
+
+
+if __name__ == "__main__":
+    main()
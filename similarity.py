@@ -0,0 +1,126 @@
+"""
+비슷한 생각 찾기 - 입력 중인 생각과 닮은 이전 raw_thought 추천
+
+키워드(extract_keywords, casefold) → (연결 ID, 등장 횟수) 역색인 위에서 idf 로 가중한 코사인 유사도.
+질의 단어들의 posting 만 모아 점수를 더한다.
+NumPy 가 있으면 posting array 를 복사 없이 보고 np.bincount 로 한 번에 합산하고 (10만 생각에서 수 ms),
+없으면 같은 계산을 dict 로 한다 (작은 세션용).
+
+    score(d) = Σ_t q_t · d_t · idf_t² / (‖q‖ · ‖d‖)      idf_t = ln((N + 1) / (df_t + 1)) + 1
+‖q‖, ‖d‖ 는 tf 로만 구한다. ‖d‖ 를 추가할 때 한 번만 계산하면 되고, 순위에는 idf 가 그대로 반영된다.
+"""
+import math
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # 선택 의존성 - 없으면 dict 로 계산
+    np = None
+
+from tokenizer import extract_keywords
+
+
+def _terms(text: str) -> dict:
+    counts = {}
+    for token in extract_keywords(text):
+        token = token.casefold()
+        counts[token] = counts.get(token, 0) + 1
+    return counts
+
+
+class ThoughtIndex:
+    """생각 원문 TF-IDF 역색인 - KeywordIndex 처럼 연결 추가/되돌리기와 같이 갱신"""
+
+    def __init__(self):
+        self._postings = {}  # 단어 → (연결 ID array, 등장 횟수 array)
+        self._edge_terms = {}  # 연결 ID → 단어들 (되돌리기용)
+        self._norms = array('d')  # 연결 ID → ‖d‖ (생각이 없으면 0)
+
+    @classmethod
+    def from_graph(cls, graph):
+        index = cls()
+        for edge_id in range(len(graph)):
+            index.add(graph.edge(edge_id))
+        return index
+
+    def __len__(self):
+        """색인된 생각 수"""
+        return len(self._edge_terms)
+
+    def add(self, edge):
+        norms = self._norms
+        while len(norms) <= edge.id:
+            norms.append(0.0)
+
+        terms = _terms(edge.thought)
+        if not terms:
+            return
+        self._edge_terms[edge.id] = tuple(terms)
+        norms[edge.id] = math.sqrt(sum(tf * tf for tf in terms.values()))
+        for term, tf in terms.items():
+            posting = self._postings.get(term)
+            if posting is None:
+                posting = self._postings[term] = (array('l'), array('d'))
+            posting[0].append(edge.id)
+            posting[1].append(tf)
+
+    def remove(self, edge):
+        for term in self._edge_terms.pop(edge.id, ()):
+            ids, tfs = self._postings[term]
+            # 되돌리기는 항상 마지막 연결이므로 보통 끝에서 바로 빠진다
+            position = len(ids) - 1 if ids[-1] == edge.id else ids.index(edge.id)
+            del ids[position]
+            del tfs[position]
+            if not ids:
+                del self._postings[term]
+        if edge.id < len(self._norms):
+            self._norms[edge.id] = 0.0
+
+    def similar(self, text: str, limit: int = 5, exclude=()):
+        """text 와 비슷한 생각의 (연결 ID, 점수) - 점수 내림차순"""
+        query = _terms(text)
+        postings = [(self._postings[t], tf) for t, tf in query.items() if t in self._postings]
+        if not postings:
+            return []
+
+        n_docs = len(self._edge_terms)
+        weighted = []
+        for (ids, tfs), tf in postings:
+            idf = math.log((n_docs + 1) / (len(ids) + 1)) + 1
+            weighted.append((ids, tfs, tf * idf * idf))
+        # 색인에 없는 질의 단어도 ‖q‖ 에는 들어간다 (모르는 단어가 많을수록 점수가 낮다)
+        q_norm = math.sqrt(sum(tf * tf for tf in query.values()))
+
+        if np is not None:
+            return self._similar_numpy(weighted, q_norm, limit, exclude)
+
+        scores = {}
+        for ids, tfs, weight in weighted:
+            for edge_id, tf in zip(ids, tfs):
+                scores[edge_id] = scores.get(edge_id, 0.0) + tf * weight
+        norms = self._norms
+        ranked = sorted(
+            ((edge_id, score / (q_norm * norms[edge_id])) for edge_id, score in scores.items()
+             if edge_id not in exclude),
+            key=lambda item: (-item[1], item[0]),
+        )
+        return ranked[:limit]
+
+    def _similar_numpy(self, weighted, q_norm, limit, exclude):
+        ids = np.concatenate([np.frombuffer(ids, dtype='l') for ids, _, _ in weighted])
+        contributions = np.concatenate([
+            np.frombuffer(tfs, dtype='d') * weight for _, tfs, weight in weighted
+        ])
+        norms = np.frombuffer(self._norms, dtype='d')
+        scores = np.bincount(ids, weights=contributions, minlength=len(norms))
+        hit = scores > 0
+        scores[hit] /= q_norm * norms[hit]
+        if exclude:
+            scores[list(exclude)] = 0.0
+
+        k = min(limit, int(np.count_nonzero(scores)))
+        if k == 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.lexsort((top, -scores[top]))]
+        return [(int(i), float(scores[i])) for i in top]
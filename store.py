@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+SQLite 저장소 (선택) - 여러 마인드맵을 한 DB 에 모아 질의
+
+    questions    질문 하나 = 맵 하나 (text, timestamp, source, pairs, session)
+                 session 이 같은 맵은 다시 저장하면 행을 새로 만들지 않고 연결을 바꿔 넣는다
+    nodes        단어 (word UNIQUE) - 'a#2' 같은 노드 이름은 단어 'a' 로 저장
+    parents      맵의 부모 노드 순서 (연결이 없는 부모도 남도록, n = 몇 번째 등장)
+    connections  parent → child 연결과 원문 (question 별 입력 순서 seq,
+                 parent_n / child_n = 질문 안에서 몇 번째 등장한 단어인지)
+    keywords     연결의 키워드 (casefold, 색인)
+
+저장은 맵 단위 트랜잭션에 executemany 로 한 번에 넣는다.
+    python gridmind_textual_v2.py --db maps.db          # Ctrl+S 때 DB 에도 저장
+    python gridmind_batch.py corpus.jsonl --db maps.db  # 배치 결과를 DB 로
+    python store.py import maps.db mindmap_*.json graph.csv
+    python store.py between maps.db 시스템 효율         # 두 단어를 잇는 생각들
+    python store.py keyword maps.db 속도
+"""
+import argparse
+import csv
+import os
+import sqlite3
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+
+import compressed
+from loader import open_reader
+from mindgraph import MindGraph
+from pairing import node_name, split_node
+from tokenizer import extract_keywords
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    id        INTEGER PRIMARY KEY,
+    text      TEXT NOT NULL,
+    timestamp TEXT,
+    source    TEXT,
+    pairs     TEXT,
+    session   TEXT
+);
+CREATE TABLE IF NOT EXISTS nodes (
+    id   INTEGER PRIMARY KEY,
+    word TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS parents (
+    question_id INTEGER NOT NULL REFERENCES questions(id) ON DELETE CASCADE,
+    seq         INTEGER NOT NULL,
+    node_id     INTEGER NOT NULL REFERENCES nodes(id),
+    n           INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS connections (
+    id          INTEGER PRIMARY KEY,
+    question_id INTEGER NOT NULL REFERENCES questions(id) ON DELETE CASCADE,
+    seq         INTEGER NOT NULL,
+    parent_id   INTEGER NOT NULL REFERENCES nodes(id),
+    child_id    INTEGER NOT NULL REFERENCES nodes(id),
+    thought     TEXT NOT NULL DEFAULT '',
+    parent_n    INTEGER NOT NULL DEFAULT 1,
+    child_n     INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS keywords (
+    connection_id INTEGER NOT NULL REFERENCES connections(id) ON DELETE CASCADE,
+    keyword       TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS connections_question ON connections(question_id, seq);
+CREATE INDEX IF NOT EXISTS connections_pair ON connections(parent_id, child_id);
+CREATE INDEX IF NOT EXISTS connections_child ON connections(child_id);
+CREATE INDEX IF NOT EXISTS keywords_keyword ON keywords(keyword);
+CREATE INDEX IF NOT EXISTS keywords_connection ON keywords(connection_id);
+CREATE INDEX IF NOT EXISTS questions_text ON questions(text);
+CREATE UNIQUE INDEX IF NOT EXISTS questions_session ON questions(session);
+CREATE INDEX IF NOT EXISTS parents_question ON parents(question_id, seq);
+"""
+
+
+class MindStore:
+    """마인드맵 SQLite 저장소 - 연결 하나를 한 스레드/프로세스에서 쓴다"""
+
+    def __init__(self, path: str, timeout: float = 60.0):
+        self.path = path
+        self.db = sqlite3.connect(path, timeout=timeout)
+        self.db.execute("PRAGMA journal_mode=WAL")  # 저장 중에도 다른 프로세스가 읽을 수 있게
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("PRAGMA foreign_keys=ON")
+        self.db.executescript(SCHEMA)
+        self._node_ids = {}
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @contextmanager
+    def transaction(self):
+        """묶음 저장 - 성공하면 commit, 예외면 rollback"""
+        try:
+            with self.db:
+                yield self
+        except BaseException:
+            self._node_ids.clear()  # rollback 된 nodes 행의 id 가 캐시에 남지 않게
+            raise
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+    def _node_id_map(self, words):
+        """단어 → nodes.id (처음 보는 단어는 한 번에 INSERT)"""
+        node_ids = self._node_ids
+        missing = [(w,) for w in set(words) if w not in node_ids]
+        if missing:
+            self.db.executemany("INSERT OR IGNORE INTO nodes(word) VALUES (?)", missing)
+            cursor = self.db.cursor()
+            for chunk_start in range(0, len(missing), 500):
+                chunk = [w for (w,) in missing[chunk_start:chunk_start + 500]]
+                cursor.execute(
+                    f"SELECT word, id FROM nodes WHERE word IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+                node_ids.update(cursor.fetchall())
+        return node_ids
+
+    def add_map(self, graph, question: str, timestamp: str = None, source: str = None,
+                pairs: str = None, session: str = None) -> int:
+        """그래프 하나를 저장하고 questions.id 반환 (호출한 쪽 트랜잭션 안에서)
+
+        session 이 이미 저장된 맵이면 그 행을 고치고 연결을 통째로 바꾼다 (같은 세션을
+        여러 번 저장해도 맵은 하나).
+        """
+        values = (question, timestamp or datetime.now().isoformat(), source, pairs)
+        row = None
+        if session is not None:
+            row = self.db.execute(
+                "SELECT id FROM questions WHERE session = ?", (session,)).fetchone()
+        if row is None:
+            cursor = self.db.execute(
+                "INSERT INTO questions(text, timestamp, source, pairs, session)"
+                " VALUES (?, ?, ?, ?, ?)", (*values, session))
+            question_id = cursor.lastrowid
+        else:
+            (question_id,) = row
+            self.db.execute(
+                "UPDATE questions SET text = ?, timestamp = ?, source = ?, pairs = ? WHERE id = ?",
+                (*values, question_id))
+            # 키워드는 ON DELETE CASCADE 로 같이 지워진다
+            self.db.execute("DELETE FROM connections WHERE question_id = ?", (question_id,))
+            self.db.execute("DELETE FROM parents WHERE question_id = ?", (question_id,))
+
+        edges = list(graph.edges())
+        parents = graph.parents()
+        # 노드는 단어로 - 'a#2' 는 단어 'a' 와 등장 순번 2 로 나눠서 저장
+        names = {name: split_node(name)
+                 for name in [e.parent for e in edges] + [e.child for e in edges] + parents}
+        node_ids = self._node_id_map([word for word, _ in names.values()])
+
+        self.db.executemany(
+            "INSERT INTO parents(question_id, seq, node_id, n) VALUES (?, ?, ?, ?)",
+            [(question_id, seq, node_ids[names[parent][0]], names[parent][1])
+             for seq, parent in enumerate(parents)])
+
+        # 연결 id 를 미리 정해 두고 키워드와 함께 한 번에 넣는다
+        (last_id,) = self.db.execute("SELECT COALESCE(MAX(id), 0) FROM connections").fetchone()
+        connections = []
+        keywords = []
+        for seq, edge in enumerate(edges):
+            connection_id = last_id + 1 + seq
+            parent, parent_n = names[edge.parent]
+            child, child_n = names[edge.child]
+            connections.append((connection_id, question_id, seq, node_ids[parent],
+                                 node_ids[child], edge.thought, parent_n, child_n))
+            keywords.extend((connection_id, kw) for kw in {k.casefold() for k in edge.keywords})
+        self.db.executemany(
+            "INSERT INTO connections(id, question_id, seq, parent_id, child_id, thought,"
+            " parent_n, child_n) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", connections)
+        self.db.executemany(
+            "INSERT INTO keywords(connection_id, keyword) VALUES (?, ?)", keywords)
+        return question_id
+
+    def save_map(self, graph, question: str, **kwargs) -> int:
+        """맵 하나를 트랜잭션 하나로 저장"""
+        with self.transaction():
+            return self.add_map(graph, question, **kwargs)
+
+    def add_maps(self, maps, source: str = None, pairs: str = None) -> int:
+        """(question, graph) 여러 개를 트랜잭션 하나로 저장 - 저장한 맵 수"""
+        count = 0
+        with self.transaction():
+            for question, graph in maps:
+                self.add_map(graph, question, source=source, pairs=pairs)
+                count += 1
+        return count
+
+    def import_file(self, path: str) -> int:
+        """기존 내보내기 파일 가져오기 - mindmap_*.json / .gmb / CSV. 가져온 맵 수"""
+        source = os.path.basename(path)
+        if compressed.base_name(path).endswith('.csv'):
+            return self.add_maps(read_csv_maps(path), source=source)
+
+        reader = open_reader(path)
+        try:
+            graph = reader.load_graph()
+        finally:
+            reader.close()
+        meta = reader.meta
+        self.save_map(graph, meta.get('question', ''), timestamp=meta.get('timestamp'),
+                      source=source, pairs=meta.get('pairs'), session=meta.get('session'))
+        return 1
+
+    # ------------------------------------------------------------------
+    # 질의
+    # ------------------------------------------------------------------
+    def between(self, x: str, y: str, directed: bool = False):
+        """x 와 y 를 잇는 생각들 - (question, parent, child, thought)
+
+        단어 기준이라 'a#2' → 'b' 같은 반복 단어의 연결도 걸린다.
+        """
+        sql = """
+            SELECT q.text, p.word, c.word, k.thought
+            FROM connections k
+            JOIN nodes p ON p.id = k.parent_id
+            JOIN nodes c ON c.id = k.child_id
+            JOIN questions q ON q.id = k.question_id
+            WHERE k.thought != '' AND (
+                (k.parent_id = (SELECT id FROM nodes WHERE word = :x)
+                 AND k.child_id = (SELECT id FROM nodes WHERE word = :y))
+        """
+        if not directed:
+            sql += """
+                OR (k.parent_id = (SELECT id FROM nodes WHERE word = :y)
+                    AND k.child_id = (SELECT id FROM nodes WHERE word = :x))
+            """
+        sql += ") ORDER BY k.question_id, k.seq"
+        return self.db.execute(sql, {'x': x, 'y': y}).fetchall()
+
+    def with_keyword(self, keyword: str, limit: int = 200):
+        """키워드를 가진 연결 - (question, parent, child, thought)"""
+        return self.db.execute("""
+            SELECT q.text, p.word, c.word, k.thought
+            FROM keywords w
+            JOIN connections k ON k.id = w.connection_id
+            JOIN nodes p ON p.id = k.parent_id
+            JOIN nodes c ON c.id = k.child_id
+            JOIN questions q ON q.id = k.question_id
+            WHERE w.keyword = ?
+            ORDER BY k.question_id, k.seq
+            LIMIT ?
+        """, (keyword.casefold(), limit)).fetchall()
+
+    def load_map(self, question_id: int) -> MindGraph:
+        """저장된 맵 하나를 MindGraph 로 (연결이 없는 부모도 저장된 순서대로)"""
+        graph = MindGraph()
+        for word, n in self.db.execute("""
+            SELECT w.word, p.n FROM parents p
+            JOIN nodes w ON w.id = p.node_id
+            WHERE p.question_id = ?
+            ORDER BY p.seq
+        """, (question_id,)):
+            graph.add_parent(node_name(word, n))
+        rows = self.db.execute("""
+            SELECT k.id, p.word, k.parent_n, c.word, k.child_n, k.thought
+            FROM connections k
+            JOIN nodes p ON p.id = k.parent_id
+            JOIN nodes c ON c.id = k.child_id
+            WHERE k.question_id = ?
+            ORDER BY k.seq
+        """, (question_id,)).fetchall()
+        keywords = {}
+        for connection_id, keyword in self.db.execute("""
+            SELECT w.connection_id, w.keyword FROM keywords w
+            JOIN connections k ON k.id = w.connection_id
+            WHERE k.question_id = ?
+        """, (question_id,)):
+            keywords.setdefault(connection_id, []).append(keyword)
+        for connection_id, parent, parent_n, child, child_n, thought in rows:
+            graph.add_edge(node_name(parent, parent_n), node_name(child, child_n), thought,
+                           keywords.get(connection_id, ()))
+        return graph
+
+
+def read_csv_maps(path: str):
+    """CSV 내보내기에서 (question, graph) - 형식은 헤더로 판단
+
+    question,from,to,thought          배치 입력 (question 별로 맵 하나)
+    from,to,label,thought,keywords    MindMapApp CSV
+    from,to,label                     gridmind.py CSV (부모 → 부모_자식 → 부모_자식_키워드)
+    """
+    with compressed.open_read(path, newline='') as f:
+        rows = csv.DictReader(f)
+        fields = rows.fieldnames or []
+        if 'thought' not in fields:
+            yield '', _read_keyword_csv(rows)
+            return
+
+        question, graph = None, None
+        for row in rows:
+            row_question = row.get('question', '')
+            if graph is None or row_question != question:
+                if graph is not None:
+                    yield question, graph
+                question, graph = row_question, MindGraph()
+            thought = row['thought']
+            graph.add_edge(row['from'], row['to'], thought, extract_keywords(thought))
+        if graph is not None:
+            yield question, graph
+
+
+def _read_keyword_csv(rows) -> MindGraph:
+    """gridmind.py CSV 를 연결 + 키워드로 되돌림 (생각 원문은 없음)"""
+    edges = {}  # 부모_자식 라벨 → (parent, child, keywords)
+    for row in rows:
+        edge = edges.get(row['from'])
+        if edge is not None:
+            edge[2].append(row['label'])
+        else:
+            edges[row['to']] = (row['from'], row['label'], [])
+    graph = MindGraph()
+    for parent, child, keywords in edges.values():
+        graph.add_edge(parent, child, '', keywords)
+    return graph
+
+
+def print_rows(rows):
+    for question, parent, child, thought in rows:
+        print(f"[{question}] {parent} → {child}: {thought}")
+    print(f"({len(rows)}개)", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="gridmind SQLite 저장소")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    command = commands.add_parser('import', help="mindmap_*.json / .gmb / CSV 가져오기")
+    command.add_argument('db')
+    command.add_argument('files', nargs='+')
+
+    command = commands.add_parser('between', help="두 단어를 잇는 생각들")
+    command.add_argument('db')
+    command.add_argument('x')
+    command.add_argument('y')
+    command.add_argument('--directed', action='store_true', help="x → y 방향만")
+
+    command = commands.add_parser('keyword', help="키워드를 가진 연결")
+    command.add_argument('db')
+    command.add_argument('keyword')
+    command.add_argument('--limit', type=int, default=200)
+
+    args = parser.parse_args(argv)
+    with MindStore(args.db) as store:
+        if args.command == 'import':
+            total = 0
+            for path in args.files:
+                total += store.import_file(path)
+            print(f"✓ {len(args.files)}개 파일에서 {total}개 맵 가져옴", file=sys.stderr)
+        elif args.command == 'between':
+            print_rows(store.between(args.x, args.y, args.directed))
+        elif args.command == 'keyword':
+            print_rows(store.with_keyword(args.keyword, args.limit))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""그래프 분석 - 반복 단어 노드('a#2')는 단어 하나로 센다"""
+import pytest
+
+np = pytest.importorskip('numpy')
+
+import exporters  # noqa: E402
+from analytics import GraphMatrix, load_matrix  # noqa: E402
+from mindgraph import MindGraph  # noqa: E402
+
+
+def make_graph():
+    # 질문 "a b a" - 두 번째 'a' 는 노드 'a#2'
+    graph = MindGraph()
+    for parent, children in (('a', ['b', 'a#2']), ('b', ['a', 'a#2']), ('a#2', ['a', 'b'])):
+        graph.add_parent(parent)
+        for child in children:
+            graph.add_edge(parent, child, f"{parent} {child}", ['속도'])
+    return graph
+
+
+def check(matrix):
+    assert sorted(matrix.words) == ['a', 'b']
+    out_degree, in_degree = matrix.degree()
+    degree = dict(zip(matrix.words, zip(out_degree.tolist(), in_degree.tolist())))
+    assert degree == {'a': (4.0, 4.0), 'b': (2.0, 2.0)}
+    assert dict(((p, c), w) for p, c, w in matrix.strongest_links(10)) == {
+        ('a', 'a'): 2.0, ('a', 'b'): 2.0, ('b', 'a'): 2.0}
+    assert matrix.cooccurrence().top_keywords('a') == [('속도', 8)]
+    assert matrix.components().tolist() == [0, 0]
+
+
+def test_from_graph_merges_repeated_words():
+    check(GraphMatrix.from_graph(make_graph()))
+
+
+def test_load_matrix_merges_repeated_words(tmp_path):
+    path = str(tmp_path / "mindmap.json")
+    exporters.save_json(make_graph(), "a b a", path)
+    check(load_matrix([path]))
+
+
+def test_thoughts_only_and_edgeless_parents():
+    graph = make_graph()
+    graph.add_edge('b', 'c')  # 건너뛴 연결
+    graph.add_parent('d')
+    matrix = GraphMatrix.from_graph(graph, thoughts_only=True)
+    assert sorted(matrix.words) == ['a', 'b', 'd']
+    assert len(matrix.centrality()) == 3
@@ -0,0 +1,90 @@
+"""배치 모드 - --jobs N 결과가 한 프로세스로 돌린 결과와 같은지 (파일 출력, DB)"""
+import json
+import sqlite3
+
+import pytest
+
+import gridmind_batch
+
+QUESTIONS = [
+    "시스템 설계 효율",
+    "a b a c",
+    "속도 와 정확도",
+    "하나",
+    "사용자 경험 설계 사용자",
+    "x y z w",
+    "반복 반복 반복",
+    "데이터 구조 알고리즘 성능",
+]
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    path = tmp_path / "questions.jsonl"
+    with open(path, 'w', encoding='utf-8') as f:
+        for k, question in enumerate(QUESTIONS):
+            words = question.split()
+            if k % 2:
+                # 질문 순서대로 답한 리스트 (빈 답은 건너뛰기)
+                n_pairs = len(words) * (len(words) - 1)
+                notes = [f"생각 {k}-{n}, \"따옴표\"" if n % 3 else "" for n in range(n_pairs)]
+            else:
+                notes = {f"{words[0]}->{child}": f"{words[0]} 와 {child} 생각 {k}"
+                         for child in words[1:]}
+            f.write(json.dumps({'question': question, 'notes': notes}, ensure_ascii=False) + "\n")
+    return str(path)
+
+
+def run(corpus, out_dir, *options):
+    paths = {fmt: str(out_dir / f"out.{fmt}") for fmt in ('csv', 'dot', 'jsonl')}
+    out_dir.mkdir()
+    gridmind_batch.main([corpus, '--csv', paths['csv'], '--dot', paths['dot'],
+                         '--jsonl', paths['jsonl'], *options])
+    outputs = {}
+    for fmt, path in paths.items():
+        with open(path, 'rb') as f:
+            outputs[fmt] = f.read()
+    return outputs
+
+
+def test_parallel_matches_serial(corpus, tmp_path):
+    serial = run(corpus, tmp_path / "serial")
+    parallel = run(corpus, tmp_path / "parallel", '--jobs', '2', '--chunk-size', '1')
+    assert serial['csv'].count(b'\n') > len(QUESTIONS)
+    assert parallel == serial
+
+
+def test_unordered_has_same_lines(corpus, tmp_path):
+    serial = run(corpus, tmp_path / "serial")
+    unordered = run(corpus, tmp_path / "unordered",
+                    '--jobs', '2', '--chunk-size', '1', '--unordered')
+    for fmt in serial:
+        assert sorted(unordered[fmt].splitlines()) == sorted(serial[fmt].splitlines())
+
+
+def stored_maps(path):
+    with sqlite3.connect(path) as db:
+        return sorted(db.execute("""
+            SELECT q.text, q.source, q.pairs, k.seq, p.word, k.parent_n, c.word, k.child_n,
+                   k.thought, (SELECT group_concat(keyword, ' ') FROM
+                               (SELECT keyword FROM keywords WHERE connection_id = k.id
+                                ORDER BY keyword))
+            FROM connections k
+            JOIN questions q ON q.id = k.question_id
+            JOIN nodes p ON p.id = k.parent_id
+            JOIN nodes c ON c.id = k.child_id
+        """).fetchall())
+
+
+@pytest.mark.parametrize('order', [[], ['--unordered']])
+def test_parallel_db_matches_serial(corpus, tmp_path, order):
+    serial_db, parallel_db = str(tmp_path / "serial.db"), str(tmp_path / "parallel.db")
+    run(corpus, tmp_path / "serial", '--db', serial_db)
+    run(corpus, tmp_path / "parallel", '--db', parallel_db,
+        '--jobs', '2', '--chunk-size', '1', *order)
+
+    expected = stored_maps(serial_db)
+    assert expected
+    assert stored_maps(parallel_db) == expected
+    with sqlite3.connect(parallel_db) as db:
+        assert db.execute("SELECT COUNT(*) FROM questions").fetchone() == (len(QUESTIONS),)
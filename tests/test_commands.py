@@ -0,0 +1,85 @@
+"""명령 로그 - undo 깊이 제한, 자동 명령으로 시작하는 로그"""
+import asyncio
+
+from textual.widgets import Input, TextArea
+
+from commands import ADVANCE, EDGE, PARENT, CommandLog
+from gridmind_textual_v2 import MindMapApp
+from mindgraph import MindGraph
+
+
+def test_undo_depth_is_bounded():
+    graph = MindGraph()
+    log = CommandLog(max_depth=5)
+    graph.add_parent('a')
+    for j in range(40):
+        log.record(EDGE, 0, j)
+        graph.add_edge('a', f"c{j}", f"생각 {j}")
+        assert len(log) <= 10
+
+    undone = 0
+    while log.can_undo():
+        undone += len(log.undo(graph, 0, 40))
+    # 잘라 낸 오래된 명령의 연결은 그래프에 남는다
+    assert 5 <= undone <= 10
+    assert len(graph) == 40 - undone
+
+
+def test_compaction_keeps_command_groups():
+    graph = MindGraph()
+    log = CommandLog(max_depth=2)
+    for i in range(10):
+        parent = f"p{i}"
+        graph.add_parent(parent)
+        graph.add_edge(parent, 'x', '생각')
+        log.record(EDGE, i, 0)
+        log.record(ADVANCE, i, 1)
+
+    # 잘린 뒤에도 되돌리기 단위는 (사용자 명령 + 뒤따른 자동 명령)
+    while log.can_undo():
+        ops = [op for op, *_ in log.undo(graph, 0, 0)]
+        assert ops == [ADVANCE, EDGE]
+
+
+def test_leading_automatic_commands_are_not_undone():
+    # 첫 부모에 자식이 없으면 로그가 자동 명령(PARENT)으로 시작한다
+    graph = MindGraph()
+    log = CommandLog()
+    graph.add_parent('x')
+    log.record(PARENT, 0, 0)
+    graph.add_parent('aaaa')
+    log.record(EDGE, 1, 0)
+    graph.add_edge('aaaa', 'bbbb', "생각")
+
+    assert [op for op, *_ in log.undo(graph, 1, 1)] == [EDGE]
+    assert not log.can_undo()
+    assert log.undo(graph, 1, 0) == []
+    assert log.can_redo()
+    assert [op for op, *_ in log.redo(graph, 1, 0)] == [EDGE]
+    assert graph.to_structure()[1][1]['child'] == 'bbbb'
+
+
+def test_app_redo_after_undo_past_first_parent(tmp_path):
+    asyncio.run(drive_auto_advance(str(tmp_path / "s.journal")))
+
+
+async def drive_auto_advance(journal_path: str):
+    app = MindMapApp(journal_path=journal_path, pairs='topk=2')
+    async with app.run_test(size=(120, 40)) as pilot:
+        app.query_one("#question-input", Input).value = "x aaaa bbbb"
+        app.start_mapping()
+        assert (app.current_index, app.current_child_index) == (1, 0)
+        app.query_one("#notes-textarea", TextArea).text = "생각"
+        app.process_current()
+        await pilot.pause()
+
+        app.undo_last()
+        app.undo_last()  # 되돌릴 사용자 명령이 없으므로 아무 일도 없다
+        await pilot.pause()
+        assert app.query_one("#undo-btn").disabled
+        assert (app.current_index, app.current_child_index) == (1, 0)
+
+        app.redo_last()
+        await pilot.pause()
+        assert app.graph.to_structure()[:2] == [
+            ['x'], ['aaaa', {'child': 'bbbb', 'raw_thought': "생각", 'keywords': ['생각']}]]
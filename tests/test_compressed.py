@@ -0,0 +1,107 @@
+"""압축 파일 - 코덱별 쓰기/읽기 왕복과 실패 경로"""
+import errno
+import io
+import os
+import threading
+
+import pytest
+
+import compressed
+import exporters
+
+CODECS = ['gz', 'xz', 'bz2']
+TEXT = "".join(f'부모{i},자식{i},"생각 {i} 은 ""따옴표"" 포함"\r\n' for i in range(20000))
+
+
+@pytest.mark.parametrize('codec', CODECS)
+def test_atomic_open_round_trip(tmp_path, codec):
+    path = str(tmp_path / f"graph.csv.{codec}")
+    with exporters.atomic_open(path, newline='') as f:
+        f.write(TEXT)
+    with compressed.open_read(path, newline='') as f:
+        assert f.read() == TEXT
+    assert os.path.getsize(path) < len(TEXT.encode('utf-8'))
+
+
+@pytest.mark.parametrize('codec', CODECS)
+def test_binary_round_trip(tmp_path, codec):
+    data = os.urandom(1 << 16) * 20
+    path = str(tmp_path / f"blob.bin.{codec}")
+    with exporters.atomic_open(path, mode='wb') as f:
+        f.write(data)
+    with compressed.open_read(path, 'rb') as f:
+        assert f.read() == data
+
+
+def test_compress_file(tmp_path):
+    path = tmp_path / "mindmap.json"
+    path.write_text(TEXT, encoding='utf-8', newline='')
+    target = compressed.compress_file(str(path), 'xz')
+    assert target == f"{path}.xz" and not path.exists()
+    with compressed.open_read(target, newline='') as f:
+        assert f.read() == TEXT
+
+
+class FailingFile(io.RawIOBase):
+    """fail_after 바이트를 받은 뒤 ENOSPC (디스크가 가득 찬 것처럼)"""
+
+    def __init__(self, fail_after: int):
+        self.fail_after = fail_after
+        self.written = 0
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        if self.written + len(b) > self.fail_after:
+            raise OSError(errno.ENOSPC, "No space left on device")
+        self.written += len(b)
+        return len(b)
+
+
+def close_in_thread(f):
+    """close() 가 멈추면 테스트가 끝나지 않으므로 스레드에서 제한 시간을 두고 닫는다"""
+    errors = []
+
+    def run():
+        try:
+            f.close()
+        except BaseException as exc:
+            errors.append(exc)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(10)
+    assert not thread.is_alive(), "close() 가 멈춤"
+    return errors
+
+
+@pytest.mark.parametrize('codec', CODECS)
+def test_error_in_final_flush_is_raised(codec):
+    # 본문은 압축기 버퍼에 다 들어가고 마무리 flush 에서만 쓰기가 일어나도록 작은 입력
+    f = compressed.open_write(FailingFile(0), f"x.{codec}", 'wb')
+    f.write(b"short")
+    errors = close_in_thread(f)
+    assert len(errors) == 1 and isinstance(errors[0], OSError)
+
+
+@pytest.mark.parametrize('codec', CODECS)
+def test_error_while_writing_is_raised(codec):
+    f = compressed.open_write(FailingFile(1024), f"x.{codec}", 'wb', buffering=4096)
+    with pytest.raises(OSError):
+        for _ in range(2000):
+            f.write(os.urandom(4096))  # 압축이 안 되는 내용이라 곧 1 KB 를 넘는다
+    close_in_thread(f)
+
+
+@pytest.mark.parametrize('codec', CODECS)
+def test_failed_save_leaves_no_tmp_file(tmp_path, codec, monkeypatch):
+    def fail_compressor(codec_module, fileobj):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(compressed, '_compressor', fail_compressor)
+    path = str(tmp_path / f"graph.json.{codec}")
+    with pytest.raises(OSError):
+        with exporters.atomic_open(path) as f:
+            f.write(TEXT)
+    assert os.listdir(tmp_path) == []
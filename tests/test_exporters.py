@@ -0,0 +1,45 @@
+"""atomic_open - 권한은 umask 를 따르고, 실패하면 임시 파일을 남기지 않는다"""
+import os
+import stat
+
+import pytest
+
+import exporters
+
+
+@pytest.fixture
+def umask():
+    previous = os.umask(0o027)
+    yield 0o027
+    os.umask(previous)
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="POSIX 권한")
+@pytest.mark.parametrize('name', ['out.csv', 'out.csv.gz'])
+def test_mode_follows_umask(tmp_path, umask, name):
+    path = tmp_path / name
+    with exporters.atomic_open(str(path)) as f:
+        f.write("a,b\n")
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o666 & ~umask
+
+    # 나중에 바뀐 umask 도 그대로 따른다 (import 때 읽어 둔 값이 아니다)
+    os.umask(0o077)
+    with exporters.atomic_open(str(path)) as f:
+        f.write("c,d\n")
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_replaces_only_on_success(tmp_path):
+    path = tmp_path / "out.txt"
+    path.write_text("이전", encoding='utf-8')
+    with pytest.raises(RuntimeError):
+        with exporters.atomic_open(str(path)) as f:
+            f.write("새 내용")
+            raise RuntimeError
+    assert path.read_text(encoding='utf-8') == "이전"
+    assert os.listdir(tmp_path) == ["out.txt"]
+
+    with exporters.atomic_open(str(path)) as f:
+        f.write("새 내용")
+    assert path.read_text(encoding='utf-8') == "새 내용"
+    assert os.listdir(tmp_path) == ["out.txt"]
@@ -0,0 +1,48 @@
+"""히스토리 테이블 - 되돌리기로 마지막 행을 지워도 행 색인이 맞는지"""
+import asyncio
+
+from textual.app import App
+
+from gridmind_textual_v2 import HistoryTable
+
+
+class TableApp(App):
+    def compose(self):
+        table = HistoryTable()
+        table.add_columns("From", "To", "Thought")
+        yield table
+
+
+async def pop_rows(n_rows: int, pops):
+    app = TableApp()
+    async with app.run_test() as pilot:
+        table = app.query_one(HistoryTable)
+        for k in range(n_rows):
+            table.add_row(f"부모{k}", f"자식{k}", f"생각 {k}", key=str(k))
+        await pilot.pause()
+        table.move_cursor(row=n_rows - 1)
+        locations = table._row_locations
+
+        for key in pops:
+            table.pop_row(key)
+        await pilot.pause()
+        return table, locations
+
+
+def test_pop_last_rows_keeps_index():
+    table, locations = asyncio.run(pop_rows(2000, ["1999", "1998", "1997"]))
+    assert table._row_locations is locations  # 색인을 새로 만들지 않았다
+    assert table.row_count == 1997
+    assert [row.key.value for row in table.ordered_rows[-2:]] == ["1995", "1996"]
+    assert table.get_row_at(1996) == ["부모1996", "자식1996", "생각 1996"]
+    assert table.cursor_row == 1996
+
+    table.add_row("새", "행", "추가", key="new")
+    assert table.get_row_index("new") == 1997
+
+
+def test_pop_middle_row_falls_back_to_remove_row():
+    table, _ = asyncio.run(pop_rows(10, ["3"]))
+    assert [row.key.value for row in table.ordered_rows] == ["0", "1", "2", "4", "5", "6",
+                                                             "7", "8", "9"]
+    assert table.get_row_at(3) == ["부모4", "자식4", "생각 4"]
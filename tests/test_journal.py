@@ -0,0 +1,133 @@
+"""저널 + checkpoint 재생 - 복구한 세션이 살아 있던 세션과 같은지"""
+import asyncio
+import os
+import random
+
+import pytest
+from textual.widgets import Input, TextArea
+
+from gridmind_textual_v2 import MindMapApp
+from journal import Journal
+from pairing import PairPlan
+from tokenizer import split_words
+
+QUESTION = "a b c a d"
+
+
+def random_steps(seed: int, n: int = 80):
+    rng = random.Random(seed)
+    steps = []
+    for k in range(n):
+        steps.append(rng.choices(
+            ['thought', 'skip', 'empty', 'undo', 'redo'], weights=[4, 1, 1, 3, 2])[0])
+        if steps[-1] == 'thought':
+            steps[-1] = f"생각 {k} 속도 효율"
+    return steps
+
+
+def normalize(i: int, j: int):
+    """끝난 부모의 끝 위치 (i, len) 는 다음 부모의 처음 (i + 1, 0) 과 같은 위치다"""
+    plan = PairPlan.from_spec(split_words(QUESTION))
+    while i < len(plan) and j >= len(plan.children(i)):
+        i, j = i + 1, 0
+    return (i, j) if i < len(plan) else (len(plan), 0)
+
+
+async def drive(path: str, steps, checkpoint_every: int):
+    """앱을 화면 없이 띄워 steps 를 적용하고 (구조, i, j) 반환 - 종료 때 저널이 닫힌다"""
+    app = MindMapApp(journal_path=path)
+    app.journal.checkpoint_every = checkpoint_every
+    async with app.run_test(size=(120, 40)) as pilot:
+        app.query_one("#question-input", Input).value = QUESTION
+        app.start_mapping()
+        for step in steps:
+            if step == 'undo':
+                app.undo_last()
+            elif step == 'redo':
+                app.redo_last()
+            elif app.current_phase != "collecting":
+                continue
+            elif step == 'skip':
+                app.skip_current()
+            else:
+                app.query_one("#notes-textarea", TextArea).text = "" if step == 'empty' else step
+                app.process_current()
+            await asyncio.sleep(0)
+        await pilot.pause()
+        live = (app.graph.to_structure(), *normalize(app.current_index, app.current_child_index))
+    return live
+
+
+@pytest.mark.parametrize('checkpoint_every', [1, 3, 5, 500])
+@pytest.mark.parametrize('seed', range(4))
+def test_undo_redo_across_checkpoints(tmp_path, seed, checkpoint_every):
+    path = str(tmp_path / "session.journal")
+    live = asyncio.run(drive(path, random_steps(seed), checkpoint_every))
+
+    session = Journal(path).restore()
+    restored = (session['graph'].to_structure(),
+                *normalize(session['current_index'], session['current_child_index']))
+    assert restored == live
+
+
+def test_restore_without_checkpoint(tmp_path):
+    journal = Journal(str(tmp_path / "j"), checkpoint_every=500)
+    journal.append("q", "a b", "all")
+    journal.append("p", "a")
+    journal.append("e", "a", "b", "생각", ["생각"], 0, 1)
+    journal.append("u", 0, 0)
+    journal.append("e", "a", "b", "", [], 0, 1)
+    journal.close()
+
+    session = Journal(str(tmp_path / "j")).restore()
+    assert session['question'] == "a b"
+    assert session['graph'].to_structure() == [['a', {'child': 'b', 'raw_thought': '',
+                                                      'keywords': []}]]
+    assert (session['current_index'], session['current_child_index']) == (0, 1)
+
+
+@pytest.fixture
+def fsynced(monkeypatch):
+    """os.fsync 를 부른 파일 디스크립터 목록"""
+    calls = []
+    real_fsync = os.fsync
+
+    def fsync(fd):
+        calls.append(fd)
+        real_fsync(fd)
+    monkeypatch.setattr(os, 'fsync', fsync)
+    return calls
+
+
+def test_tail_is_synced_on_checkpoint_and_close(tmp_path, fsynced):
+    journal = Journal(str(tmp_path / "j"), sync_every=100, sync_interval=3600)
+    journal.append("q", "a b", "all")
+    assert fsynced == []
+    journal.checkpoint({'question': "a b", 'structure': [], 'current_index': 0,
+                        'current_child_index': 0})
+    assert len(fsynced) == 2  # 저널 꼬리 + checkpoint 파일
+
+    journal.append("p", "a")
+    fd = journal._file.fileno()
+    journal.close()
+    assert fsynced[-1] == fd
+
+
+async def idle_after_input(path: str, fsynced):
+    app = MindMapApp(journal_path=path)
+    app.journal.sync_every, app.journal.sync_interval = 100, 0.05
+    async with app.run_test(size=(120, 40)) as pilot:
+        app.query_one("#question-input", Input).value = "a b"
+        app.start_mapping()
+        app.query_one("#notes-textarea", TextArea).text = "생각"
+        app.process_current()
+        fd = app.journal._file.fileno()
+        synced_before = fsynced.count(fd)
+        await pilot.pause(0.3)  # 더 입력하지 않는다
+        # 종료(close) 전에 타이머가 남은 기록을 fsync 했다
+        return synced_before, fsynced.count(fd)
+
+
+def test_idle_app_syncs_the_tail(tmp_path, fsynced):
+    before, idle = asyncio.run(idle_after_input(str(tmp_path / "s.journal"), fsynced))
+    assert idle > before
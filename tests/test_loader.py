@@ -0,0 +1,79 @@
+"""save_json → MindMapReader 왕복 - 청크 경계, 압축 파일, batches, 진행 위치"""
+import json
+
+import pytest
+
+import exporters
+from loader import MindMapReader, open_reader
+from mindgraph import MindGraph
+
+
+def make_graph(n_parents: int = 30):
+    graph = MindGraph()
+    for p in range(n_parents):
+        parent = f"부모{p}"
+        graph.add_parent(parent)
+        for c in range(p % 4):
+            thought = '' if c % 2 else f'{parent} → 자식{c}: "따옴표" \\ 역슬래시\n{"가" * p}'
+            graph.add_edge(parent, f"자식{c}", thought, [f"키{c}", parent])
+    return graph
+
+
+def edges(graph):
+    return [(e.parent, e.child, e.thought, tuple(e.keywords)) for e in graph.edges()]
+
+
+@pytest.mark.parametrize('suffix', ['.json', '.json.gz', '.json.xz', '.json.bz2'])
+@pytest.mark.parametrize('chunk_size', [1, 7, 64, 1 << 16])
+def test_round_trip(tmp_path, suffix, chunk_size):
+    graph = make_graph()
+    path = str(tmp_path / f"mindmap{suffix}")
+    exporters.save_json(graph, "부모 질문", path, progress=(12345, 6), pairs='undirected,topk=8')
+
+    reader = MindMapReader(path, chunk_size=chunk_size)
+    loaded = reader.load_graph()
+    assert edges(loaded) == edges(graph)
+    assert loaded.parents() == graph.parents()
+    assert reader.meta['question'] == "부모 질문"
+    assert reader.meta['pairs'] == 'undirected,topk=8'
+    assert reader.progress() == (12345, 6)
+    assert 'structure' not in reader.meta and 'connection_history' not in reader.meta
+
+
+def test_batches(tmp_path):
+    graph = make_graph(25)
+    path = str(tmp_path / "mindmap.json")
+    exporters.save_json(graph, "q", path)
+
+    reader = open_reader(path)
+    batches = list(reader.batches(size=10))
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert [item for batch in batches for item in batch] == graph.to_structure()
+    assert reader.progress() is None
+    reader.close()
+
+
+def test_empty_graph(tmp_path):
+    path = str(tmp_path / "mindmap.json")
+    exporters.save_json(MindGraph(), "", path, progress=(0, 0))
+    reader = MindMapReader(path, chunk_size=3)
+    assert list(reader.parents()) == []
+    assert reader.progress() == (0, 0)
+
+
+def test_gridmind_cli_structure(tmp_path):
+    # gridmind.py 는 structure 에 [child, keywords] 쌍을 쓴다
+    path = tmp_path / "mindmap.json"
+    path.write_text(json.dumps({
+        'question': "a b",
+        'structure': [["a", ["b", ["k1", "k2"]]], ["b", ["a", []]]],
+    }), encoding='utf-8')
+    loaded = MindMapReader(str(path), chunk_size=5).load_graph()
+    assert edges(loaded) == [('a', 'b', '', ('k1', 'k2')), ('b', 'a', '', ())]
+
+
+def test_not_a_mindmap(tmp_path):
+    path = tmp_path / "bad.json"
+    path.write_text("[1, 2]", encoding='utf-8')
+    with pytest.raises(ValueError):
+        list(MindMapReader(str(path)).parents())
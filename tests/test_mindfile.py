@@ -0,0 +1,87 @@
+""".gmb 저장 → 읽기 왕복 - 부모 임의 접근, 진행 위치, 압축 파일, JSON 과 같은 결과"""
+import pytest
+
+import exporters
+from loader import open_reader
+from mindfile import MindMapFile, save_binary
+from mindgraph import MindGraph
+from pairing import PairPlan
+
+
+def make_graph():
+    graph = MindGraph()
+    for parent, children in (('시스템', ['설계', '사용자', '시스템']),
+                             ('설계', ['시스템', '사용자']),
+                             ('사용자', []),
+                             ('빈칸', ['설계'])):
+        graph.add_parent(parent)
+        for n, child in enumerate(children):
+            thought = f'{parent}와 {child}, "{n}번째" 생각\n둘째 줄' if n % 2 == 0 else ''
+            graph.add_edge(parent, child, thought, thought.split()[:2])
+    return graph
+
+
+def edges(graph):
+    return [(e.id, e.parent, e.child, e.thought, tuple(e.keywords)) for e in graph.edges()]
+
+
+@pytest.mark.parametrize('suffix', ['.gmb', '.gmb.gz', '.gmb.xz', '.gmb.bz2'])
+def test_round_trip(tmp_path, suffix):
+    graph = make_graph()
+    path = str(tmp_path / f"map{suffix}")
+    save_binary(graph, "시스템 설계 사용자", path, progress=(2, 1), pairs='undirected,window=2')
+
+    with MindMapFile(path) as f:
+        assert f.meta['question'] == "시스템 설계 사용자"
+        assert f.meta['pairs'] == 'undirected,window=2'
+        plan = PairPlan.from_spec(f.meta['question'].split(), f.meta['pairs'])
+        assert (plan.directed, plan.window) == (False, 2)
+        assert f.progress() == (2, 1)
+        assert f.parent_words() == ['시스템', '설계', '사용자', '빈칸']
+        assert [e.child for e in f.edges_of('설계')] == ['시스템', '사용자']
+        assert f.edges_of('사용자') == []
+        assert f.edges_of('없는단어') == []
+        loaded = f.load_graph()
+
+    assert edges(loaded) == edges(graph)
+    assert loaded.to_structure() == graph.to_structure()
+    assert list(loaded.history()) == list(graph.history())
+
+
+def test_defaults_are_not_stored(tmp_path):
+    path = str(tmp_path / "map.gmb")
+    save_binary(make_graph(), "q", path, pairs='all')
+    with MindMapFile(path) as f:
+        assert 'pairs' not in f.meta
+        assert f.progress() is None
+
+
+def test_empty_graph(tmp_path):
+    path = str(tmp_path / "empty.gmb")
+    save_binary(MindGraph(), "", path)
+    with MindMapFile(path) as f:
+        assert f.parent_words() == []
+        assert len(f.load_graph()) == 0
+
+
+def test_same_as_json(tmp_path):
+    graph = make_graph()
+    binary, text = str(tmp_path / "map.gmb"), str(tmp_path / "map.json")
+    save_binary(graph, "q", binary, progress=(1, 0))
+    exporters.save_json(graph, "q", text, progress=(1, 0))
+
+    readers = [open_reader(binary), open_reader(text)]
+    try:
+        from_binary, from_json = (list(reader.parents()) for reader in readers)
+        assert from_binary == from_json
+        assert readers[0].progress() == readers[1].progress() == (1, 0)
+    finally:
+        for reader in readers:
+            reader.close()
+
+
+def test_not_a_binary_file(tmp_path):
+    path = tmp_path / "bad.gmb"
+    path.write_bytes(b'\0' * 200)
+    with pytest.raises(ValueError):
+        MindMapFile(str(path))
@@ -0,0 +1,128 @@
+"""짝 전략 - PairPlan 의 자식/슬라이스/total 을 단순 계산(brute force)과 비교"""
+import itertools
+import random
+
+import pytest
+
+from pairing import PairPlan, base_word, node_name, node_names, split_node, word_importance
+
+SPECS = ['all', 'undirected', 'unique', 'merge', 'distinct', 'topk=3', 'topk=1', 'window=1',
+         'window=2', 'undirected,unique', 'undirected,topk=3', 'unique,window=1',
+         'topk=3,window=2', 'undirected,unique,topk=2,window=3', 'unique,distinct']
+
+QUESTIONS = [
+    [],
+    ['a'],
+    ['a', 'a'],
+    ['x', 'aaaa', 'bbbb'],
+    ['시스템', '설계', '시스템', '사용자', '설계', '시스템'],
+    ['a', 'b', 'a', 'c', 'b', 'a', 'd'],
+]
+
+
+def random_questions(n: int = 30):
+    rng = random.Random(7)
+    vocabulary = ['a', 'bb', 'ccc', '가', '나다', '라마바']
+    return [[rng.choice(vocabulary) for _ in range(rng.randint(0, 9))] for _ in range(n)]
+
+
+def reference(words, spec):
+    """스펙을 문서 그대로 따라 한 위치씩 계산한 자식 목록"""
+    options = {name: value for name, _, value in (p.partition('=') for p in spec.split(','))}
+    unique = 'unique' in options or 'merge' in options
+    if 'distinct' in options:
+        unique = False
+    names = list(words) if unique else node_names(words)
+
+    eligible = range(len(words))
+    if unique:
+        eligible = [p for p in eligible if words.index(words[p]) == p]
+    if 'topk' in options:
+        first = {}
+        for p in eligible:
+            first.setdefault(words[p], p)
+        ranked = sorted(first, key=lambda w: (-word_importance(w, words.count(w)), first[w]))
+        eligible = sorted(first[w] for w in ranked[:int(options['topk'])])
+    window = int(options['window']) if 'window' in options else None
+
+    children = []
+    for i in range(len(words)):
+        children.append([
+            names[p] for p in eligible
+            if i in eligible and p != i
+            and (window is None or abs(p - i) <= window)
+            and ('undirected' not in options or p > i)
+        ])
+    return names, children
+
+
+@pytest.mark.parametrize('spec', SPECS)
+@pytest.mark.parametrize('words', QUESTIONS + random_questions(), ids=repr)
+def test_children_match_reference(words, spec):
+    plan = PairPlan.from_spec(words, spec)
+    names, expected = reference(words, spec)
+
+    assert len(plan) == len(words)
+    assert [plan.node(i) for i in range(len(words))] == names
+    for i, children in enumerate(expected):
+        view = plan.children(i)
+        assert list(view) == children
+        assert len(view) == len(children)
+        assert [view[k] for k in range(len(view))] == children
+        assert [view[-k - 1] for k in range(len(view))] == children[::-1]
+        assert [names[view.position(k)] for k in range(len(view))] == children
+        with pytest.raises(IndexError):
+            view[len(view)]
+
+    assert plan.total == sum(map(len, expected))
+    assert [plan.done_before(i) for i in range(len(words) + 1)] == \
+        list(itertools.accumulate(map(len, expected), initial=0))
+    assert list(plan.pairs()) == [(i, names[i], child)
+                                  for i, children in enumerate(expected) for child in children]
+
+
+@pytest.mark.parametrize('spec', ['all', 'undirected', 'unique,window=2', 'topk=3'])
+def test_slices_match_list_slices(spec):
+    words = ['a', 'b', 'a', 'c', 'b', 'a', 'd']
+    plan = PairPlan.from_spec(words, spec)
+    for i in range(len(words)):
+        view, children = plan.children(i), reference(words, spec)[1][i]
+        for start, stop in itertools.product(range(-1, len(children) + 2), repeat=2):
+            assert list(view[start:stop]) == children[start:stop]
+            # 이어서 하기: 잘라 낸 뷰를 다시 자른다
+            assert list(view[start:][:stop]) == children[start:][:stop]
+        assert view[::2] == children[::2]
+
+
+def test_all_asks_every_ordered_pair():
+    words = ['a', 'b', 'c', 'd']
+    assert PairPlan.from_spec(words).total == 4 * 3
+    assert PairPlan.from_spec(words, 'undirected').total == 4 * 3 // 2
+
+
+def test_repeated_words_are_separate_nodes_by_default():
+    plan = PairPlan.from_spec(['a', 'b', 'a'])
+    assert plan.nodes == ['a', 'b', 'a#2']
+    assert list(plan.children(0)) == ['b', 'a#2']
+
+
+def test_topk_ranks_distinct_words():
+    # 'a' 가 세 자리를 차지해도 상위 2 단어는 'a' 와 'bb'
+    plan = PairPlan.from_spec(['a', 'a', 'bb', 'a', 'c'], 'topk=2')
+    assert list(plan.children(0)) == ['bb']
+    assert list(plan.children(2)) == ['a']
+    assert len(plan.children(1)) == len(plan.children(4)) == 0
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError):
+        PairPlan.from_spec(['a', 'b'], 'window:2')
+
+
+def test_node_names_round_trip():
+    assert node_name('a', 2) == 'a#2'
+    assert split_node('a#2') == ('a', 2)
+    assert split_node('a') == ('a', 1)
+    assert split_node('#2') == ('#2', 1)
+    assert split_node('c#') == ('c#', 1)
+    assert base_word('시스템#3') == '시스템'
@@ -0,0 +1,101 @@
+"""증분 내보내기 - 조각을 합친 결과가 전체 내보내기와 같은지, Ctrl+S 는 조각만 쓰는지"""
+import asyncio
+import os
+
+from textual.widgets import Input, TextArea
+
+import exporters
+from gridmind_textual_v2 import MindMapApp
+from mindgraph import MindGraph
+from segments import SegmentExport
+
+
+def read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def assert_assembles_to_full_export(export, graph, tmp_path):
+    export.assemble('csv', str(tmp_path / "assembled.csv"))
+    export.assemble('dot', str(tmp_path / "assembled.dot"))
+    exporters.save_csv_with_thoughts(graph, str(tmp_path / "full.csv"))
+    exporters.save_dot_with_thoughts(graph, str(tmp_path / "full.dot"))
+    assert read(tmp_path / "assembled.csv") == read(tmp_path / "full.csv")
+    assert read(tmp_path / "assembled.dot") == read(tmp_path / "full.dot")
+
+
+def test_updates_after_edits_and_undo(tmp_path):
+    graph = MindGraph()
+    export = SegmentExport(str(tmp_path / "parts"))
+    for parent in ('시스템', '설계'):
+        graph.add_parent(parent)
+        for child in ('효율', '속도'):
+            graph.add_edge(parent, child, f'{parent} 와 {child}, "인용"\n줄바꿈', [child])
+    assert sorted(export.update(graph, graph.take_dirty(), "시스템 설계")) == ['설계', '시스템']
+    assert_assembles_to_full_export(export, graph, tmp_path)
+
+    # 새 부모 추가, 기존 부모 연결 되돌리기 - 바뀐 부모만 다시 쓴다
+    graph.add_edge('효율', '시스템', "새 생각", ['생각'])
+    graph.pop_edge()
+    graph.add_edge('효율', '속도', "다른 생각", ['생각'])
+    assert export.update(graph, graph.take_dirty()) == ['효율']
+    assert_assembles_to_full_export(export, graph, tmp_path)
+
+    # 부모까지 되돌리면 조각 파일도 지워진다
+    graph.pop_edge()
+    assert graph.pop_parent() == '효율'
+    graph.pop_edge()
+    assert export.update(graph, graph.take_dirty()) == ['설계']
+    assert len(os.listdir(tmp_path / "parts" / "csv")) == 2
+    assert_assembles_to_full_export(export, graph, tmp_path)
+
+    # 다시 열어도 manifest 로 이어서 갱신
+    reopened = SegmentExport(str(tmp_path / "parts"))
+    assert reopened.update(graph, set()) == []
+    assert_assembles_to_full_export(reopened, graph, tmp_path)
+
+
+async def drive(tmp_path):
+    parts = str(tmp_path / "parts")
+    app = MindMapApp(journal_path=str(tmp_path / "s.journal"), segments_dir=parts)
+    async with app.run_test(size=(120, 40)) as pilot:
+        app.query_one("#question-input", Input).value = "시스템 설계 효율"
+        app.start_mapping()
+        for k in range(4):
+            app.query_one("#notes-textarea", TextArea).text = f"생각 {k} 속도"
+            app.process_current()
+        app.undo_last()
+
+        async def save(export=False):
+            app.action_save_graph(export)
+            while app.save_running:
+                await pilot.pause(0.01)
+
+        await save()
+        saved = sorted(os.listdir(tmp_path))
+        app.redo_last()
+        app.skip_current()
+        await save()
+        graph = app.graph.snapshot()
+        await save(export=True)
+        exported = sorted(os.listdir(tmp_path))
+    return saved, exported, graph
+
+
+def test_app_saves_only_segments_until_export(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    saved, exported, graph = asyncio.run(drive(tmp_path))
+
+    # Ctrl+S 는 조각만 - 전체 파일(mindmap_*)은 쓰지 않는다
+    assert not [name for name in saved if name.startswith("mindmap_")]
+    assert "parts" in saved
+
+    # Ctrl+E 는 전체 파일 다섯 개
+    full = [name for name in exported if name.startswith("mindmap_")]
+    assert sorted(name.rsplit('.', 1)[1] for name in full) == ['csv', 'dot', 'gmb', 'json', 'svg']
+
+    (csv_name,) = [name for name in full if name.endswith('.csv')]
+    export = SegmentExport(str(tmp_path / "parts"))
+    export.assemble('csv', str(tmp_path / "assembled.csv"))
+    assert read(tmp_path / "assembled.csv") == read(tmp_path / csv_name)
+    assert_assembles_to_full_export(export, graph, tmp_path)
@@ -0,0 +1,126 @@
+"""SQLite 저장소 - 같은 세션 다시 저장, rollback, 반복 단어 노드, 연결 없는 부모"""
+import asyncio
+import os
+import sqlite3
+
+import pytest
+from textual.widgets import Input, TextArea
+
+import exporters
+from gridmind_textual_v2 import MindMapApp
+from mindgraph import MindGraph
+from store import MindStore
+
+
+def make_graph(thoughts):
+    graph = MindGraph()
+    for (parent, child), thought in thoughts.items():
+        graph.add_parent(parent)
+        graph.add_edge(parent, child, thought, thought.split())
+    return graph
+
+
+@pytest.fixture
+def store(tmp_path):
+    with MindStore(str(tmp_path / "maps.db")) as store:
+        yield store
+
+
+def test_same_session_is_saved_once(store):
+    first = store.save_map(make_graph({('a', 'b'): "처음 생각"}), "a b", session="s1")
+    again = store.save_map(make_graph({('a', 'b'): "고친 생각", ('b', 'a'): "둘째"}), "a b",
+                           session="s1")
+
+    assert again == first
+    assert store.db.execute("SELECT COUNT(*) FROM questions").fetchone() == (1,)
+    assert [row[3] for row in store.between('a', 'b')] == ["고친 생각", "둘째"]
+    assert store.with_keyword("처음") == []
+    assert [(e.parent, e.child) for e in store.load_map(first).edges()] == [('a', 'b'), ('b', 'a')]
+
+
+def test_maps_without_session_are_separate(store):
+    store.save_map(make_graph({('a', 'b'): "하나"}), "a b")
+    store.save_map(make_graph({('a', 'b'): "하나"}), "a b")
+    assert len(store.between('a', 'b')) == 2
+
+
+def test_rollback_forgets_node_ids(store):
+    broken = MindGraph()
+    broken.add_parent('새단어')
+    broken.add_edge('새단어', '다른단어', object())  # nodes 는 들어간 뒤 connections 에서 실패
+    with pytest.raises(sqlite3.Error):
+        store.save_map(broken, "새단어 다른단어")
+    assert store._node_ids == {}
+
+    # 캐시에 rollback 된 id 가 남아 있으면 여기서 외래 키 오류가 난다
+    store.save_map(make_graph({('새단어', '다른단어'): "다시"}), "새단어 다른단어")
+    assert [row[3] for row in store.between('새단어', '다른단어')] == ["다시"]
+
+
+def test_repeated_words_are_stored_by_word(store):
+    question_id = store.save_map(make_graph({('a#2', 'b'): "반복", ('b', 'a'): "처음"}), "a b a")
+    assert [(row[1], row[2]) for row in store.between('a', 'b', directed=True)] == [('a', 'b')]
+    assert len(store.between('a', 'b')) == 2
+    assert [(e.parent, e.child) for e in store.load_map(question_id).edges()] == [
+        ('a#2', 'b'), ('b', 'a')]
+
+
+def test_parents_without_edges_are_kept(store):
+    graph = make_graph({('b', 'a'): "생각"})
+    for parent in ('a', 'b', 'a#2', 'c'):
+        graph.add_parent(parent)
+    question_id = store.save_map(graph, "a b a c", session="s")
+    loaded = store.load_map(question_id)
+    assert loaded.parents() == ['b', 'a', 'a#2', 'c']
+    assert loaded.to_structure() == graph.to_structure()
+
+    # 다시 저장하면 부모 목록도 바뀐다
+    store.save_map(make_graph({('c', 'a'): "하나"}), "a b a c", session="s")
+    assert store.load_map(question_id).parents() == ['c']
+
+
+def test_import_keeps_session(store, tmp_path):
+    graph = make_graph({('a', 'b'): "생각"})
+    path = str(tmp_path / "mindmap.json")
+    exporters.save_json(graph, "a b", path, session="s1")
+    store.save_map(graph, "a b", session="s1")
+    store.import_file(path)
+    assert store.db.execute("SELECT COUNT(*) FROM questions").fetchone() == (1,)
+
+
+async def save_then_resume(tmp_path, db_path):
+    """앱에서 저장 → 저장한 JSON 을 불러와 이어서 저장"""
+    app = MindMapApp(journal_path=str(tmp_path / "a.journal"), db_path=db_path)
+    async with app.run_test(size=(120, 40)) as pilot:
+        app.query_one("#question-input", Input).value = "시스템 설계 효율"
+        app.start_mapping()
+        app.query_one("#notes-textarea", TextArea).text = "첫 생각"
+        app.process_current()
+        await save(app, pilot)
+        session = app.session_key
+
+    (saved,) = [name for name in os.listdir(tmp_path) if name.endswith('.json')]
+    app = MindMapApp(journal_path=str(tmp_path / "b.journal"), db_path=db_path,
+                     load_path=str(tmp_path / saved))
+    async with app.run_test(size=(120, 40)) as pilot:
+        while app.current_phase != "collecting":
+            await pilot.pause(0.01)
+        assert app.session_key == session
+        app.query_one("#notes-textarea", TextArea).text = "이어서 쓴 생각"
+        app.process_current()
+        await save(app, pilot)
+
+
+async def save(app, pilot):
+    app.action_save_graph()
+    while app.save_running:
+        await pilot.pause(0.01)
+
+
+def test_resumed_file_updates_the_same_map(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    db_path = str(tmp_path / "maps.db")
+    asyncio.run(save_then_resume(tmp_path, db_path))
+    with MindStore(db_path) as store:
+        assert store.db.execute("SELECT COUNT(*) FROM questions").fetchone() == (1,)
+        assert [row[3] for row in store.with_keyword("생각")] == ["첫 생각", "이어서 쓴 생각"]
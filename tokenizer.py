@@ -0,0 +1,125 @@
+"""
+토크나이저 - 질문/생각을 단어로 쪼개기
+
+미리 컴파일한 정규식으로 쪼개고, 같은 문장은 LRU 캐시에서 바로 돌려준다.
+키워드용 토크나이저는 켜면 한국어 조사("시스템이란" → "시스템")를 떼어 낸다 (기본 꺼짐).
+규칙 기반이라 "고양이", "처리하는" 같은 단어는 예외 목록과 어간 규칙으로 지킨다.
+
+    split_words(question)      # 질문 → 노드 단어 (원형 그대로)
+    extract_keywords(notes)    # 생각 → 키워드 (켜져 있으면 조사 제거)
+    tokenize_many(texts)       # 여러 문장을 한 번에 (배치/색인/내보내기 경로)
+    set_strip_particles(True)  # 조사 제거 켜기 (GRIDMIND_STRIP_PARTICLES=1, --strip-particles)
+"""
+import os
+import re
+from functools import lru_cache
+
+from instrument import timed
+
+_WORD_SPLIT = re.compile(r"\W+")
+
+ENV_VAR = 'GRIDMIND_STRIP_PARTICLES'
+MIN_STEM = 2  # 조사를 뗀 뒤 남아야 하는 글자 수
+
+# 길이가 긴 것부터 확인해야 "에서" 가 "서" 보다 먼저 잡힌다
+KOREAN_PARTICLES = tuple(sorted({
+    '이란', '란', '이라는', '라는', '이라고', '라고', '이라면', '라면',
+    '은', '는', '이', '가', '을', '를', '의', '에', '에서', '에게', '한테', '께',
+    '으로', '로', '으로서', '로서', '으로써', '로써', '와', '과', '하고', '이랑', '랑',
+    '도', '만', '까지', '부터', '보다', '처럼', '마다', '조차', '마저',
+    '이다', '입니다', '이에요', '예요', '인가', '인가요', '일까', '일까요',
+}, key=len, reverse=True))
+
+# 조사처럼 끝나지만 그 자체가 한 단어인 명사 (떼면 다른 말이 된다)
+PARTICLE_EXCEPTIONS = frozenset({
+    '고양이', '어린이', '아이', '오이', '놀이', '나이', '사이', '길이', '높이', '넓이', '깊이',
+    '먹이', '거리', '자리', '다리', '머리', '소리', '우리', '나라', '하나', '모두', '사과',
+    '결과', '효과', '과정', '정도', '온도', '속도', '제도', '태도', '의도', '지도', '한도',
+    '강도', '각도', '포도', '의미', '의견', '의사', '회의', '정의', '주의', '토론', '이론',
+})
+
+# 어간이 이 글자로 끝나면 용언 활용형이다 ("처리하는", "연결되는", "있는")
+_VERB_STEM_ENDINGS = frozenset('하되있없')
+
+
+def _is_hangul(ch: str) -> bool:
+    return '가' <= ch <= '힣'
+
+
+class Tokenizer:
+    """정규식 분할 + (선택) 조사/불용어 제거 + LRU 캐시"""
+
+    def __init__(self, strip_particles: bool = False, stopwords=(), cache_size: int = 4096,
+                 min_stem: int = MIN_STEM, exceptions=PARTICLE_EXCEPTIONS):
+        self.strip_particles = strip_particles
+        self.min_stem = min_stem
+        self.exceptions = frozenset(exceptions)
+        self.stopwords = frozenset(w.casefold() for w in stopwords)
+        self.tokenize = lru_cache(maxsize=cache_size)(self._tokenize)
+
+    def set_strip_particles(self, enabled: bool):
+        """조사 제거 켜기/끄기 (이전 결과가 남지 않게 캐시도 비운다)"""
+        self.strip_particles = enabled
+        self.tokenize.cache_clear()
+
+    def _tokenize(self, text: str) -> tuple:
+        tokens = []
+        for token in _WORD_SPLIT.split(text):
+            if not token:
+                continue
+            if self.strip_particles:
+                token = self._strip_particle(token)
+            if self.stopwords and token.casefold() in self.stopwords:
+                continue
+            tokens.append(token)
+        return tuple(tokens)
+
+    def _strip_particle(self, token: str) -> str:
+        """한글 단어 끝의 조사 하나 제거
+
+        예외 목록의 단어, 어간이 min_stem 글자보다 짧아지는 경우,
+        어간이 '하/되/있/없' 으로 끝나는 활용형은 그대로 둔다.
+        """
+        if not _is_hangul(token[-1]) or token in self.exceptions:
+            return token
+        for particle in KOREAN_PARTICLES:
+            if token.endswith(particle) and len(token) - len(particle) >= self.min_stem:
+                stem = token[:-len(particle)]
+                if stem[-1] in _VERB_STEM_ENDINGS:
+                    return token
+                return stem
+        return token
+
+    def tokenize_many(self, texts):
+        """여러 문장을 한 번에 - 반복되는 문장은 캐시에서"""
+        tokenize = self.tokenize
+        return [tokenize(text) for text in texts]
+
+
+# 질문 → 노드 단어 (사용자가 쓴 단어 그대로)
+word_tokenizer = Tokenizer()
+
+# 생각 → 키워드 (조사 제거는 켰을 때만)
+keyword_tokenizer = Tokenizer(strip_particles=os.environ.get(ENV_VAR, '') not in ('', '0'))
+
+
+def set_strip_particles(enabled: bool):
+    """키워드 조사 제거 켜기/끄기 - 색인을 만들기 전에 정한다"""
+    keyword_tokenizer.set_strip_particles(enabled)
+
+
+def split_words(text: str) -> list:
+    """문장을 단어로 쪼개기 (빈 토큰 제외)"""
+    return list(word_tokenizer.tokenize(text))
+
+
+@timed("tokenizer.extract_keywords")
+def extract_keywords(text: str) -> list:
+    """생각에서 키워드 추출 (켜져 있으면 조사 제거)"""
+    return list(keyword_tokenizer.tokenize(text))
+
+
+def tokenize_many(texts, keywords: bool = True) -> list:
+    """여러 문장의 토큰 튜플 목록"""
+    tokenizer = keyword_tokenizer if keywords else word_tokenizer
+    return tokenizer.tokenize_many(texts)